@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+SQLite store of monitoring runs and classified articles.
+
+Readers query indexed tables instead of re-reading every run file
+(data/pharma_news_*.json, .json.gz or .json.zst):
+
+- runs           one row per monitor run with its statistics
+- articles       one row per classified article (primary key: article id)
+- article_topics topic and confidence score per article
+
+Each run is written in a single transaction by the monitor. Existing JSON
+history can be imported once (runs already in the store are skipped):
+
+    python article_store.py import                # all run files in data/
+    python article_store.py import data/pharma_news_20250714_012155.json
+"""
+
+import json
+import sqlite3
+import sys
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from run_files import iter_articles, read_header, run_file_paths, run_file_timestamp
+
+DEFAULT_PATH = Path("data") / "articles.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_timestamp TEXT NOT NULL UNIQUE,
+    source_file TEXT,
+    total_articles_fetched INTEGER NOT NULL DEFAULT 0,
+    total_duplicates_skipped INTEGER NOT NULL DEFAULT 0,
+    total_near_duplicates INTEGER NOT NULL DEFAULT 0,
+    total_unique_articles INTEGER NOT NULL DEFAULT 0,
+    total_articles_classified INTEGER NOT NULL DEFAULT 0,
+    total_articles_discarded INTEGER NOT NULL DEFAULT 0,
+    classification_rate TEXT,
+    statistics TEXT
+);
+CREATE TABLE IF NOT EXISTS articles (
+    article_id TEXT PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+    title TEXT NOT NULL,
+    original_description TEXT,
+    summary TEXT,
+    link TEXT,
+    date_published TEXT,
+    published_at TEXT,
+    date_processed TEXT,
+    source_feed TEXT,
+    classified_by TEXT,
+    has_full_content INTEGER,
+    also_reported_by TEXT
+);
+CREATE TABLE IF NOT EXISTS article_topics (
+    article_id TEXT NOT NULL REFERENCES articles(article_id) ON DELETE CASCADE,
+    topic TEXT NOT NULL,
+    confidence REAL,
+    PRIMARY KEY (article_id, topic)
+);
+CREATE INDEX IF NOT EXISTS idx_article_topics_topic ON article_topics(topic);
+CREATE INDEX IF NOT EXISTS idx_articles_source_feed ON articles(source_feed);
+CREATE INDEX IF NOT EXISTS idx_articles_published_at ON articles(published_at);
+CREATE INDEX IF NOT EXISTS idx_articles_date_processed ON articles(date_processed);
+CREATE INDEX IF NOT EXISTS idx_articles_run_id ON articles(run_id);
+"""
+
+RUN_COUNTERS = (
+    "total_articles_fetched",
+    "total_duplicates_skipped",
+    "total_near_duplicates",
+    "total_unique_articles",
+    "total_articles_classified",
+    "total_articles_discarded",
+)
+
+ARTICLE_COLUMNS = (
+    "article_id, title, original_description, summary, link, date_published, "
+    "date_processed, source_feed, classified_by, has_full_content, also_reported_by"
+)
+
+
+def _published_at(date_published: str) -> Optional[str]:
+    """RSS publish date (RFC 822) as sortable UTC ISO 8601, when parseable."""
+    if not date_published:
+        return None
+    try:
+        published = parsedate_to_datetime(date_published)
+    except (TypeError, ValueError):
+        return None
+    if published.tzinfo is not None:
+        published = published.astimezone(timezone.utc)
+    return published.isoformat()
+
+
+class ArticleStore:
+    def __init__(self, path: Path = DEFAULT_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(str(path))
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def has_run(self, run_timestamp: str) -> bool:
+        row = self.conn.execute("SELECT 1 FROM runs WHERE run_timestamp = ?", (run_timestamp,)).fetchone()
+        return row is not None
+
+    def source_files(self) -> Set[str]:
+        """Run files the stored runs were saved or imported from."""
+        return {row[0] for row in self.conn.execute("SELECT source_file FROM runs WHERE source_file IS NOT NULL")}
+
+    def save_run(self, run_data: Dict, source_file: Optional[str] = None,
+                 articles: Optional[Iterable[Dict]] = None) -> int:
+        """Insert a run and its articles in one transaction; returns the run id.
+        
+        articles, when given, replaces run_data["articles"] so a run can be
+        streamed in without loading it into memory.
+        """
+        statistics = {
+            key: value for key, value in run_data.items()
+            if key not in RUN_COUNTERS and key not in ("run_timestamp", "classification_rate", "articles")
+        }
+        with self.conn:
+            cursor = self.conn.execute(
+                f"INSERT INTO runs (run_timestamp, source_file, {', '.join(RUN_COUNTERS)}, classification_rate, statistics) "
+                f"VALUES (?, ?, {', '.join('?' for _ in RUN_COUNTERS)}, ?, ?)",
+                (run_data["run_timestamp"], source_file, *(run_data.get(key, 0) or 0 for key in RUN_COUNTERS),
+                 run_data.get("classification_rate"), json.dumps(statistics, ensure_ascii=False)),
+            )
+            run_id = cursor.lastrowid
+            for article in run_data.get("articles", []) if articles is None else articles:
+                # An article id already stored by an earlier run keeps its original row
+                inserted = self.conn.execute(
+                    "INSERT OR IGNORE INTO articles (article_id, run_id, title, original_description, summary, link, "
+                    "date_published, published_at, date_processed, source_feed, classified_by, has_full_content, "
+                    "also_reported_by) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        article["id"], run_id, article.get("title", ""), article.get("original_description"),
+                        article.get("summary"), article.get("link"), article.get("date_published"),
+                        _published_at(article.get("date_published", "")), article.get("date_processed"),
+                        article.get("source_feed"), article.get("classified_by"),
+                        int(bool(article.get("has_full_content"))),
+                        json.dumps(article.get("also_reported_by", []), ensure_ascii=False),
+                    ),
+                ).rowcount
+                if inserted:
+                    confidence = article.get("confidence_scores", {})
+                    self.conn.executemany(
+                        "INSERT OR IGNORE INTO article_topics (article_id, topic, confidence) VALUES (?, ?, ?)",
+                        [(article["id"], topic, confidence.get(topic)) for topic in article.get("topics", [])],
+                    )
+        return run_id
+
+    def _articles(self, rows) -> List[Dict]:
+        """Turn article rows into the dicts found in run files, with topics attached."""
+        articles = [dict(row) for row in rows]
+        if not articles:
+            return articles
+        ids = [a["article_id"] for a in articles]
+        topics: Dict[str, List[Tuple[str, Optional[float]]]] = {}
+        # Chunked to stay under SQLite's bound-parameter limit
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            for row in self.conn.execute(
+                f"SELECT article_id, topic, confidence FROM article_topics WHERE article_id IN ({', '.join('?' for _ in chunk)})",
+                chunk,
+            ):
+                topics.setdefault(row["article_id"], []).append((row["topic"], row["confidence"]))
+        for article in articles:
+            article["id"] = article.pop("article_id")
+            article["has_full_content"] = bool(article["has_full_content"])
+            article["also_reported_by"] = json.loads(article["also_reported_by"] or "[]")
+            pairs = topics.get(article["id"], [])
+            article["topics"] = [topic for topic, _ in pairs]
+            article["confidence_scores"] = {topic: score for topic, score in pairs if score is not None}
+        return articles
+
+    def run_totals(self) -> Dict[str, int]:
+        row = self.conn.execute(
+            "SELECT COUNT(*) AS runs, COALESCE(SUM(total_articles_fetched), 0) AS fetched, "
+            "COALESCE(SUM(total_articles_classified), 0) AS classified FROM runs"
+        ).fetchone()
+        return dict(row)
+
+    def latest_run(self) -> Optional[Dict]:
+        row = self.conn.execute("SELECT * FROM runs ORDER BY run_timestamp DESC LIMIT 1").fetchone()
+        return dict(row) if row else None
+
+    def topic_counts(self) -> List[Tuple[str, int]]:
+        return [tuple(row) for row in self.conn.execute(
+            "SELECT topic, COUNT(*) AS n FROM article_topics GROUP BY topic ORDER BY n DESC, topic"
+        )]
+
+    def source_counts(self) -> List[Tuple[str, int]]:
+        return [tuple(row) for row in self.conn.execute(
+            "SELECT COALESCE(source_feed, 'Unknown'), COUNT(*) AS n FROM articles GROUP BY source_feed ORDER BY n DESC"
+        )]
+
+    def recent_articles(self, limit: int = 5) -> List[Dict]:
+        return self._articles(self.conn.execute(
+            f"SELECT {ARTICLE_COLUMNS} FROM articles ORDER BY date_processed DESC LIMIT ?", (limit,)
+        ))
+
+    def search_by_topic(self, keyword: str, limit: Optional[int] = None) -> Tuple[int, List[Dict]]:
+        """Articles with a topic containing keyword (case-insensitive), newest first, and the total count."""
+        where = ("FROM articles WHERE article_id IN "
+                 "(SELECT article_id FROM article_topics WHERE topic LIKE ? ESCAPE '\\')")
+        pattern = "%" + keyword.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        total = self.conn.execute(f"SELECT COUNT(*) {where}", (pattern,)).fetchone()[0]
+        rows = self.conn.execute(
+            f"SELECT {ARTICLE_COLUMNS} {where} ORDER BY published_at DESC, date_processed DESC LIMIT ?",
+            (pattern, -1 if limit is None else limit),
+        )
+        return total, self._articles(rows)
+
+
+def import_history(store: ArticleStore, files: List[Path]):
+    """Import run files into the store, skipping runs it already has.
+    
+    Articles are streamed from each file, so large backfills are not loaded whole.
+    """
+    imported = skipped = 0
+    # Files the store already came from need not be parsed again
+    known = store.source_files()
+    for path in files:
+        if str(path) in known:
+            skipped += 1
+            continue
+        run_data = read_header(path)
+        # Bare-list run files have no header: the file name holds the run time
+        run_data.setdefault("run_timestamp", run_file_timestamp(path) or path.name)
+        if store.has_run(run_data["run_timestamp"]):
+            skipped += 1
+            continue
+        store.save_run(run_data, str(path), articles=iter_articles(path))
+        imported += 1
+        print(f"  ✓ {path.name}")
+    print(f"Imported {imported} runs ({skipped} already in {store.path})")
+
+
+if __name__ == "__main__":
+    if not sys.argv[1:] or sys.argv[1] != "import":
+        print(__doc__)
+        sys.exit(0)
+    files = [Path(arg) for arg in sys.argv[2:]] or run_file_paths()
+    store = ArticleStore()
+    try:
+        import_history(store, files)
+    finally:
+        store.close()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Benchmark the lxml extractor against the original BeautifulSoup extractor.
+
+The corpus is real article pages saved under data/extraction_corpus/, built
+from the links in past run files (data/pharma_news_*):
+
+    python benchmark_extraction.py --fetch        # download missing pages, then benchmark
+    python benchmark_extraction.py                # benchmark the saved corpus
+    python benchmark_extraction.py --repeat 20    # more timing iterations per page
+"""
+
+import argparse
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from content_extraction import extract_main_text, extract_with_soup
+from run_files import iter_articles, run_file_paths
+
+CORPUS_DIR = Path("data") / "extraction_corpus"
+
+
+def history_links() -> List[str]:
+    """Unique article links from stored runs, oldest run first."""
+    links = []
+    for path in run_file_paths():
+        for article in iter_articles(path):
+            if article.get("link") and article["link"] not in links:
+                links.append(article["link"])
+    return links
+
+
+def fetch_corpus(links: List[str], headers: Dict[str, str], delay: float):
+    """Download pages that are not in the corpus yet."""
+    import requests
+
+    CORPUS_DIR.mkdir(parents=True, exist_ok=True)
+    manifest_path = CORPUS_DIR / "manifest.json"
+    manifest = json.loads(manifest_path.read_text()) if manifest_path.exists() else {}
+    session = requests.Session()
+    # Let requests advertise only the encodings it can decode
+    session.headers.update({k: v for k, v in headers.items() if k != "Accept-Encoding"})
+    for link in links:
+        name = hashlib.sha256(link.encode()).hexdigest()[:16] + ".html"
+        if name in manifest.values():
+            continue
+        try:
+            response = session.get(link, timeout=30)
+            response.raise_for_status()
+        except Exception as e:
+            print(f"  ✗ {link}: {e}")
+            continue
+        (CORPUS_DIR / name).write_text(response.text, encoding="utf-8")
+        manifest[link] = name
+        print(f"  ✓ {link}")
+        time.sleep(delay)
+    manifest_path.write_text(json.dumps(manifest, indent=2))
+
+
+def _tokens(text) -> set:
+    return set((text or "").lower().split())
+
+
+def benchmark(repeat: int):
+    pages = sorted(CORPUS_DIR.glob("*.html"))
+    if not pages:
+        print("No saved pages; run with --fetch first.")
+        return
+
+    totals = {"soup": 0.0, "lxml": 0.0}
+    identical = both_found = 0
+    overlaps = []
+    for path in pages:
+        page = path.read_text(encoding="utf-8")
+        results = {}
+        for name, extractor in (("soup", extract_with_soup), ("lxml", extract_main_text)):
+            start = time.perf_counter()
+            for _ in range(repeat):
+                results[name] = extractor(page)
+            totals[name] += (time.perf_counter() - start) / repeat
+        identical += results["soup"] == results["lxml"]
+        if results["soup"] and results["lxml"]:
+            both_found += 1
+            soup_tokens, lxml_tokens = _tokens(results["soup"]), _tokens(results["lxml"])
+            overlaps.append(len(soup_tokens & lxml_tokens) / len(soup_tokens | lxml_tokens))
+        elif results["soup"] or results["lxml"]:
+            print(f"  ! {path.name}: only {'soup' if results['soup'] else 'lxml'} found content")
+
+    print(f"Pages: {len(pages)} ({repeat} iterations each)")
+    for name, total in totals.items():
+        print(f"  {name}: {total / len(pages) * 1000:.2f} ms/page")
+    if totals["lxml"]:
+        print(f"  speedup: {totals['soup'] / totals['lxml']:.1f}x")
+    print(f"Identical output: {identical}/{len(pages)}")
+    if overlaps:
+        print(f"Mean token overlap where both found content: {sum(overlaps) / len(overlaps):.3f} over {both_found} pages")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark article content extraction")
+    parser.add_argument("--fetch", action="store_true", help="download missing corpus pages from run history links")
+    parser.add_argument("--repeat", type=int, default=5, help="timing iterations per page")
+    args = parser.parse_args()
+
+    if args.fetch:
+        with open("config.json", "r") as f:
+            scraping = json.load(f).get("scraping", {})
+        links = history_links()
+        print(f"Fetching corpus from {len(links)} history links...")
+        fetch_corpus(links, scraping.get("headers", {}), scraping.get("rate_limit_delay", 2))
+    benchmark(args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Local first-tier classifier trained on past LLM decisions.
+
+One logistic regression per topic over hashed word unigram/bigram features of
+the article title and description. At classification time it decides the
+confident cases locally and defers the uncertain middle band to the LLM:
+
+- every topic below negative_threshold  -> discarded locally
+- no topic in the uncertain band and at
+  least one above positive_threshold     -> classified locally
+- anything else                          -> sent to the LLM
+
+Training data comes from data/classification_log.jsonl (every LLM decision,
+including negatives, appended by the monitor) plus the positives stored in
+data/pharma_news_* run files that the LLM labelled (articles the cascade
+decided locally are left out).
+
+Usage:
+    python cascade_classifier.py train
+    python cascade_classifier.py evaluate
+"""
+
+import hashlib
+import json
+import math
+import random
+import sys
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from near_duplicates import normalize_text
+from run_files import iter_articles, run_file_paths
+
+MODEL_VERSION = 1
+FEATURE_BITS = 18
+
+
+def extract_features(title: str, description: str) -> Dict[int, float]:
+    """Hashed, L2-normalized unigram and bigram counts."""
+    words = normalize_text(f"{title} {description}")
+    features: Dict[int, float] = {}
+    for token in words + [f"{a} {b}" for a, b in zip(words, words[1:])]:
+        index = int.from_bytes(hashlib.blake2b(token.encode(), digest_size=4).digest(), "big") >> (32 - FEATURE_BITS)
+        features[index] = features.get(index, 0.0) + 1.0
+    norm = math.sqrt(sum(v * v for v in features.values())) or 1.0
+    return {i: v / norm for i, v in features.items()}
+
+
+def _sigmoid(z: float) -> float:
+    if z < -35:
+        return 0.0
+    return 1.0 / (1.0 + math.exp(-z))
+
+
+class TopicModel:
+    def __init__(self, bias: float = 0.0, weights: Optional[Dict[int, float]] = None):
+        self.bias = bias
+        self.weights = weights or {}
+
+    def predict(self, features: Dict[int, float]) -> float:
+        return _sigmoid(self.bias + sum(self.weights.get(i, 0.0) * v for i, v in features.items()))
+
+    def fit(self, examples: List[Tuple[Dict[int, float], bool]], epochs: int = 15,
+            learning_rate: float = 0.5, l2: float = 1e-4, seed: int = 0):
+        """Class-balanced SGD on the logistic loss."""
+        positives = sum(1 for _, label in examples if label)
+        if not examples or positives in (0, len(examples)):
+            self.bias = 10.0 if positives else -10.0
+            return
+        pos_weight = len(examples) / (2.0 * positives)
+        neg_weight = len(examples) / (2.0 * (len(examples) - positives))
+        rng = random.Random(seed)
+        order = list(range(len(examples)))
+        for epoch in range(epochs):
+            rng.shuffle(order)
+            rate = learning_rate / (1 + epoch)
+            for i in order:
+                features, label = examples[i]
+                error = (self.predict(features) - (1.0 if label else 0.0)) * (pos_weight if label else neg_weight)
+                self.bias -= rate * error
+                for index, value in features.items():
+                    weight = self.weights.get(index, 0.0)
+                    self.weights[index] = weight - rate * (error * value + l2 * weight)
+
+
+class CascadeClassifier:
+    def __init__(self, topics: List[str], negative_threshold: float = 0.02, positive_threshold: float = 0.98):
+        self.topics = topics
+        self.negative_threshold = negative_threshold
+        self.positive_threshold = positive_threshold
+        self.models: Dict[str, TopicModel] = {}
+        self.metadata: Dict = {}
+
+    def probabilities(self, article: Dict) -> Dict[str, float]:
+        features = extract_features(article.get("title", ""), article.get("description", ""))
+        return {topic: model.predict(features) for topic, model in self.models.items()}
+
+    def decide(self, article: Dict) -> Optional[Tuple[List[str], Dict[str, float]]]:
+        """Return (topics, confidence) when confident, or None to defer to the LLM."""
+        probabilities = self.probabilities(article)
+        if any(self.negative_threshold <= p < self.positive_threshold for p in probabilities.values()):
+            return None
+        topics = [topic for topic, p in probabilities.items() if p >= self.positive_threshold]
+        return topics, {topic: round(probabilities[topic], 3) for topic in topics}
+
+    def train(self, examples: List[Dict], epochs: int = 15):
+        """Fit one model per topic from labelled examples (title, description, topics)."""
+        featurized = [(extract_features(e["title"], e["description"]), set(e["topics"])) for e in examples]
+        self.models = {}
+        for topic in self.topics:
+            model = TopicModel()
+            model.fit([(features, topic in labels) for features, labels in featurized], epochs=epochs)
+            self.models[topic] = model
+        self.metadata = {
+            "trained_at": datetime.now().isoformat(),
+            "examples": len(examples),
+            "positives": {topic: sum(topic in e["topics"] for e in examples) for topic in self.topics},
+        }
+
+    def save(self, path: Path):
+        data = {
+            "version": MODEL_VERSION,
+            "feature_bits": FEATURE_BITS,
+            "metadata": self.metadata,
+            "models": {
+                topic: {"bias": model.bias, "weights": {str(i): round(w, 6) for i, w in model.weights.items() if abs(w) > 1e-6}}
+                for topic, model in self.models.items()
+            },
+        }
+        with open(path, "w") as f:
+            json.dump(data, f)
+
+    @classmethod
+    def load(cls, path: Path, topics: List[str], negative_threshold: float = 0.02,
+             positive_threshold: float = 0.98) -> "CascadeClassifier":
+        with open(path, "r") as f:
+            data = json.load(f)
+        if data.get("version") != MODEL_VERSION or data.get("feature_bits") != FEATURE_BITS:
+            raise ValueError(f"{path} was trained with an incompatible model version")
+        missing = set(topics) - set(data["models"])
+        if missing:
+            raise ValueError(f"{path} has no model for topics: {', '.join(sorted(missing))}; retrain it")
+        classifier = cls(topics, negative_threshold, positive_threshold)
+        classifier.metadata = data.get("metadata", {})
+        for topic in topics:
+            model_data = data["models"][topic]
+            classifier.models[topic] = TopicModel(
+                model_data["bias"], {int(i): w for i, w in model_data["weights"].items()}
+            )
+        return classifier
+
+
+class ClassificationLog:
+    def __init__(self, path: Path):
+        """Append-only JSONL record of LLM classification decisions."""
+        self.path = path
+        self._lock = threading.Lock()
+
+    def append(self, article: Dict, topics: List[str], confidence: Dict[str, float]):
+        entry = {
+            "title": article.get("title", ""),
+            "description": article.get("description", ""),
+            "topics": topics,
+            "confidence": confidence,
+            "logged_at": datetime.now().isoformat(),
+        }
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+
+def load_training_examples(data_dir: Path, topics: List[str]) -> List[Dict]:
+    """Merge logged LLM decisions with LLM-labelled positives from run files, newest label wins."""
+    examples: Dict[str, Dict] = {}
+
+    def add(title: str, description: str, labels: List[str]):
+        key = hashlib.md5(f"{title}\n{description}".encode()).hexdigest()
+        examples[key] = {"title": title, "description": description, "topics": [t for t in labels if t in topics]}
+
+    for path in run_file_paths(data_dir):
+        for article in iter_articles(path):
+            # The cascade's own decisions would feed its mistakes back into training
+            if article.get("classified_by") == "local":
+                continue
+            add(article.get("title", ""), article.get("original_description", ""), article.get("topics", []))
+
+    log_path = data_dir / "classification_log.jsonl"
+    if log_path.exists():
+        with open(log_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # torn last line from an interrupted run
+                add(entry.get("title", ""), entry.get("description", ""), entry.get("topics", []))
+
+    return list(examples.values())
+
+
+def _holdout_split(examples: List[Dict], holdout: float = 0.2) -> Tuple[List[Dict], List[Dict]]:
+    """Deterministic split by title hash so evaluation is reproducible."""
+    train, test = [], []
+    for example in examples:
+        bucket = int(hashlib.md5(example["title"].encode()).hexdigest()[:8], 16) / 0xFFFFFFFF
+        (test if bucket < holdout else train).append(example)
+    return train, test
+
+
+def evaluate(classifier: CascadeClassifier, examples: List[Dict]) -> Dict:
+    """Compare cascade decisions with LLM labels on held-out examples."""
+    local_negative = local_positive = deferred = 0
+    negative_errors = positive_errors = 0
+    for example in examples:
+        decision = classifier.decide(example)
+        if decision is None:
+            deferred += 1
+            continue
+        topics, _ = decision
+        if topics:
+            local_positive += 1
+            positive_errors += set(topics) != set(example["topics"])
+        else:
+            local_negative += 1
+            negative_errors += bool(example["topics"])
+    total = len(examples) or 1
+    return {
+        "examples": len(examples),
+        "decided_locally": round((local_negative + local_positive) / total, 3),
+        "local_negatives": local_negative,
+        "local_negative_errors": negative_errors,
+        "local_positives": local_positive,
+        "local_positive_errors": positive_errors,
+        "deferred_to_llm": deferred,
+    }
+
+
+def _load_settings() -> Tuple[Dict, List[str]]:
+    with open("config.json", "r") as f:
+        config = json.load(f)
+    return config.get("cascade", {}), config["topics"]
+
+
+def main(argv: List[str]):
+    if not argv or argv[0] not in ("train", "evaluate"):
+        print(__doc__)
+        return
+    settings, topics = _load_settings()
+    data_dir = Path("data")
+    model_path = Path(settings.get("model_path", "data/cascade_model.json"))
+    negative_threshold = settings.get("negative_threshold", 0.02)
+    positive_threshold = settings.get("positive_threshold", 0.98)
+
+    examples = load_training_examples(data_dir, topics)
+    negatives = sum(1 for e in examples if not e["topics"])
+    print(f"Loaded {len(examples)} labelled articles ({negatives} with no topic)")
+    if negatives < settings.get("min_negative_examples", 50):
+        print("Not enough negative examples yet: run the monitor so classification_log.jsonl "
+              "records LLM decisions for discarded articles, then retry.")
+        return
+
+    train, test = _holdout_split(examples)
+    classifier = CascadeClassifier(topics, negative_threshold, positive_threshold)
+    classifier.train(train)
+    metrics = evaluate(classifier, test)
+    print(f"Held-out evaluation at thresholds {negative_threshold}/{positive_threshold}:")
+    for key, value in metrics.items():
+        print(f"  {key}: {value}")
+
+    if argv[0] == "train":
+        # Final model uses all data; the held-out metrics above describe its expected behaviour
+        classifier.train(examples)
+        classifier.metadata["holdout_metrics"] = metrics
+        classifier.save(model_path)
+        print(f"Saved model to {model_path}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Per-domain circuit breaker and negative URL cache for scraping.
+
+A domain that keeps failing every transport (blocking us, timing out) is
+"opened": its articles skip scraping and fall back to the RSS description
+until the cooldown expires. The breaker then lets a single probe through
+(half-open); success closes it, failure re-opens it for another cooldown.
+
+URLs that failed permanently (404, 410) are remembered across runs so they
+are not requested again until the entry expires.
+
+Skipped work is converted to time saved using the average duration of the
+failures it avoids.
+"""
+
+import json
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from json_state import moving_average, save_json_atomic
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class DomainCircuitBreaker:
+    def __init__(self, path: Path, failure_threshold: int = 3, cooldown_seconds: float = 3600):
+        self.path = path
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self._lock = threading.Lock()
+        self.domains: Dict[str, Dict] = {}
+        self.skipped = 0
+        self.seconds_saved = 0.0
+
+    def load(self):
+        """Read persisted breaker state, if any."""
+        if self.path.exists():
+            with open(self.path, "r") as f:
+                self.domains = json.load(f).get("domains", {})
+            # A probe cut short by the end of the last run has no result; wait for a fresh one
+            for entry in self.domains.values():
+                if entry["state"] == HALF_OPEN:
+                    entry["state"] = OPEN
+
+    def _entry(self, domain: str) -> Dict:
+        return self.domains.setdefault(domain, {
+            "state": CLOSED,
+            "consecutive_failures": 0,
+            "opened_at": None,
+            "failure_latency": None,
+        })
+
+    def allow(self, domain: str) -> bool:
+        """Whether a scrape of this domain may go ahead; counts the ones that may not."""
+        now = time.time()
+        with self._lock:
+            entry = self._entry(domain)
+            if entry["state"] == OPEN and now - entry["opened_at"] >= self.cooldown_seconds:
+                # Cooldown over: let exactly one probe through
+                entry["state"] = HALF_OPEN
+                return True
+            if entry["state"] == CLOSED:
+                return True
+            self.skipped += 1
+            self.seconds_saved += entry["failure_latency"] or 0.0
+            return False
+
+    def record(self, domain: str, success: bool, latency: float):
+        """Record whether a scrape got a response from the domain, and how long it took."""
+        with self._lock:
+            entry = self._entry(domain)
+            if success:
+                entry.update(state=CLOSED, consecutive_failures=0, opened_at=None)
+                return
+            entry["failure_latency"] = moving_average(entry["failure_latency"], latency)
+            entry["consecutive_failures"] += 1
+            if entry["state"] == HALF_OPEN or entry["consecutive_failures"] >= self.failure_threshold:
+                entry.update(state=OPEN, opened_at=time.time())
+
+    def open_domains(self) -> List[str]:
+        with self._lock:
+            return sorted(d for d, e in self.domains.items() if e["state"] != CLOSED)
+
+    def save(self):
+        with self._lock:
+            data = {"last_updated": datetime.now().isoformat(), "domains": self.domains}
+            save_json_atomic(self.path, data)
+
+
+class FailedUrlCache:
+    def __init__(self, path: Path, ttl_seconds: Optional[float] = 30 * 86400):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self.urls: Dict[str, Dict] = {}
+        self.skipped = 0
+        self.seconds_saved = 0.0
+
+    def load(self):
+        """Read persisted failures, dropping expired ones."""
+        if self.path.exists():
+            with open(self.path, "r") as f:
+                urls = json.load(f).get("urls", {})
+            now = time.time()
+            self.urls = {
+                url: entry for url, entry in urls.items()
+                if self.ttl_seconds is None or now - entry["failed_at"] < self.ttl_seconds
+            }
+
+    def check(self, url: str) -> Optional[Dict]:
+        """The recorded permanent failure for a URL, counting the skip, or None."""
+        with self._lock:
+            entry = self.urls.get(url)
+            if entry is not None:
+                self.skipped += 1
+                self.seconds_saved += entry.get("latency", 0.0)
+            return entry
+
+    def add(self, url: str, reason: str, latency: float):
+        with self._lock:
+            self.urls[url] = {"reason": reason, "failed_at": time.time(), "latency": round(latency, 3)}
+
+    def save(self):
+        with self._lock:
+            data = {"last_updated": datetime.now().isoformat(), "urls": self.urls}
+            save_json_atomic(self.path, data)
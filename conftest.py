@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""Shared fixtures for tests that run the monitor itself."""
+
+import types
+
+import pytest
+
+
+@pytest.fixture
+def monitor(tmp_path, monkeypatch):
+    """A monitor working in a temporary directory, with the local classifier stages and LLM cache off."""
+    pytest.importorskip("feedparser")
+    pytest.importorskip("openai")
+    from pharma_news_monitor import PharmaNewsMonitor
+
+    monkeypatch.chdir(tmp_path)
+    monitor = PharmaNewsMonitor("test-key")
+    monitor.prefilter = monitor.prefilter_stats = monitor.cascade = None
+    monitor.llm_cache = None
+    yield monitor
+    monitor.seen_articles.close()
+    monitor._scrape_pool.shutdown(wait=False)
+    monitor.http.close()
+
+
+@pytest.fixture
+def fake_llm(monitor):
+    """Install an LLM client answering each prompt with respond(prompt); returns the prompts it saw."""
+    def install(respond):
+        prompts = []
+
+        def create(**kwargs):
+            prompt = kwargs["messages"][1]["content"]
+            prompts.append(prompt)
+            message = types.SimpleNamespace(content=respond(prompt))
+            return types.SimpleNamespace(choices=[types.SimpleNamespace(message=message)])
+
+        monitor.client = types.SimpleNamespace(chat=types.SimpleNamespace(completions=types.SimpleNamespace(create=create)))
+        return prompts
+    return install
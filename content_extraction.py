@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+lxml-based article text extraction.
+
+Same selectors and thresholds as the original BeautifulSoup extractor, but:
+
+- the page is parsed once by lxml's C parser, with comments and processing
+  instructions dropped during parsing and script/style/noscript removed in C
+- all selectors are checked in a single walk over the tree, recording the
+  first match of each, instead of one select_one() traversal per selector
+- text is only collected for the winning candidate(s), in priority order
+
+extract_with_soup() keeps the original BeautifulSoup path as the reference
+implementation for benchmark_extraction.py.
+
+All entry points are plain module-level functions taking and returning
+strings, so the monitor can run them in a process pool.
+"""
+
+from typing import Callable, Dict, List, Optional
+
+from lxml import etree, html
+
+MIN_CONTENT_LENGTH = 100
+MIN_BODY_LENGTH = 500
+MAX_CONTENT_LENGTH = 10000
+
+# Selectors in priority order; keep in step with the predicates below
+CONTENT_SELECTORS = [
+    'article',
+    '[class*="article-content"]',
+    '[class*="article-body"]',
+    '[class*="post-content"]',
+    '[class*="entry-content"]',
+    '[class*="story-body"]',
+    '[class*="content-body"]',
+    '.content',
+    'main',
+    '[role="main"]',
+]
+
+_PARSER = html.HTMLParser(remove_comments=True, remove_pis=True, encoding="utf-8")
+
+
+def _class_contains(fragment: str) -> Callable:
+    return lambda el: fragment in (el.get("class") or "")
+
+
+_SELECTOR_PREDICATES: List[Callable] = [
+    lambda el: el.tag == "article",
+    _class_contains("article-content"),
+    _class_contains("article-body"),
+    _class_contains("post-content"),
+    _class_contains("entry-content"),
+    _class_contains("story-body"),
+    _class_contains("content-body"),
+    lambda el: "content" in (el.get("class") or "").split(),
+    lambda el: el.tag == "main",
+    lambda el: el.get("role") == "main",
+]
+
+
+def parse_html(page: str):
+    """Parse a page into an lxml tree with script/style/noscript stripped, or None."""
+    if not page or not page.strip():
+        return None
+    try:
+        # Encode first: lxml rejects str input that carries an XML encoding declaration
+        root = html.document_fromstring(page.encode("utf-8", errors="replace"), parser=_PARSER)
+    except (etree.ParserError, ValueError):
+        return None
+    etree.strip_elements(root, "script", "style", "noscript", with_tail=False)
+    return root
+
+
+def element_text(element) -> str:
+    """Whitespace-normalized text of an element and its descendants."""
+    return " ".join(" ".join(element.itertext()).split())
+
+
+def _truncate(text: str) -> str:
+    return text[:MAX_CONTENT_LENGTH] + "..." if len(text) > MAX_CONTENT_LENGTH else text
+
+
+def extract_main_text(page: str) -> Optional[str]:
+    """Extract the article body text from an HTML page."""
+    root = parse_html(page)
+    if root is None:
+        return None
+
+    first_match: Dict[int, object] = {}
+    for element in root.iter(etree.Element):
+        for index, predicate in enumerate(_SELECTOR_PREDICATES):
+            if index not in first_match and predicate(element):
+                first_match[index] = element
+        if len(first_match) == len(_SELECTOR_PREDICATES):
+            break
+
+    for index in sorted(first_match):
+        text = element_text(first_match[index])
+        if len(text) > MIN_CONTENT_LENGTH:
+            return _truncate(text)
+
+    # Fallback to body if no specific content found
+    body = root.find("body")
+    if body is not None:
+        text = element_text(body)
+        if len(text) > MIN_BODY_LENGTH:  # Only use body if substantial content
+            return _truncate(text)
+    return None
+
+
+def html_to_text(fragment: str) -> str:
+    """Plain, whitespace-normalized text of an HTML fragment such as RSS content."""
+    root = parse_html(fragment)
+    return element_text(root) if root is not None else ""
+
+
+def extract_page(url: str, page: str) -> Optional[str]:
+    """Run newspaper3k and the selector extractor on the same HTML, keep the best."""
+    article_text = None
+    try:
+        from newspaper import Article
+
+        article = Article(url)
+        article.download(input_html=page)
+        article.parse()
+        article_text = article.text
+    except Exception:
+        pass
+
+    try:
+        selector_text = extract_main_text(page)
+    except Exception:
+        selector_text = None
+
+    if article_text and len(article_text) > MIN_CONTENT_LENGTH:
+        content = article_text
+        # newspaper3k's text is cleaner, unless it clearly dropped part of the article
+        if selector_text and len(selector_text) > 2 * len(article_text):
+            content = selector_text
+    elif selector_text and len(selector_text) > MIN_CONTENT_LENGTH:
+        content = selector_text
+    else:
+        return None
+    return _truncate(content)
+
+
+def extract_with_soup(page: str) -> Optional[str]:
+    """Original BeautifulSoup extractor, kept as the benchmark reference."""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(page, "html.parser")
+    for script in soup(["script", "style", "noscript"]):
+        script.decompose()
+
+    for selector in CONTENT_SELECTORS:
+        content = soup.select_one(selector)
+        if content:
+            text = " ".join(content.get_text(separator=" ", strip=True).split())
+            if len(text) > MIN_CONTENT_LENGTH:
+                return _truncate(text)
+
+    if soup.body:
+        text = " ".join(soup.body.get_text(separator=" ", strip=True).split())
+        if len(text) > MIN_BODY_LENGTH:
+            return _truncate(text)
+    return None
@@ -8,18 +8,26 @@ if [ ! -d "node_modules" ]; then
     npm install
 fi
 
-# Copy data files
+# Copy run files only: data/ also holds the monitor's internal state (feed cache, indexes, models)
 echo "Copying data files..."
 mkdir -p static/data
-cp ../data/*.json static/data/ 2>/dev/null || echo "No data files found"
+rm -f static/data/*.json
+cp ../data/pharma_news_*.json static/data/ 2>/dev/null || echo "No data files found"
+# Compressed run files are served as plain JSON
+for file in ../data/pharma_news_*.json.gz; do
+    if [ -f "$file" ]; then gunzip -c "$file" > "static/data/$(basename "$file" .gz)"; fi
+done
+for file in ../data/pharma_news_*.json.zst; do
+    if [ -f "$file" ]; then zstd -q -d -c "$file" > "static/data/$(basename "$file" .zst)"; fi
+done
 
 # Create manifest
 echo "Creating data manifest..."
 cd static/data
 echo '{"files":[' > manifest.json
 first=true
-for file in *.json; do
-    if [ "$file" != "manifest.json" ] && [ -f "$file" ]; then
+for file in pharma_news_*.json; do
+    if [ -f "$file" ]; then
         if [ "$first" = true ]; then
             first=false
         else
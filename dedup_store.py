@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Compact on-disk store of seen article IDs for deduplication.
+
+Layout (both files hold fixed-size little-endian records of a 64-bit ID hash
+and the unix time it was first seen):
+
+- article_index.bin: header + records sorted by hash, memory-mapped and
+  binary-searched, so opening the store does not read it into memory.
+- article_index.log: append-only records added since the last compaction.
+
+Compaction merges the log into the sorted file (dropping expired entries),
+writes it to a temporary file and atomically renames it into place, so a
+crash at any point leaves a readable index behind.
+"""
+
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+MAGIC = b"SEIDX001"
+HEADER = struct.Struct("<8sQ")
+RECORD = struct.Struct("<QI")
+
+
+def id_to_hash(article_id: str) -> int:
+    """Reduce a hex article ID (MD5) to the 64-bit key stored on disk."""
+    return int(article_id[:16], 16)
+
+
+class DedupStore:
+    def __init__(self, base_path: Path, max_age_days: Optional[float] = None, compact_threshold: int = 1000):
+        """Open the store at base_path (without suffix), e.g. data/article_index."""
+        self.sorted_path = base_path.with_suffix(".bin")
+        self.log_path = base_path.with_suffix(".log")
+        self.max_age = max_age_days * 86400 if max_age_days else None
+        self.compact_threshold = compact_threshold
+        self._lock = threading.Lock()
+        self._mmap: Optional[mmap.mmap] = None
+        self._count = 0
+        self._log_entries: Dict[int, int] = {}
+        self._log_file = None
+        self._open()
+
+    def _open(self):
+        """Map the sorted file and load the (small) append log."""
+        self._map_sorted()
+        if self.log_path.exists():
+            with open(self.log_path, "rb") as f:
+                data = f.read()
+            # A torn final record from a crash mid-append is simply ignored
+            usable = len(data) - len(data) % RECORD.size
+            for key, seen_at in RECORD.iter_unpack(data[:usable]):
+                # A key repeated in the log was re-added after expiring; the latest time counts
+                self._log_entries[key] = max(seen_at, self._log_entries.get(key, 0))
+
+    def _map_sorted(self):
+        """Memory-map the sorted file if it has any records."""
+        if self.sorted_path.exists() and self.sorted_path.stat().st_size > HEADER.size:
+            with open(self.sorted_path, "rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, self._count = HEADER.unpack_from(self._mmap, 0)
+            if magic != MAGIC:
+                raise ValueError(f"{self.sorted_path} is not a dedup index")
+
+    def _is_fresh(self, seen_at: int) -> bool:
+        return self.max_age is None or time.time() - seen_at <= self.max_age
+
+    def _sorted_lookup(self, key: int) -> Optional[int]:
+        """Binary search the mapped sorted records, returning first-seen time."""
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            mid_key, seen_at = RECORD.unpack_from(self._mmap, HEADER.size + mid * RECORD.size)
+            if mid_key < key:
+                lo = mid + 1
+            elif mid_key > key:
+                hi = mid
+            else:
+                return seen_at
+        return None
+
+    def _lookup(self, key: int) -> Optional[int]:
+        seen_at = self._log_entries.get(key)
+        if seen_at is None and self._mmap is not None:
+            seen_at = self._sorted_lookup(key)
+        return seen_at
+
+    def __contains__(self, article_id: str) -> bool:
+        with self._lock:
+            seen_at = self._lookup(id_to_hash(article_id))
+        return seen_at is not None and self._is_fresh(seen_at)
+
+    def stats(self) -> Dict[str, int]:
+        """Record counts for the sorted file and the pending log."""
+        return {"sorted_records": self._count, "log_records": len(self._log_entries)}
+
+    def __len__(self) -> int:
+        """Number of stored records (may include expired or re-seen ones until compaction)."""
+        return self._count + len(self._log_entries)
+
+    def add(self, article_id: str, seen_at: Optional[float] = None):
+        """Record an article ID as seen, appending it to the log."""
+        key = id_to_hash(article_id)
+        with self._lock:
+            existing = self._lookup(key)
+            if existing is not None and self._is_fresh(existing):
+                return
+            seen_at = int(seen_at if seen_at is not None else time.time())
+            self._log_entries[key] = seen_at
+            if self._log_file is None:
+                self._log_file = open(self.log_path, "ab")
+            self._log_file.write(RECORD.pack(key, seen_at))
+
+    def flush(self):
+        """Make appended IDs durable, compacting once the log grows large."""
+        with self._lock:
+            if self._log_file is not None:
+                self._log_file.flush()
+                os.fsync(self._log_file.fileno())
+            if len(self._log_entries) >= self.compact_threshold:
+                self._compact()
+
+    def compact(self):
+        """Merge the log into the sorted file and drop expired entries."""
+        with self._lock:
+            if self._log_file is not None:
+                self._log_file.flush()
+            self._compact()
+
+    def _iter_sorted(self) -> Iterator[Tuple[int, int]]:
+        for i in range(self._count):
+            yield RECORD.unpack_from(self._mmap, HEADER.size + i * RECORD.size)
+
+    def _compact(self):
+        merged = dict(self._iter_sorted()) if self._mmap is not None else {}
+        for key, seen_at in self._log_entries.items():
+            # The log holds re-adds of expired IDs, so the newer time wins
+            merged[key] = max(seen_at, merged.get(key, 0))
+        records = sorted((key, seen_at) for key, seen_at in merged.items() if self._is_fresh(seen_at))
+
+        tmp_path = self.sorted_path.with_suffix(".bin.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, len(records)))
+            for record in records:
+                f.write(RECORD.pack(*record))
+            f.flush()
+            os.fsync(f.fileno())
+
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        os.replace(tmp_path, self.sorted_path)
+        # Truncating after the rename is safe: if we crash in between, the log
+        # just repeats entries the sorted file already has
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
+        open(self.log_path, "wb").close()
+        self._log_entries = {}
+        self._count = 0
+        self._map_sorted()
+
+    def migrate_json(self, json_path: Path) -> int:
+        """Import IDs from the legacy article_index.json and retire that file."""
+        with open(json_path, "r") as f:
+            index_data = json.load(f)
+        last_updated = index_data.get("last_updated")
+        seen_at = datetime.fromisoformat(last_updated).timestamp() if last_updated else time.time()
+        article_ids = index_data.get("article_ids", [])
+        for article_id in article_ids:
+            self.add(article_id, seen_at)
+        self.compact()
+        os.replace(json_path, json_path.with_suffix(".json.migrated"))
+        return len(article_ids)
+
+    def close(self):
+        with self._lock:
+            if self._log_file is not None:
+                self._log_file.close()
+                self._log_file = None
+            if self._mmap is not None:
+                self._mmap.close()
+                self._mmap = None
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Content-addressed on-disk cache with TTL and size-based eviction.
+
+Entries live in <directory>/<key[:2]>/<key>.json (or .json.gz when compressed)
+so no single directory grows too large. Writes go through a temporary file
+and an atomic rename, so a crash never leaves a half-written entry. A hit
+refreshes the file's mtime, which is what size-based eviction uses to drop
+the least recently used entries first.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+def make_key(*parts: Any) -> str:
+    """Stable SHA-256 key over JSON-serializable parts."""
+    payload = json.dumps(parts, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class DiskCache:
+    def __init__(self, directory: Path, ttl_seconds: Optional[float] = None, max_size_bytes: Optional[int] = None,
+                 compress: bool = False):
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+        self.max_size_bytes = max_size_bytes
+        self.compress = compress
+        self.suffix = ".json.gz" if compress else ".json"
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}{self.suffix}"
+
+    def _open(self, path: Path, mode: str):
+        if self.compress:
+            return gzip.open(path, mode + "t", encoding="utf-8", compresslevel=6)
+        return open(path, mode, encoding="utf-8")
+
+    def _count(self, counter: str):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None when missing or expired."""
+        path = self._path(key)
+        try:
+            with self._open(path, "r") as f:
+                entry = json.load(f)
+        except (OSError, EOFError, ValueError):
+            self._count("misses")
+            return None
+        if self.ttl_seconds is not None and time.time() - entry.get("created_at", 0) > self.ttl_seconds:
+            self._remove(path)
+            self._count("misses")
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self._count("hits")
+        return entry["value"]
+
+    def set(self, key: str, value: Any):
+        """Store a JSON-serializable value under key."""
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        tmp_path = path.parent / f"{path.name}.{threading.get_ident()}.tmp"
+        with self._open(tmp_path, "w") as f:
+            json.dump({"created_at": time.time(), "value": value}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        self._count("writes")
+
+    def _remove(self, path: Path):
+        try:
+            path.unlink()
+            self._count("evictions")
+        except OSError:
+            pass
+
+    def prune(self):
+        """Drop expired entries, then least recently used ones until under max size."""
+        now = time.time()
+        entries = []
+        for path in self.directory.glob(f"*/*{self.suffix}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            if self.ttl_seconds is not None and now - stat.st_mtime > self.ttl_seconds:
+                # mtime is at least created_at, so this entry is certainly expired
+                self._remove(path)
+            else:
+                entries.append((stat.st_mtime, stat.st_size, path))
+        if self.max_size_bytes is None:
+            return
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_size_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "writes": self.writes, "evictions": self.evictions}
@@ -7,68 +7,65 @@ that can be opened directly in a browser without any server.
 import json
 import os
 from datetime import datetime
+from pathlib import Path
+
+from run_files import COMPACT, iter_articles, read_header, run_file_paths
 
 def generate_standalone_viewer(json_file_path, output_path="pharma_news_standalone.html"):
     """Generate a self-contained HTML file with embedded data."""
     
-    # Read the JSON data
-    with open(json_file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    # Extract articles (handle both formats)
-    if isinstance(data, list):
-        articles = data
-        metadata = {
-            "run_timestamp": datetime.now().isoformat(),
-            "total_articles": len(data)
-        }
-    else:
-        articles = data.get('articles', [])
-        metadata = {k: v for k, v in data.items() if k != 'articles'}
+    # Run fields first (plain or compressed run file); articles are streamed in below
+    json_file_path = Path(json_file_path)
+    metadata = read_header(json_file_path)
+    bare_list = not metadata
+    if bare_list:
+        metadata = {"run_timestamp": datetime.now().isoformat()}
     
     # Read the template
     with open('pharma_news_viewer.html', 'r', encoding='utf-8') as f:
         template = f.read()
     
-    # Replace the placeholder with actual data
-    # Find the line with EMBEDDED_DATA and replace it
-    embedded_data_line = "        const EMBEDDED_DATA = null; // This will be replaced when generating the file with data"
-    replacement_line = f"        const EMBEDDED_DATA = {json.dumps(articles, indent=2, ensure_ascii=False)};"
-    
-    # Also add metadata
-    metadata_line = f"        const METADATA = {json.dumps(metadata, indent=2, ensure_ascii=False)};"
-    
-    # Replace in template
-    output_html = template.replace(embedded_data_line, replacement_line + "\n" + metadata_line)
-    
     # Update the title to include the date
     if 'run_timestamp' in metadata:
         date_str = metadata['run_timestamp'][:10]
-        output_html = output_html.replace(
+        template = template.replace(
             "<title>Pharmaceutical News Intelligence</title>",
             f"<title>Pharmaceutical News Intelligence - {date_str}</title>"
         )
     
-    # Write the output file
+    # Replace the placeholder with actual data
+    # Find the line with EMBEDDED_DATA and write the articles there one at a time
+    embedded_data_line = "        const EMBEDDED_DATA = null; // This will be replaced when generating the file with data"
+    before, after = template.split(embedded_data_line, 1)
+    
+    article_count = 0
     with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(output_html)
+        f.write(before + "        const EMBEDDED_DATA = [")
+        for article in iter_articles(json_file_path):
+            f.write(("," if article_count else "") + json.dumps(article, separators=COMPACT, ensure_ascii=False))
+            article_count += 1
+        f.write("];\n")
+        
+        # Also add metadata
+        if bare_list:
+            metadata["total_articles"] = article_count
+        f.write(f"        const METADATA = {json.dumps(metadata, separators=COMPACT, ensure_ascii=False)};")
+        f.write(after)
     
     # Get file size
     file_size = os.path.getsize(output_path) / (1024 * 1024)  # MB
     
     print(f"✅ Generated standalone viewer: {output_path}")
     print(f"📊 File size: {file_size:.2f} MB")
-    print(f"📰 Articles included: {len(articles)}")
+    print(f"📰 Articles included: {article_count}")
     print(f"\n📤 You can now send this file to anyone!")
     print("They can simply double-click to open it in their browser.")
 
 if __name__ == "__main__":
-    # Find the most recent JSON file
-    import glob
-    
-    json_files = glob.glob('data/pharma_news_*.json')
+    # Find the most recent run file
+    json_files = run_file_paths()
     if json_files:
-        latest_file = max(json_files)
+        latest_file = json_files[-1]
         print(f"Using latest data file: {latest_file}")
         generate_standalone_viewer(latest_file)
     else:
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Long-lived, pooled HTTP clients shared by feed fetching and every scraping method.
+
+One monitor owns one HttpClients instance, so repeated requests to the same
+few news hosts reuse keep-alive connections (and TLS sessions) instead of
+paying the handshake for every article:
+
+- requests: a Session with a sized urllib3 connection pool per host
+- cloudscraper: a single scraper instance, keeping its Cloudflare cookies
+- httpx: a Client with HTTP/2 enabled when the h2 package is available
+
+A per-host semaphore caps concurrent requests to any one host across all
+three clients, and an optional HostRateLimiter spaces requests to the same
+host while leaving other hosts unaffected.
+"""
+
+import threading
+from collections import Counter, defaultdict
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import cloudscraper
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+from rate_limiter import HostRateLimiter, parse_retry_after
+
+try:
+    import h2  # noqa: F401  (only needed so httpx can negotiate HTTP/2)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+def accepted_encodings() -> str:
+    """Accept-Encoding value limited to codings this environment can decode."""
+    encodings = ["gzip", "deflate"]
+    try:
+        import brotli  # noqa: F401
+        encodings.append("br")
+    except ImportError:
+        try:
+            import brotlicffi  # noqa: F401
+            encodings.append("br")
+        except ImportError:
+            pass
+    return ", ".join(encodings)
+
+
+class HttpClients:
+    def __init__(self, headers: Dict[str, str], max_connections: int = 20,
+                 max_connections_per_host: int = 4, http2: bool = True,
+                 rate_limiter: Optional[HostRateLimiter] = None):
+        self.headers = dict(headers)
+        # Never advertise a coding we could not decode (e.g. br without brotli)
+        self.headers["Accept-Encoding"] = accepted_encodings()
+        self.max_connections_per_host = max_connections_per_host
+        self.rate_limiter = rate_limiter
+
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=max_connections, pool_maxsize=max_connections_per_host)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # cloudscraper mounts its own TLS adapter, so only its instance is shared
+        self.cloudscraper = cloudscraper.create_scraper()
+
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self.httpx = httpx.Client(
+            http2=self.http2,
+            follow_redirects=True,
+            headers=self.headers,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            event_hooks={"response": [self._record_httpx_version]},
+        )
+
+        self._lock = threading.Lock()
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._requests_by_client: Counter = Counter()
+        self._requests_by_host: Counter = Counter()
+        self._httpx_versions: Counter = Counter()
+
+    def _record_httpx_version(self, response: httpx.Response):
+        with self._lock:
+            self._httpx_versions[response.http_version] += 1
+
+    def host_slot(self, url: str) -> threading.BoundedSemaphore:
+        """Semaphore limiting concurrent requests to the URL's host."""
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(self.max_connections_per_host)
+            self._requests_by_host[host] += 1
+            return self._host_slots[host]
+
+    def get(self, client: str, url: str, deadline: Optional[float] = None, **kwargs):
+        """GET through one of the pooled clients: 'requests', 'cloudscraper' or 'httpx'.
+        
+        With a deadline (time.monotonic()), a rate-limit wait that would pass it
+        raises RateLimitTimeout instead of sleeping.
+        """
+        with self._lock:
+            self._requests_by_client[client] += 1
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(url, deadline)
+        with self.host_slot(url):
+            if client == "httpx":
+                response = self.httpx.get(url, **kwargs)
+            else:
+                session = self.cloudscraper if client == "cloudscraper" else self.session
+                response = session.get(url, **kwargs)
+        if self.rate_limiter is not None and response.status_code in (429, 503):
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after:
+                self.rate_limiter.defer(url, retry_after)
+        return response
+
+    def stats(self) -> Dict:
+        """Request counts plus connection reuse for the urllib3-backed sessions."""
+        pools = defaultdict(lambda: {"connections_opened": 0, "requests": 0})
+        for name, session in (("requests", self.session), ("cloudscraper", self.cloudscraper)):
+            for adapter in set(session.adapters.values()):
+                manager = getattr(adapter, "poolmanager", None)
+                if manager is None:
+                    continue
+                for key in list(manager.pools.keys()):
+                    pool = manager.pools.get(key)
+                    if pool is None:
+                        continue
+                    pools[name]["connections_opened"] += pool.num_connections
+                    pools[name]["requests"] += pool.num_requests
+        with self._lock:
+            return {
+                "requests_by_client": dict(self._requests_by_client),
+                "requests_by_host": dict(self._requests_by_host),
+                "connection_pools": dict(pools),
+                "httpx_http_versions": dict(self._httpx_versions),
+                "http2_enabled": self.http2,
+                "accept_encoding": self.headers["Accept-Encoding"],
+                "rate_limiter": self.rate_limiter.stats() if self.rate_limiter is not None else None,
+            }
+
+    def close(self):
+        self.session.close()
+        self.cloudscraper.close()
+        self.httpx.close()
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+Helpers shared by the small JSON state files kept across runs
+(scraper stats, circuit breakers, failed URLs).
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional
+
+# Weight of the newest sample in latency moving averages
+LATENCY_ALPHA = 0.3
+
+
+def moving_average(previous: Optional[float], sample: float) -> float:
+    """Exponentially weighted moving average, starting at the first sample."""
+    return sample if previous is None else LATENCY_ALPHA * sample + (1 - LATENCY_ALPHA) * previous
+
+
+def save_json_atomic(path: Path, data: Dict):
+    """Write JSON through a temporary file and a rename, so a crash never leaves a torn file."""
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Near-duplicate story detection for syndicated pharmaceutical news.
+
+The same announcement often shows up in several feeds under different URLs
+with lightly edited titles and descriptions. Each article gets a 64-bit
+SimHash over its normalized title + description; two articles whose hashes
+differ in at most `max_distance` bits are treated as the same story.
+Articles with no words in either get no fingerprint and are never grouped.
+
+Lookups use banded LSH: the hash is split into max_distance + 1 bands, and by
+the pigeonhole principle any hash within max_distance bits shares at least
+one band exactly, so only candidates from matching band buckets are compared.
+"""
+
+import hashlib
+import html
+import json
+import os
+import re
+import time
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+TAG_RE = re.compile(r"<[^>]+>")
+WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+def normalize_text(text: str) -> List[str]:
+    """Strip markup and punctuation, returning lowercase word tokens."""
+    text = html.unescape(TAG_RE.sub(" ", text or ""))
+    return WORD_RE.findall(text.lower())
+
+
+def simhash(text: str) -> Optional[int]:
+    """64-bit SimHash over word unigrams and bigrams, or None for text without words."""
+    words = normalize_text(text)
+    features = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+    if not features:
+        # Every empty text would share one hash and look like the same story
+        return None
+    weights = [0] * 64
+    for feature in features:
+        h = int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "big")
+        for bit in range(64):
+            weights[bit] += 1 if h >> bit & 1 else -1
+    return sum(1 << bit for bit in range(64) if weights[bit] > 0)
+
+
+def article_fingerprint(article: Dict) -> Optional[int]:
+    """SimHash of an article's title and description (None if they have no words)."""
+    return simhash(f"{article.get('title', '')} {article.get('description', '')}")
+
+
+class NearDuplicateIndex:
+    def __init__(self, max_distance: int = 7):
+        """Create an empty index matching hashes within max_distance bits."""
+        self.max_distance = max_distance
+        self.num_bands = max_distance + 1
+        self.band_bits = 64 // self.num_bands
+        self.entries: List[Dict] = []
+        self._buckets = [defaultdict(list) for _ in range(self.num_bands)]
+
+    def _bands(self, fingerprint: int):
+        mask = (1 << self.band_bits) - 1
+        for band in range(self.num_bands):
+            # The last band absorbs any leftover bits when 64 is not divisible
+            if band == self.num_bands - 1:
+                yield band, fingerprint >> (band * self.band_bits)
+            else:
+                yield band, (fingerprint >> (band * self.band_bits)) & mask
+
+    def find(self, fingerprint: int) -> Optional[Dict]:
+        """Return the closest stored entry within max_distance, if any."""
+        best, best_distance = None, self.max_distance + 1
+        seen = set()
+        for band, value in self._bands(fingerprint):
+            for i in self._buckets[band].get(value, ()):
+                if i in seen:
+                    continue
+                seen.add(i)
+                distance = bin(self.entries[i]["fingerprint"] ^ fingerprint).count("1")
+                if distance < best_distance:
+                    best, best_distance = self.entries[i], distance
+        return best
+
+    def add(self, fingerprint: int, **info) -> Dict:
+        """Store a fingerprint with arbitrary metadata (title, source, ...)."""
+        entry = dict(info, fingerprint=fingerprint)
+        entry.setdefault("seen_at", time.time())
+        self.entries.append(entry)
+        for band, value in self._bands(fingerprint):
+            self._buckets[band][value].append(len(self.entries) - 1)
+        return entry
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @classmethod
+    def load(cls, path: Path, max_distance: int = 7, max_age_days: Optional[float] = None) -> "NearDuplicateIndex":
+        """Load a persisted index, dropping entries older than max_age_days."""
+        index = cls(max_distance)
+        if not path.exists():
+            return index
+        with open(path, "r") as f:
+            data = json.load(f)
+        cutoff = time.time() - max_age_days * 86400 if max_age_days else None
+        for entry in data.get("entries", []):
+            if cutoff is not None and entry.get("seen_at", 0) < cutoff:
+                continue
+            fingerprint = int(entry.pop("fingerprint"), 16)
+            index.add(fingerprint, **entry)
+        return index
+
+    def save(self, path: Path):
+        """Persist the index atomically as JSON."""
+        data = {
+            "last_updated": datetime.now().isoformat(),
+            "max_distance": self.max_distance,
+            "entries": [dict(entry, fingerprint=f"{entry['fingerprint']:016x}") for entry in self.entries],
+        }
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
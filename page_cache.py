@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Compressed on-disk cache of downloaded article pages.
+
+Pages are keyed by canonical URL, so tracking parameters, fragments and
+host-name case do not create separate entries. Each entry keeps the HTML
+plus the ETag / Last-Modified validators:
+
+- within the freshness window the cached page is served with no request
+- after it, the page can be revalidated with a conditional GET
+- entries are dropped after max_age or when the cache outgrows its size cap
+"""
+
+import time
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from disk_cache import DiskCache, make_key
+
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = ("utm_", "fbclid", "gclid", "mc_cid", "mc_eid", "cmpid")
+
+
+def canonical_url(url: str) -> str:
+    """Normalize a URL so links to the same page share one cache entry."""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and not ((scheme == "http" and parts.port == 80) or (scheme == "https" and parts.port == 443)):
+        host = f"{host}:{parts.port}"
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not any(k.lower() == p or (p.endswith("_") and k.lower().startswith(p)) for p in TRACKING_PARAMS)
+    )
+    return urlunsplit((scheme, host, parts.path or "/", urlencode(query), ""))
+
+
+class PageCache:
+    def __init__(self, directory: Path, fresh_seconds: float, max_age_seconds: Optional[float] = None,
+                 max_size_bytes: Optional[int] = None):
+        self.fresh_seconds = fresh_seconds
+        self.cache = DiskCache(directory, ttl_seconds=max_age_seconds, max_size_bytes=max_size_bytes, compress=True)
+        self.revalidated = 0
+
+    def _key(self, url: str) -> str:
+        return make_key("page", canonical_url(url))
+
+    def get(self, url: str) -> Optional[Dict]:
+        """Cached entry for a URL: html, etag, last_modified, fetched_at."""
+        return self.cache.get(self._key(url))
+
+    def is_fresh(self, entry: Dict) -> bool:
+        return time.time() - entry.get("fetched_at", 0) < self.fresh_seconds
+
+    @staticmethod
+    def validators(entry: Optional[Dict]) -> Dict[str, str]:
+        """Conditional request headers for revalidating an entry."""
+        headers = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(self, url: str, html: str, response_headers) -> Dict:
+        entry = {
+            "url": canonical_url(url),
+            "html": html,
+            "etag": response_headers.get("ETag"),
+            "last_modified": response_headers.get("Last-Modified"),
+            "fetched_at": time.time(),
+        }
+        self.cache.set(self._key(url), entry)
+        return entry
+
+    def refresh(self, url: str, entry: Dict) -> Dict:
+        """Restart the freshness window of an entry the origin confirmed unchanged."""
+        entry = dict(entry, fetched_at=time.time())
+        self.cache.set(self._key(url), entry)
+        self.revalidated += 1
+        return entry
+
+    def prune(self):
+        self.cache.prune()
+
+    def stats(self) -> Dict[str, int]:
+        return dict(self.cache.stats(), revalidated=self.revalidated)
@@ -12,23 +12,39 @@ Optimized workflow:
 
 import os
 import json
+import argparse
 import logging
+import calendar
 import hashlib
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import queue
+import random
+import threading
+from multiprocessing import get_all_start_methods, get_context
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
 
 import feedparser
-import requests
-from bs4 import BeautifulSoup
 from openai import OpenAI
-import cloudscraper
-from newspaper import Article
-import httpx
 from dotenv import load_dotenv
 
+from dedup_store import DedupStore
+from near_duplicates import NearDuplicateIndex, article_fingerprint
+from prefilter import PrefilterStats, TopicPrefilter
+from cascade_classifier import CascadeClassifier, ClassificationLog
+from disk_cache import DiskCache, make_key
+from scraper_stats import ScraperStats, url_domain
+from http_clients import HttpClients
+from content_extraction import extract_page, html_to_text
+from page_cache import PageCache, canonical_url
+from circuit_breaker import DomainCircuitBreaker, FailedUrlCache
+from article_store import ArticleStore
+from run_output import RunOutput, find_interrupted, interrupted_header, partial_timestamp
+from run_journal import RunJournal, find_unfinished, journal_timestamp
+from rate_limiter import HostRateLimiter, RateLimitTimeout
+
 # Load environment variables
 load_dotenv()
 
@@ -128,56 +144,255 @@ def load_config():
             }
         },
         "processing": {
-            "parallel_classification": true,
+            "parallel_classification": True,
             "max_classification_workers": 5,
             "batch_classification_size": 5
+        },
+        "feed_fetching": {
+            "max_workers": 8,
+            "timeout": 20,
+            "conditional_requests": True
+        },
+        "pipeline": {
+            "queue_size": 10,
+            "content_workers": 4,
+            "summarize_workers": 3
+        },
+        "deduplication": {
+            "max_age_days": None,
+            "compact_threshold": 1000
+        },
+        "near_duplicates": {
+            "enabled": True,
+            "max_distance": 7,
+            "max_age_days": 7
         }
         }
 CONFIG = load_config()
 
+# Part of the LLM cache key: bump when a prompt's wording changes so cached
+# responses produced by the old prompt are not reused
+CLASSIFY_PROMPT_VERSION = 1
+SUMMARY_PROMPT_VERSION = 1
+
+# Shared by the single-article and batched classification prompts
+CLASSIFICATION_GUIDELINES = """Classification guidelines for 100% confidence:
+            - "Success in preclinical study": ONLY if explicitly states successful preclinical results
+            - "Orphan drug designation": ONLY if explicitly states FDA/EMA granted orphan drug designation
+            - "Series B fundraising complete": ONLY if explicitly announces completion of Series B funding round
+            - "Interim analysis results were positive": ONLY if explicitly states positive interim analysis with specific data
+            - "FDA Accelerated Approval": ONLY if explicitly states FDA granted accelerated approval
+            - "Breakthrough therapy designation": ONLY if explicitly states FDA granted breakthrough therapy designation
+            
+            Requirements for 100% confidence:
+            - The exact phrase or very close variant must be present
+            - The action must be completed (not planned or hoped for)
+            - The information must be the main focus of the article
+            - DO NOT infer or interpret - only explicit statements count"""
+
+# How long a batching stage worker waits to fill a batch before sending it short
+BATCH_FILL_TIMEOUT = 0.1
+
+# Sentinel telling a pipeline stage worker that no more input will arrive
+_STAGE_DONE = object()
+
+# Markers of anti-bot interstitials (Cloudflare and similar) served as normal pages
+CHALLENGE_MARKERS = (
+    "<title>Just a moment...</title>",
+    "cf-browser-verification",
+    "challenge-platform",
+    "Attention Required! | Cloudflare",
+)
+
+# Statuses meaning the page is gone, whichever transport asks
+PERMANENT_FAILURE_STATUSES = (404, 410)
+
+
+def _parse_pool_context():
+    """Start method for parse worker processes: forkserver where available, else spawn."""
+    return get_context('forkserver' if 'forkserver' in get_all_start_methods() else 'spawn')
+
 
 class PharmaNewsMonitor:
-    def __init__(self, api_key: str):
-        """Initialize the news monitor with OpenAI API key."""
+    def __init__(self, api_key: str, bypass_llm_cache: bool = False):
+        """Initialize the news monitor with OpenAI API key.
+        
+        bypass_llm_cache forces fresh LLM calls while still refreshing the cache.
+        """
         self.client = OpenAI(api_key=api_key)
         self.data_dir = Path("data")
         self.data_dir.mkdir(exist_ok=True)
         self.total_articles_fetched = 0
         self.total_articles_discarded = 0
+        # Articles are streamed to disk as they are processed, each step journaled for --resume
+        self.run_output = None
+        self.journal = None
         self.total_duplicates_skipped = 0
-        # Create a session for better cookie handling
-        self.session = requests.Session()
-        self.session.headers.update(CONFIG["scraping"]["headers"])
+        self.total_near_duplicates = 0
+        # Newest entry per feed, saved as its high-water mark unless classification failed (by feed URL)
+        self.pending_high_water: Dict[str, Dict] = {}
+        self.classification_errors: Dict[str, List[Optional[int]]] = {}
+        self.total_classification_errors = 0
+        # Local keyword prefilter ahead of the LLM classifier
+        self.prefilter = None
+        self.prefilter_stats = None
+        prefilter_config = CONFIG.get('prefilter', {})
+        if prefilter_config.get('enabled', False):
+            topic_phrases = prefilter_config.get('topic_phrases', {})
+            for topic in CONFIG['topics']:
+                if topic not in topic_phrases:
+                    logger.warning(f"Prefilter has no phrases for topic '{topic}', matching on its name only")
+            self.prefilter = TopicPrefilter({topic: topic_phrases.get(topic, []) for topic in CONFIG['topics']})
+            self.prefilter_stats = PrefilterStats(
+                prefilter_config.get('mode', 'shadow'),
+                prefilter_config.get('audit_sample_rate', 0.05)
+            )
+        # On-disk cache of LLM responses keyed by model, prompt version, temperature and input
+        self.llm_cache = None
+        self.llm_cache_bypass = bypass_llm_cache
+        llm_cache_config = CONFIG.get('llm_cache', {})
+        if llm_cache_config.get('enabled', True):
+            ttl_days = llm_cache_config.get('ttl_days', 30)
+            max_size_mb = llm_cache_config.get('max_size_mb', 200)
+            self.llm_cache = DiskCache(
+                Path(llm_cache_config.get('directory', 'data/llm_cache')),
+                ttl_seconds=ttl_days * 86400 if ttl_days else None,
+                max_size_bytes=int(max_size_mb * 1024 * 1024) if max_size_mb else None
+            )
+        # Compressed cache of downloaded article pages, keyed by canonical URL
+        self.page_cache = None
+        page_cache_config = CONFIG.get('page_cache', {})
+        if page_cache_config.get('enabled', True):
+            max_age_days = page_cache_config.get('max_age_days', 7)
+            max_size_mb = page_cache_config.get('max_size_mb', 500)
+            self.page_cache = PageCache(
+                Path(page_cache_config.get('directory', 'data/page_cache')),
+                fresh_seconds=page_cache_config.get('fresh_hours', 24) * 3600,
+                max_age_seconds=max_age_days * 86400 if max_age_days else None,
+                max_size_bytes=int(max_size_mb * 1024 * 1024) if max_size_mb else None
+            )
+        # Every LLM classification is logged as training data for the local cascade model
+        self.classification_log = ClassificationLog(self.data_dir / "classification_log.jsonl")
+        self.cascade = None
+        self.total_classified_locally = 0
+        self.total_classified_by_llm = 0
+        cascade_config = CONFIG.get('cascade', {})
+        cascade_model_path = Path(cascade_config.get('model_path', 'data/cascade_model.json'))
+        if cascade_config.get('enabled', False):
+            if cascade_model_path.exists():
+                try:
+                    self.cascade = CascadeClassifier.load(
+                        cascade_model_path,
+                        CONFIG['topics'],
+                        negative_threshold=cascade_config.get('negative_threshold', 0.02),
+                        positive_threshold=cascade_config.get('positive_threshold', 0.98)
+                    )
+                    logger.info(f"Loaded cascade classifier trained {self.cascade.metadata.get('trained_at', 'N/A')}")
+                except Exception as e:
+                    logger.error(f"Error loading cascade classifier: {e}")
+            else:
+                logger.info("No cascade model yet, run 'python cascade_classifier.py train' once enough history is logged")
+        # Which scraping method works for which site, learned across runs
+        strategy_config = CONFIG.get('scraper_strategy', {})
+        self.scraper_stats = ScraperStats(
+            self.data_dir / "scraper_stats.json",
+            half_life_days=strategy_config.get('half_life_days', 7),
+            skip_after_failures=strategy_config.get('skip_after_failures', 3),
+            max_skip_success_rate=strategy_config.get('max_skip_success_rate', 0.1)
+        )
+        try:
+            self.scraper_stats.load()
+        except Exception as e:
+            logger.error(f"Error loading scraper stats: {e}")
+        # Stop scraping domains that keep failing, and URLs that are gone
+        breaker_config = CONFIG.get('circuit_breaker', {})
+        self.circuit_breaker = DomainCircuitBreaker(
+            self.data_dir / "circuit_breakers.json",
+            failure_threshold=breaker_config.get('failure_threshold', 3),
+            cooldown_seconds=breaker_config.get('cooldown_minutes', 60) * 60
+        )
+        failed_url_ttl_days = breaker_config.get('failed_url_ttl_days', 30)
+        self.failed_urls = FailedUrlCache(
+            self.data_dir / "failed_urls.json",
+            ttl_seconds=failed_url_ttl_days * 86400 if failed_url_ttl_days else None
+        )
+        for store in (self.circuit_breaker, self.failed_urls):
+            try:
+                store.load()
+            except Exception as e:
+                logger.error(f"Error loading {store.path.name}: {e}")
+        # Guards counters updated from pipeline worker threads
+        self._stats_lock = threading.Lock()
+        # Worker processes for HTML parsing, only up while articles are processed
+        self._parse_pool = None
+        # Runs scraping transports so a slow download can be hedged with another
+        self.total_hedged_scrapes = 0
+        self.total_scrape_deadlines_exceeded = 0
+        self._scrape_pool = ThreadPoolExecutor(
+            max_workers=max(2, CONFIG.get('pipeline', {}).get('content_workers', 1) * 3),
+            thread_name_prefix="scrape"
+        )
+        # Pooled, keep-alive clients shared by feed fetching and all scrapers
+        pool_config = CONFIG.get('http_pool', {})
+        rate_config = CONFIG.get('rate_limits', {})
+        # Without explicit limits, keep the old spacing of rate_limit_delay per host
+        default_rate = 1 / max(CONFIG["scraping"].get("rate_limit_delay", 1), 0.001)
+        self.http = HttpClients(
+            CONFIG["scraping"]["headers"],
+            max_connections=pool_config.get('max_connections', 20),
+            max_connections_per_host=pool_config.get('max_connections_per_host', 4),
+            http2=pool_config.get('http2', True),
+            rate_limiter=HostRateLimiter(
+                requests_per_second=rate_config.get('requests_per_second', default_rate),
+                burst=rate_config.get('burst', 1),
+                domains=rate_config.get('domains', {}),
+                max_retry_after=rate_config.get('max_retry_after', 300)
+            )
+        )
         # Initialize deduplication system
-        self.seen_articles = set()
-        self.dedup_index_path = self.data_dir / "article_index.json"
+        self.legacy_index_path = self.data_dir / "article_index.json"
         self._load_article_index()
+        # Conditional GET validators, persisted so unchanged feeds are skipped
+        self.feed_cache = {}
+        self.feed_cache_path = self.data_dir / "feed_cache.json"
+        self._load_feed_cache()
+        # Fingerprints of processed stories, to catch re-syndicated copies
+        near_dup_config = CONFIG.get('near_duplicates', {})
+        self.near_dup_index_path = self.data_dir / "near_duplicate_index.json"
+        try:
+            self.near_duplicates = NearDuplicateIndex.load(
+                self.near_dup_index_path,
+                max_distance=near_dup_config.get('max_distance', 7),
+                max_age_days=near_dup_config.get('max_age_days', 7)
+            )
+        except Exception as e:
+            logger.error(f"Error loading near-duplicate index: {e}")
+            self.near_duplicates = NearDuplicateIndex(near_dup_config.get('max_distance', 7))
         
     def _load_article_index(self):
-        """Load the article index from disk to track seen articles."""
-        if self.dedup_index_path.exists():
+        """Open the on-disk article index used to track seen articles."""
+        dedup_config = CONFIG.get('deduplication', {})
+        self.seen_articles = DedupStore(
+            self.data_dir / "article_index",
+            max_age_days=dedup_config.get('max_age_days'),
+            compact_threshold=dedup_config.get('compact_threshold', 1000)
+        )
+        # One-time migration from the old JSON list of IDs
+        if self.legacy_index_path.exists():
             try:
-                with open(self.dedup_index_path, 'r') as f:
-                    index_data = json.load(f)
-                    self.seen_articles = set(index_data.get('article_ids', []))
-                    logger.info(f"Loaded {len(self.seen_articles)} article IDs from index")
+                migrated = self.seen_articles.migrate_json(self.legacy_index_path)
+                logger.info(f"Migrated {migrated} article IDs from {self.legacy_index_path}")
             except Exception as e:
-                logger.error(f"Error loading article index: {e}")
-                self.seen_articles = set()
-        else:
-            logger.info("No existing article index found, starting fresh")
+                logger.error(f"Error migrating article index: {e}")
+        logger.info(f"Opened article index with {len(self.seen_articles)} IDs")
             
     def _save_article_index(self):
-        """Save the article index to disk."""
+        """Make newly seen article IDs durable on disk."""
         try:
-            index_data = {
-                'last_updated': datetime.now().isoformat(),
-                'total_articles': len(self.seen_articles),
-                'article_ids': list(self.seen_articles)
-            }
-            with open(self.dedup_index_path, 'w') as f:
-                json.dump(index_data, f, indent=2)
+            self.seen_articles.flush()
             logger.info(f"Saved article index with {len(self.seen_articles)} IDs")
+            if CONFIG.get('near_duplicates', {}).get('enabled', True):
+                self.near_duplicates.save(self.near_dup_index_path)
         except Exception as e:
             logger.error(f"Error saving article index: {e}")
             
@@ -201,26 +416,226 @@ class PharmaNewsMonitor:
         article_id = self._generate_article_id(article)
         self.seen_articles.add(article_id)
         
+    def _load_feed_cache(self):
+        """Load per-feed conditional GET validators from disk."""
+        if self.feed_cache_path.exists():
+            try:
+                with open(self.feed_cache_path, 'r') as f:
+                    self.feed_cache = json.load(f).get('feeds', {})
+                    logger.info(f"Loaded feed cache for {len(self.feed_cache)} feeds")
+            except Exception as e:
+                logger.error(f"Error loading feed cache: {e}")
+                self.feed_cache = {}
+    
+    def _save_feed_cache(self):
+        """Save per-feed conditional GET validators to disk."""
+        try:
+            cache_data = {
+                'last_updated': datetime.now().isoformat(),
+                'feeds': self.feed_cache
+            }
+            tmp_path = self.feed_cache_path.with_suffix('.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump(cache_data, f, indent=2)
+            os.replace(tmp_path, self.feed_cache_path)
+            logger.info(f"Saved feed cache for {len(self.feed_cache)} feeds")
+        except Exception as e:
+            logger.error(f"Error saving feed cache: {e}")
+    
+    def _download_feed(self, feed_config: Dict) -> Tuple[Optional[bytes], Dict]:
+        """Download the raw bytes of a single feed within its time budget.
+        
+        Returns (None, entry) when the feed is unchanged since the last run,
+        either because the server answered 304 or the body hashes the same.
+        """
+        fetch_config = CONFIG.get('feed_fetching', {})
+        timeout = fetch_config.get('timeout', 20)
+        deadline = time.monotonic() + timeout
+        
+        cached = self.feed_cache.get(feed_config['url'], {})
+        headers = {}
+        if fetch_config.get('conditional_requests', True):
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+        
+        response = self.http.get('requests', feed_config['url'], deadline=deadline, headers=headers,
+                                 timeout=timeout, stream=True)
+        try:
+            entry = dict(cached, last_checked=datetime.now().isoformat())
+            if response.status_code == 304:
+                return None, entry
+            response.raise_for_status()
+            chunks = []
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                # A slow-dripping server can keep each read under the socket
+                # timeout forever, so enforce the budget on the whole body too
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"feed download exceeded {timeout}s")
+                chunks.append(chunk)
+            content = b''.join(chunks)
+        finally:
+            response.close()
+        
+        entry['etag'] = response.headers.get('ETag')
+        entry['last_modified'] = response.headers.get('Last-Modified')
+        content_hash = hashlib.sha256(content).hexdigest()
+        if fetch_config.get('conditional_requests', True) and content_hash == cached.get('content_hash'):
+            return None, entry
+        entry['content_hash'] = content_hash
+        return content, entry
+    
+    def _download_feeds(self) -> List[Tuple[Dict, Optional[bytes]]]:
+        """Download all configured feeds concurrently, preserving config order."""
+        feeds = CONFIG["rss_feeds"]
+        if not feeds:
+            return []
+        max_workers = CONFIG.get('feed_fetching', {}).get('max_workers', 8)
+        results: List[Optional[bytes]] = [None] * len(feeds)
+        unchanged = 0
+        
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(feeds)))) as executor:
+            futures = {
+                executor.submit(self._download_feed, feed_config): i
+                for i, feed_config in enumerate(feeds)
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                feed_config = feeds[i]
+                try:
+                    results[i], cache_entry = future.result()
+                    self.feed_cache[feed_config['url']] = cache_entry
+                    if results[i] is None:
+                        unchanged += 1
+                        logger.info(f"RSS feed unchanged since last run: {feed_config['name']}")
+                    else:
+                        logger.info(f"Downloaded RSS feed: {feed_config['name']} ({len(results[i])} bytes)")
+                except Exception as e:
+                    logger.error(f"Error fetching feed {feed_config['name']}: {str(e)}")
+        downloaded = sum(r is not None for r in results)
+        logger.info(f"Downloaded {downloaded}/{len(feeds)} feeds ({unchanged} unchanged) in {time.monotonic() - start:.1f}s")
+        
+        return list(zip(feeds, results))
+    
+    def _group_near_duplicates(self, articles: List[Dict]) -> List[Dict]:
+        """Collapse variants of the same story into one representative article.
+        
+        Stories already processed in earlier runs are dropped; copies within
+        this run are attached to the first article seen as duplicate_sources.
+        """
+        if not CONFIG.get('near_duplicates', {}).get('enabled', True):
+            return articles
+        
+        max_distance = self.near_duplicates.max_distance
+        run_index = NearDuplicateIndex(max_distance)
+        representatives = []
+        for article in articles:
+            fingerprint = article_fingerprint(article)
+            article['duplicate_sources'] = []
+            if fingerprint is None:
+                # Nothing to compare, so never a near-duplicate of anything
+                representatives.append(article)
+                continue
+            article['fingerprint'] = fingerprint
+            
+            previous = self.near_duplicates.find(fingerprint)
+            if previous is not None:
+                self.total_near_duplicates += 1
+                logger.debug(f"Skipping story seen in an earlier run: {article['title'][:60]}... "
+                             f"(matches {previous.get('source_feed')}: {previous.get('title', '')[:60]})")
+                continue
+            
+            match = run_index.find(fingerprint)
+            if match is not None:
+                self.total_near_duplicates += 1
+                representative = match['article']
+                representative['duplicate_sources'].append({
+                    "source_feed": article['source_feed'],
+                    "link": article['link'],
+                    "title": article['title']
+                })
+                logger.debug(f"Grouping {article['source_feed']} copy with {representative['source_feed']}: {article['title'][:60]}...")
+                continue
+            
+            run_index.add(fingerprint, article=article)
+            representatives.append(article)
+        
+        if self.total_near_duplicates:
+            logger.info(f"Near-duplicate stories grouped or skipped: {self.total_near_duplicates}")
+        return representatives
+    
+    def _high_water_mark(self, entry) -> Dict:
+        """Identity and publish time of a feed entry, to recognize it next run."""
+        published = entry.get('published_parsed') or entry.get('updated_parsed')
+        return {
+            "id": entry.get('id') or entry.get('link', ''),
+            "published": calendar.timegm(published) if published else None,
+        }
+    
+    def _below_high_water(self, entry, high_water: Optional[Dict]) -> bool:
+        """Whether an entry is the last run's newest one or older than it."""
+        if not high_water:
+            return False
+        mark = self._high_water_mark(entry)
+        if mark['id'] and mark['id'] == high_water.get('id'):
+            return True
+        # Strictly older only: entries sharing the timestamp may still be new
+        return (mark['published'] is not None and high_water.get('published') is not None
+                and mark['published'] < high_water['published'])
+    
+    def _newest_high_water(self, entries) -> Dict:
+        """High-water mark of the most recently published entry, whatever order the feed lists them in."""
+        marks = [self._high_water_mark(entry) for entry in entries]
+        dated = [mark for mark in marks if mark['published'] is not None]
+        return max(dated, key=lambda mark: mark['published']) if dated else marks[0]
+    
+    def _advance_high_water(self):
+        """Move each feed's high-water mark up to this run's newest entry, but not past classification errors.
+        
+        Articles whose classification failed must be fetched again next run, so
+        the mark stops just short of the oldest of them (or stays put when its
+        publish time is unknown), and the feed's conditional GET validators are
+        dropped so an unchanged feed is not skipped as a whole.
+        """
+        for feed_url, newest in self.pending_high_water.items():
+            errored = self.classification_errors.get(feed_url)
+            cache_entry = self.feed_cache.setdefault(feed_url, {})
+            if not errored:
+                cache_entry['high_water'] = newest
+                continue
+            for validator in ('etag', 'last_modified', 'content_hash'):
+                cache_entry.pop(validator, None)
+            if None in errored:
+                logger.warning(f"Keeping high-water mark of {feed_url}: {len(errored)} articles failed classification")
+            else:
+                # No id: entries published at that time are not skipped, only older ones
+                cache_entry['high_water'] = {"id": None, "published": min(errored)}
+                logger.warning(f"Holding back high-water mark of {feed_url}: {len(errored)} articles failed classification")
+    
     def fetch_rss_feeds(self) -> List[Dict]:
         """Fetch and parse all configured RSS feeds."""
         all_articles = []
         duplicate_count = 0
         
-        for feed_config in CONFIG["rss_feeds"]:
+        for feed_config, raw_feed in self._download_feeds():
+            if raw_feed is None:
+                continue
             try:
-                logger.info(f"Fetching RSS feed: {feed_config['name']}")
-                feed = feedparser.parse(feed_config['url'])
+                feed = feedparser.parse(raw_feed, response_headers={'content-location': feed_config['url']})
                 feed_articles_count = 0
                 feed_duplicates_count = 0
+                cache_entry = self.feed_cache.setdefault(feed_config['url'], {})
+                high_water = cache_entry.get('high_water')
                 
                 for entry in feed.entries:
-                    # Try to get full content from RSS if available
-                    full_content_rss = None
-                    if hasattr(entry, 'content'):
-                        # Some feeds include full content
-                        full_content_rss = entry.content[0].get('value', '') if entry.content else ''
-                    elif hasattr(entry, 'content_encoded'):
-                        full_content_rss = entry.content_encoded
+                    # Entries up to the last run's newest one were handled then; feeds are not always sorted
+                    if self._below_high_water(entry, high_water):
+                        duplicate_count += 1
+                        feed_duplicates_count += 1
+                        logger.debug(f"Below high-water mark of {feed_config['name']}, skipping: {entry.get('title', '')[:60]}...")
+                        continue
                     
                     article = {
                         "title": entry.get("title", ""),
@@ -229,7 +644,8 @@ class PharmaNewsMonitor:
                         "published": entry.get("published", ""),
                         "source_feed": feed_config['name'],
                         "feed_url": feed_config['url'],
-                        "full_content_rss": full_content_rss  # Store RSS content if available
+                        # Where the feed's high-water mark must stop if this article fails classification
+                        "published_at": self._high_water_mark(entry)['published'],
                     }
                     
                     # Check for duplicates
@@ -237,14 +653,26 @@ class PharmaNewsMonitor:
                         duplicate_count += 1
                         feed_duplicates_count += 1
                         logger.debug(f"Skipping duplicate: {article['title'][:60]}...")
-                    else:
-                        all_articles.append(article)
-                        feed_articles_count += 1
+                        continue
                     
+                    # Full content HTML can be large, so only read it for new entries
+                    full_content_rss = None
+                    if hasattr(entry, 'content'):
+                        # Some feeds include full content
+                        full_content_rss = entry.content[0].get('value', '') if entry.content else ''
+                    elif hasattr(entry, 'content_encoded'):
+                        full_content_rss = entry.content_encoded
+                    article["full_content_rss"] = full_content_rss  # Store RSS content if available
+                    all_articles.append(article)
+                    feed_articles_count += 1
+                
+                if feed.entries:
+                    # Applied once the run's articles are classified, see _advance_high_water
+                    self.pending_high_water[feed_config['url']] = self._newest_high_water(feed.entries)
                 logger.info(f"Fetched {len(feed.entries)} articles from {feed_config['name']}: {feed_articles_count} new, {feed_duplicates_count} duplicates")
                 
             except Exception as e:
-                logger.error(f"Error fetching feed {feed_config['name']}: {str(e)}")
+                logger.error(f"Error parsing feed {feed_config['name']}: {str(e)}")
         
         self.total_articles_fetched = len(all_articles) + duplicate_count
         self.total_duplicates_skipped = duplicate_count
@@ -252,10 +680,39 @@ class PharmaNewsMonitor:
         if duplicate_count > 0:
             logger.info(f"Total duplicates skipped: {duplicate_count}")
             
-        return all_articles
+        return self._group_near_duplicates(all_articles)
     
-    def classify_article(self, article: Dict) -> Tuple[List[str], Dict[str, float]]:
-        """Classify an article based on predefined topics using AI."""
+    def _llm_cache_get(self, key: str):
+        """Look up a cached LLM response unless the cache is off or bypassed."""
+        if self.llm_cache is None or self.llm_cache_bypass:
+            return None
+        return self.llm_cache.get(key)
+    
+    def _llm_cache_set(self, key: str, value):
+        if self.llm_cache is not None:
+            try:
+                self.llm_cache.set(key, value)
+            except Exception as e:
+                logger.warning(f"Error writing LLM cache: {e}")
+    
+    def _llm_cache_stats(self) -> Optional[Dict]:
+        if self.llm_cache is None:
+            return None
+        return dict(self.llm_cache.stats(), bypass=self.llm_cache_bypass)
+    
+    def _classification_cache_key(self, article: Dict) -> str:
+        return make_key(
+            "classify", CLASSIFY_PROMPT_VERSION, CONFIG["ai_settings"]["model"],
+            CONFIG["ai_settings"]["classification_temperature"], CONFIG["topics"],
+            article['title'], article['description']
+        )
+    
+    def classify_article(self, article: Dict, read_cache: bool = True) -> Optional[Tuple[List[str], Dict[str, float]]]:
+        """Classify an article based on predefined topics using AI; None if classification failed."""
+        cache_key = self._classification_cache_key(article)
+        cached = self._llm_cache_get(cache_key) if read_cache else None
+        if cached is not None:
+            return cached["topics"], cached["confidence"]
         try:
             threshold = CONFIG.get('ai_settings', {}).get('classification_threshold', 0.7)
             prompt = f"""
@@ -268,19 +725,7 @@ class PharmaNewsMonitor:
             Topics to consider:
             {', '.join(CONFIG['topics'])}
             
-            Classification guidelines for 100% confidence:
-            - "Success in preclinical study": ONLY if explicitly states successful preclinical results
-            - "Orphan drug designation": ONLY if explicitly states FDA/EMA granted orphan drug designation
-            - "Series B fundraising complete": ONLY if explicitly announces completion of Series B funding round
-            - "Interim analysis results were positive": ONLY if explicitly states positive interim analysis with specific data
-            - "FDA Accelerated Approval": ONLY if explicitly states FDA granted accelerated approval
-            - "Breakthrough therapy designation": ONLY if explicitly states FDA granted breakthrough therapy designation
-            
-            Requirements for 100% confidence:
-            - The exact phrase or very close variant must be present
-            - The action must be completed (not planned or hoped for)
-            - The information must be the main focus of the article
-            - DO NOT infer or interpret - only explicit statements count
+            {CLASSIFICATION_GUIDELINES}
             
             Return your response as a JSON object with two keys:
             - "topics": list of relevant topic names from the list above
@@ -303,168 +748,322 @@ class PharmaNewsMonitor:
             result = json.loads(response.choices[0].message.content)
             topics = result.get("topics", [])
             confidence = result.get("confidence", {})
+            self.classification_log.append(article, topics, confidence)
+            self._llm_cache_set(cache_key, {"topics": topics, "confidence": confidence})
             
             return topics, confidence
             
         except Exception as e:
             logger.error(f"Error classifying article '{article['title']}': {str(e)}")
-            return [], {}
+            return None
     
-    def scrape_article_content(self, url: str) -> Optional[str]:
-        """Scrape the full content of an article from its URL using multiple methods."""
-        # Add delay to be respectful to servers
-        time.sleep(CONFIG["scraping"].get("rate_limit_delay", 1))
-        
-        # Method 1: Try newspaper3k first (handles many edge cases)
-        content = self._try_newspaper(url)
-        if content:
-            return content
-            
-        # Method 2: Try cloudscraper (handles Cloudflare)
-        content = self._try_cloudscraper(url)
-        if content:
-            return content
-            
-        # Method 3: Try standard requests with session
-        content = self._try_requests(url)
-        if content:
-            return content
-            
-        # Method 4: Try httpx as last resort
-        content = self._try_httpx(url)
-        if content:
-            return content
-            
-        logger.warning(f"All methods failed to scrape {url}")
-        return None
-    
-    def _try_newspaper(self, url: str) -> Optional[str]:
-        """Try scraping with newspaper3k library."""
-        try:
-            article = Article(url)
-            article.download()
-            article.parse()
-            
-            if article.text and len(article.text) > 100:
-                logger.info(f"✓ Successfully scraped with newspaper3k")
-                # Limit content length
-                content = article.text
-                if len(content) > 10000:
-                    content = content[:10000] + "..."
-                return content
-        except Exception as e:
-            logger.debug(f"Newspaper3k failed: {str(e)}")
-        return None
-    
-    def _try_cloudscraper(self, url: str) -> Optional[str]:
-        """Try scraping with cloudscraper (handles Cloudflare)."""
+    def classify_articles_batch(self, articles: List[Dict]) -> List[Optional[Tuple[List[str], Dict[str, float]]]]:
+        """Classify several articles in one request, in input order.
+        
+        Articles whose result is missing or malformed in the response are
+        classified individually with classify_article instead (None if that fails too).
+        """
+        results: List[Optional[Tuple[List[str], Dict[str, float]]]] = [None] * len(articles)
+        cache_keys = [self._classification_cache_key(article) for article in articles]
+        for i, cache_key in enumerate(cache_keys):
+            cached = self._llm_cache_get(cache_key)
+            if cached is not None:
+                results[i] = (cached["topics"], cached["confidence"])
+        # Only articles without a cached answer are sent, numbered within the request
+        pending = [i for i, result in enumerate(results) if result is None]
+        if not pending:
+            return results
+        
         try:
-            scraper = cloudscraper.create_scraper()
-            response = scraper.get(url, timeout=CONFIG["scraping"]["timeout"])
-            response.raise_for_status()
+            articles_block = "\n\n".join(
+                f"""            [Article {n}]
+            Article Title: {articles[i]['title']}
+            Article Description: {articles[i]['description']}"""
+                for n, i in enumerate(pending, 1)
+            )
+            prompt = f"""
+            Analyze each of the following {len(pending)} pharmaceutical news articles independently and identify which of these topics each one DIRECTLY and EXPLICITLY relates to.
+            Be VERY strict - only classify an article under a topic if it is clearly and directly about that specific topic.
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            content = self._extract_content_from_soup(soup)
+            Topics to consider:
+            {', '.join(CONFIG['topics'])}
             
-            if content and len(content) > 100:
-                logger.info(f"✓ Successfully scraped with cloudscraper")
-                return content
-        except Exception as e:
-            logger.debug(f"Cloudscraper failed: {str(e)}")
-        return None
-    
-    def _try_requests(self, url: str) -> Optional[str]:
-        """Try scraping with standard requests."""
-        try:
-            response = self.session.get(
-                url,
-                timeout=CONFIG["scraping"]["timeout"],
-                allow_redirects=True,
-                verify=True
-            )
-            response.raise_for_status()
+            {CLASSIFICATION_GUIDELINES}
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            content = self._extract_content_from_soup(soup)
+{articles_block}
             
-            if content and len(content) > 100:
-                logger.info(f"✓ Successfully scraped with requests")
-                return content
+            Return your response as a JSON object with one key "results": a list with exactly one entry per article, each an object with:
+            - "article": the article number shown in brackets above
+            - "topics": list of relevant topic names from the list above (empty if none)
+            - "confidence": dictionary mapping each identified topic to a confidence score (0.0-1.0)
+            
+            Only include topics with PERFECT confidence of 1.0 (100% certain).
+            If you are not 100% certain about a topic, DO NOT include it.
+            """
+            
+            response = self.client.chat.completions.create(
+                model=CONFIG["ai_settings"]["model"],
+                messages=[
+                    {"role": "system", "content": "You are a pharmaceutical industry expert who classifies news articles."},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=CONFIG["ai_settings"]["classification_temperature"],
+                response_format={"type": "json_object"}
+            )
+            
+            for entry in json.loads(response.choices[0].message.content).get("results", []):
+                try:
+                    n = int(entry["article"]) - 1
+                except (KeyError, TypeError, ValueError):
+                    continue
+                if not 0 <= n < len(pending):
+                    continue
+                i = pending[n]
+                topics = entry.get("topics", [])
+                confidence = entry.get("confidence", {})
+                if results[i] is None and isinstance(topics, list) and isinstance(confidence, dict):
+                    results[i] = (topics, confidence)
+                    self.classification_log.append(articles[i], topics, confidence)
+                    self._llm_cache_set(cache_keys[i], {"topics": topics, "confidence": confidence})
+                    
         except Exception as e:
-            logger.debug(f"Requests failed: {str(e)}")
-        return None
+            logger.error(f"Error classifying batch of {len(pending)} articles: {str(e)}")
+        
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            logger.warning(f"Batch response missing {len(missing)}/{len(pending)} articles, classifying them individually")
+            for i in missing:
+                results[i] = self.classify_article(articles[i], read_cache=False)
+        
+        return results
+    
+    def scrape_article_content(self, url: str) -> Optional[str]:
+        """Scrape the full content of an article from its URL."""
+        page = self.fetch_article_page(url)
+        if page is None:
+            return None
+        content = self._parse(extract_page, url, page)
+        if not content:
+            logger.warning(f"No article content found in {url}")
+        return content
     
-    def _try_httpx(self, url: str) -> Optional[str]:
-        """Try scraping with httpx."""
+    def fetch_article_page(self, url: str) -> Optional[str]:
+        """Get the HTML of an article page, without extracting anything from it.
+        
+        A page fetched within the page cache's freshness window is served
+        from disk. Otherwise the page is downloaded once (a conditional GET
+        when an older copy is cached), trying transports in the order that
+        has worked best for the URL's domain and skipping ones that keep
+        failing there. Only a failed download (error status, Cloudflare
+        challenge) moves on to the next transport.
+        
+        URLs that returned 404/410 before, and domains whose circuit breaker
+        is open after repeated failures, are not requested at all.
+        """
+        cached = self.page_cache.get(url) if self.page_cache is not None else None
+        if cached is not None and self.page_cache.is_fresh(cached):
+            logger.info("✓ Using cached page")
+            return cached['html']
+        
+        canonical = canonical_url(url)
+        failure = self.failed_urls.check(canonical)
+        if failure is not None:
+            logger.info(f"✗ Skipping {url}, failed permanently before ({failure['reason']})")
+            return None
+        domain = url_domain(url)
+        if not self.circuit_breaker.allow(domain):
+            logger.info(f"✗ Skipping {url}, circuit open for {domain}")
+            return None
+        
+        scrape_start = time.monotonic()
         try:
-            with httpx.Client(follow_redirects=True) as client:
-                response = client.get(
-                    url,
-                    headers=CONFIG["scraping"]["headers"],
-                    timeout=CONFIG["scraping"]["timeout"]
-                )
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.content, 'html.parser')
-                content = self._extract_content_from_soup(soup)
-                
-                if content and len(content) > 100:
-                    logger.info(f"✓ Successfully scraped with httpx")
-                    return content
-        except Exception as e:
-            logger.debug(f"Httpx failed: {str(e)}")
+            result = self._download_hedged(url, domain, PageCache.validators(cached))
+        except RateLimitTimeout:
+            # Our own throttling, not a failure of the domain
+            logger.warning(f"✗ Skipping {url}, {domain} is rate limited past the deadline")
+            return None
+        if result is not None:
+            name, response = result
+            self.circuit_breaker.record(domain, True, time.monotonic() - scrape_start)
+            if response.status_code in PERMANENT_FAILURE_STATUSES:
+                # Another transport would get the same answer
+                logger.warning(f"✗ {url} returned HTTP {response.status_code}, not retrying in future runs")
+                self.failed_urls.add(canonical, f"HTTP {response.status_code}", time.monotonic() - scrape_start)
+                return None
+            if response.status_code == 304 and cached is not None:
+                logger.info("✓ Cached page still current")
+                html = cached['html']
+                self._page_cache_call('refresh', url, cached)
+            else:
+                html = response.text
+                self._page_cache_call('store', url, html, response.headers)
+            logger.info(f"✓ Downloaded with {name}")
+            return html
+        
+        self.circuit_breaker.record(domain, False, time.monotonic() - scrape_start)
+        logger.warning(f"All transports failed to download {url}")
         return None
     
-    def _extract_content_from_soup(self, soup: BeautifulSoup) -> Optional[str]:
-        """Extract article content from BeautifulSoup object."""
-        # Remove script and style elements
-        for script in soup(["script", "style", "noscript"]):
-            script.decompose()
-        
-        # Try different content selectors
-        content_selectors = [
-            'article',
-            '[class*="article-content"]',
-            '[class*="article-body"]',
-            '[class*="post-content"]',
-            '[class*="entry-content"]',
-            '[class*="story-body"]',
-            '[class*="content-body"]',
-            '.content',
-            'main',
-            '[role="main"]'
-        ]
+    def _download_hedged(self, url: str, domain: str, headers: Dict[str, str]) -> Optional[Tuple[str, object]]:
+        """Download a page within the per-article deadline, hedging slow transports.
         
-        for selector in content_selectors:
-            content = soup.select_one(selector)
-            if content:
-                article_content = content.get_text(separator=' ', strip=True)
-                if article_content and len(article_content) > 100:
-                    # Clean up the text
-                    article_content = ' '.join(article_content.split())
-                    
-                    # Limit content length
-                    if len(article_content) > 10000:
-                        article_content = article_content[:10000] + "..."
-                    
-                    return article_content
+        Transports start in the learned order. When the running one takes
+        longer than hedge_latency_factor times its usual successful latency
+        for the domain (or hedge_after seconds when unknown), the next one
+        starts alongside it; a failed one is replaced immediately. The first
+        usable response wins and the rest are abandoned. Returns
+        (transport, response), or None if all failed or the deadline passed.
+        RateLimitTimeout is raised when no transport got to send a request
+        because the host's rate limit outlasted the deadline.
+        """
+        scraping_config = CONFIG["scraping"]
+        deadline = time.monotonic() + scraping_config.get('article_deadline', 45)
+        transports = {
+            # Default order: the pooled requests session, cloudscraper for
+            # Cloudflare-protected sites, then httpx as last resort
+            'requests': self._fetch_with_requests,
+            'cloudscraper': self._fetch_with_cloudscraper,
+            'httpx': self._fetch_with_httpx,
+        }
+        pending = self.scraper_stats.order(domain, list(transports))
+        running = {}
+        rate_limited = []
         
-        # Fallback to body if no specific content found
-        if soup.body:
-            article_content = soup.body.get_text(separator=' ', strip=True)
-            article_content = ' '.join(article_content.split())
-            
-            if len(article_content) > 500:  # Only use body if substantial content
-                if len(article_content) > 10000:
-                    article_content = article_content[:10000] + "..."
-                return article_content
+        def attempt(name: str, timeout: float):
+            start = time.monotonic()
+            try:
+                # The deadline also bounds waiting on the host's rate limit, so an abandoned attempt frees its thread
+                response = transports[name](url, headers, timeout, deadline)
+            except RateLimitTimeout as e:
+                # Not the transport's fault, so its success rate is left alone
+                logger.debug(f"{name} gave up on {url}: {e}")
+                rate_limited.append(e)
+                return None
+            self.scraper_stats.record(domain, name, response is not None, time.monotonic() - start)
+            return response
+        
+        def launch() -> float:
+            """Start the next transport; return how long to wait before hedging it."""
+            name = pending.pop(0)
+            # No single request may outlive the article's deadline
+            timeout = max(0.1, min(scraping_config["timeout"], deadline - time.monotonic()))
+            running[self._scrape_pool.submit(attempt, name, timeout)] = name
+            typical = self.scraper_stats.typical_latency(domain, name)
+            if typical:
+                return typical * scraping_config.get('hedge_latency_factor', 2)
+            return scraping_config.get('hedge_after', 5)
         
+        hedge_delay = launch()
+        while running:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                with self._stats_lock:
+                    self.total_scrape_deadlines_exceeded += 1
+                logger.warning(f"✗ Content deadline exceeded for {url}")
+                break
+            done, _ = wait(running, timeout=min(remaining, hedge_delay) if pending else remaining,
+                           return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                response = future.result()
+                if response is not None:
+                    for other in running:
+                        other.cancel()
+                    return name, response
+            if pending and time.monotonic() < deadline:
+                if not done:
+                    with self._stats_lock:
+                        self.total_hedged_scrapes += 1
+                    logger.info(f"Hedging slow download of {url} with {pending[0]}")
+                hedge_delay = launch()
+        for future in running:
+            future.cancel()
+        if not running and len(rate_limited) == len(transports) - len(pending):
+            raise rate_limited[-1]
         return None
     
+    def _scrape_guard_stats(self) -> Dict:
+        return {
+            "open_circuits": self.circuit_breaker.open_domains(),
+            "scrapes_skipped_open_circuit": self.circuit_breaker.skipped,
+            "scrapes_skipped_failed_url": self.failed_urls.skipped,
+            "estimated_seconds_saved": round(self.circuit_breaker.seconds_saved + self.failed_urls.seconds_saved, 1),
+            "hedged_downloads": self.total_hedged_scrapes,
+            "article_deadlines_exceeded": self.total_scrape_deadlines_exceeded,
+        }
+    
+    def _parse(self, func, *args):
+        """Run a content_extraction function in the parse process pool, if one is up."""
+        if self._parse_pool is not None:
+            try:
+                return self._parse_pool.submit(func, *args).result()
+            except Exception as e:
+                logger.error(f"Parse worker failed, parsing in-process: {e}")
+        return func(*args)
+    
+    def _page_cache_call(self, method: str, *args):
+        """Update the page cache without letting a disk error fail the scrape."""
+        if self.page_cache is None:
+            return
+        try:
+            getattr(self.page_cache, method)(*args)
+        except Exception as e:
+            logger.error(f"Error updating page cache: {e}")
+    
+    def _is_challenge_page(self, html: str) -> bool:
+        """Detect anti-bot interstitials served with a 200 status."""
+        head = html[:5000]
+        return any(marker in head for marker in CHALLENGE_MARKERS)
+    
+    def _download(self, client: str, url: str, headers: Dict[str, str], timeout: float,
+                  deadline: Optional[float] = None, **kwargs):
+        """GET a page through a pooled client.
+        
+        Returns None on a transient failure (error status, challenge page),
+        so the next transport is tried; permanent failures are returned as is.
+        RateLimitTimeout is raised when the host's rate limit would outlast the deadline.
+        """
+        try:
+            response = self.http.get(client, url, deadline=deadline, headers=headers, timeout=timeout, **kwargs)
+            if response.status_code in PERMANENT_FAILURE_STATUSES:
+                return response
+            response.raise_for_status()
+            if response.status_code == 304 or not self._is_challenge_page(response.text):
+                return response
+            logger.debug(f"{client} got a challenge page for {url}")
+        except RateLimitTimeout:
+            raise
+        except Exception as e:
+            logger.debug(f"{client} failed: {str(e)}")
+        return None
+    
+    def _fetch_with_requests(self, url: str, headers: Dict[str, str], timeout: float,
+                             deadline: Optional[float] = None):
+        """Download with the pooled requests session."""
+        return self._download('requests', url, headers, timeout, deadline, allow_redirects=True, verify=True)
+    
+    def _fetch_with_cloudscraper(self, url: str, headers: Dict[str, str], timeout: float,
+                                 deadline: Optional[float] = None):
+        """Download with cloudscraper (handles Cloudflare)."""
+        return self._download('cloudscraper', url, headers, timeout, deadline)
+    
+    def _fetch_with_httpx(self, url: str, headers: Dict[str, str], timeout: float,
+                          deadline: Optional[float] = None):
+        """Download with httpx."""
+        return self._download('httpx', url, headers, timeout, deadline)
+    
     def generate_summary(self, article: Dict, full_content: Optional[str]) -> str:
         """Generate a summary of the article using AI."""
+        content_to_summarize = full_content if full_content else article['description']
+        cache_key = make_key(
+            "summary", SUMMARY_PROMPT_VERSION, CONFIG["ai_settings"]["model"],
+            CONFIG["ai_settings"]["summary_temperature"], CONFIG["ai_settings"]["max_summary_tokens"],
+            article['title'], content_to_summarize
+        )
+        cached = self._llm_cache_get(cache_key)
+        if cached is not None:
+            return cached
         try:
-            content_to_summarize = full_content if full_content else article['description']
             
             prompt = f"""
             Create a concise summary of this pharmaceutical news article for industry professionals.
@@ -489,175 +1088,627 @@ class PharmaNewsMonitor:
                 max_tokens=CONFIG["ai_settings"]["max_summary_tokens"]
             )
             
-            return response.choices[0].message.content.strip()
+            summary = response.choices[0].message.content.strip()
+            self._llm_cache_set(cache_key, summary)
+            return summary
             
         except Exception as e:
             logger.error(f"Error generating summary for '{article['title']}': {str(e)}")
             return article['description']
     
-    def save_processed_articles(self, articles: List[Dict]) -> str:
-        """Save all processed articles to a single JSON file."""
-        # Generate unique filename for this run
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"pharma_news_{timestamp}.json"
-        filepath = self.data_dir / filename
-        
-        # Create output structure
-        unique_articles = self.total_articles_fetched - self.total_duplicates_skipped
-        output_data = {
+    def _run_header(self) -> Dict:
+        """Run statistics written ahead of the articles in the run file."""
+        classified = len(self.run_output)
+        unique_articles = self.total_articles_fetched - self.total_duplicates_skipped - self.total_near_duplicates
+        return {
             "run_timestamp": datetime.now().isoformat(),
             "total_articles_fetched": self.total_articles_fetched,
             "total_duplicates_skipped": self.total_duplicates_skipped,
+            "total_near_duplicates": self.total_near_duplicates,
             "total_unique_articles": unique_articles,
-            "total_articles_classified": len(articles),
+            "total_articles_classified": classified,
             "total_articles_discarded": self.total_articles_discarded,
-            "classification_rate": f"{(len(articles) / unique_articles * 100):.1f}%" if unique_articles > 0 else "0%",
+            "total_classification_errors": self.total_classification_errors,
+            "classification_rate": f"{(classified / unique_articles * 100):.1f}%" if unique_articles > 0 else "0%",
             "configuration": {
                 "feeds": [feed["name"] for feed in CONFIG["rss_feeds"]],
                 "topics_monitored": len(CONFIG["topics"]),
                 "classification_threshold": CONFIG.get("ai_settings", {}).get("classification_threshold", 0.7)
             },
-            "articles": articles
+            "prefilter": self.prefilter_stats.to_dict() if self.prefilter_stats else None,
+            "llm_cache": self._llm_cache_stats(),
+            "cascade": {
+                "enabled": self.cascade is not None,
+                "classified_locally": self.total_classified_locally,
+                "classified_by_llm": self.total_classified_by_llm
+            },
+            "http_pool": self.http.stats(),
+            "page_cache": self.page_cache.stats() if self.page_cache is not None else None,
+            "scrape_guards": self._scrape_guard_stats()
         }
+    
+    def _output_options(self) -> Dict:
+        """Durability settings shared by the run output and the run journal."""
+        output_config = CONFIG.get('output', {})
+        return {
+            'fsync_every': output_config.get('fsync_every', 5),
+            'fsync_interval': output_config.get('fsync_interval_seconds', 10)
+        }
+    
+    def _new_run_output(self, timestamp: Optional[str] = None) -> RunOutput:
+        """Streaming writer for a new run, or reopened for the run with this timestamp."""
+        return RunOutput(
+            self.data_dir,
+            timestamp,
+            compression=CONFIG.get('output', {}).get('compression', 'gzip'),
+            **self._output_options()
+        )
+    
+    def _finalize_run_output(self, output: RunOutput, header: Dict) -> str:
+        """Write the run file and its article store copy, then drop the partial file."""
+        filepath = output.finalize(header)
+        logger.info(f"Saved {len(output)} articles to {filepath}")
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, ensure_ascii=False, indent=2)
-            
-        logger.info(f"Saved {len(articles)} articles to {filepath}")
+        # Indexed copy for readers, written in one transaction
+        store_path = Path(CONFIG.get('article_store', {}).get('path', 'data/articles.db'))
+        try:
+            store = ArticleStore(store_path)
+            try:
+                if not store.has_run(header["run_timestamp"]):
+                    store.save_run(header, str(filepath), articles=output.iter_records())
+            finally:
+                store.close()
+            logger.info(f"Stored run in {store_path}")
+        except Exception as e:
+            logger.error(f"Error writing article store: {e}")
+        output.discard()
         return str(filepath)
     
-    def process_articles(self, articles: List[Dict]) -> List[Dict]:
-        """Process all articles: classify first, then scrape and summarize only classified articles."""
-        classified_articles = []
-        discarded_count = 0
-        
-        # Phase 1: Classification (fast, no web scraping)
-        logger.info(f"\n=== Phase 1: Classifying {len(articles)} articles ===")
-        for i, article in enumerate(articles):
-            logger.info(f"Classifying {i+1}/{len(articles)}: {article['title'][:80]}...")
-            
-            # Classify based on RSS title and description only
-            topics, confidence_scores = self.classify_article(article)
-            
-            if topics:
-                logger.info(f"✓ Classified with topics: {', '.join(topics)}")
-                classified_articles.append({
-                    'article': article,
-                    'topics': topics,
-                    'confidence_scores': confidence_scores
-                })
-            else:
-                logger.debug(f"✗ No relevant topics found, discarding article")
-                discarded_count += 1
+    def save_processed_articles(self) -> str:
+        """Finish this run's output file from the articles streamed to disk."""
+        return self._finalize_run_output(self.run_output, self._run_header())
+    
+    def _recover_interrupted_runs(self, keep: Optional[str] = None):
+        """Turn partial files left by crashed runs into run files, so their articles are kept.
         
-        logger.info(f"\nClassification complete: {len(classified_articles)} relevant, {discarded_count} discarded")
-        self.total_articles_discarded = discarded_count
+        keep is the timestamp of a run being resumed, whose partial file is left alone.
+        """
+        for partial_path in find_interrupted(self.data_dir):
+            try:
+                output = self._new_run_output(partial_timestamp(partial_path))
+                if output.timestamp == keep:
+                    continue
+                if output.final_path.exists() or not len(output):
+                    # Crashed after writing the run file, or before the first article
+                    output.discard()
+                    continue
+                logger.info(f"Recovering {len(output)} articles from interrupted run {partial_path.name}")
+                self._finalize_run_output(output, interrupted_header(output))
+            except Exception as e:
+                logger.error(f"Error recovering {partial_path.name}: {e}")
+    
+    def _start_run(self, resume: bool) -> Optional[Dict]:
+        """Open the run output and journal, resuming the last unfinished run if asked to.
         
-        if not classified_articles:
-            logger.info("No articles matched the classification criteria.")
-            return []
+        Returns the replayed journal when a run is resumed past feed fetching,
+        otherwise None (the feeds are fetched as usual).
+        """
+        options = self._output_options()
+        unfinished = find_unfinished(self.data_dir)
+        resume_path = unfinished[-1] if resume and unfinished else None
+        if resume and resume_path is None:
+            logger.info("No unfinished run to resume, starting a new one")
+        for path in unfinished:
+            if path != resume_path:
+                logger.warning(f"Run {journal_timestamp(path)} was interrupted and not resumed, keeping its finished articles")
+                RunJournal(self.data_dir, journal_timestamp(path)).discard()
+        timestamp = journal_timestamp(resume_path) if resume_path else None
+        self._recover_interrupted_runs(keep=timestamp)
         
-        # Phase 2: Scraping and summarization (only for classified articles)
-        logger.info(f"\n=== Phase 2: Processing {len(classified_articles)} classified articles ===")
-        processed_articles = []
+        if resume_path is None:
+            self.run_output = self._new_run_output()
+            self.journal = RunJournal(self.data_dir, self.run_output.timestamp, **options)
+            return None
         
-        for i, item in enumerate(classified_articles):
-            article = item['article']
-            topics = item['topics']
-            confidence_scores = item['confidence_scores']
+        self.journal = RunJournal(self.data_dir, timestamp, **options)
+        state = self.journal.replay()
+        self.run_output = self._new_run_output(timestamp)
+        if state['feeds'] is not None:
+            self.feed_cache = state['feeds']['feed_cache']
+            self.total_articles_fetched = state['feeds']['total_articles_fetched']
+            self.total_duplicates_skipped = state['feeds']['total_duplicates_skipped']
+            self.total_near_duplicates = state['feeds']['total_near_duplicates']
+            self.pending_high_water = state['feeds'].get('pending_high_water', {})
+        if self.run_output.final_path.exists():
+            # Stopped after saving its articles: only the feed state was left to save
+            logger.info(f"Run {timestamp} already saved {self.run_output.final_path}, finishing it")
+            for seq in state['classification_error']:
+                self._record_classification_error(state['fetched'][seq]['article'])
+            self._advance_high_water()
+            self._save_feed_cache()
+            self.journal.discard()
+            self.run_output = self._new_run_output()
+            self.journal = RunJournal(self.data_dir, self.run_output.timestamp, **options)
+            return None
+        if state['feeds'] is None:
+            logger.info(f"Resuming run {timestamp} from the start: it stopped while fetching feeds")
+            return None
+        logger.info(f"Resuming run {timestamp}: {len(state['fetched'])} articles, {len(state['classified'])} classified, "
+                    f"{len(state['content'])} with content, {len(self.run_output)} saved")
+        return state
+    
+    def _journal_fetched(self, articles: List[Dict]):
+        """Record the articles to process, then the feed state that produced them."""
+        for seq, article in enumerate(articles):
+            self.journal.record('fetched', seq=seq, article=article)
+        # Written last: its presence means the article list is complete
+        self.journal.record(
+            'feeds',
+            feed_cache=self.feed_cache,
+            total_articles_fetched=self.total_articles_fetched,
+            total_duplicates_skipped=self.total_duplicates_skipped,
+            total_near_duplicates=self.total_near_duplicates,
+            pending_high_water=self.pending_high_water
+        )
+        self.journal.sync()
+    
+    def _journal(self, stage: str, **data):
+        if self.journal is not None:
+            self.journal.record(stage, **data)
+    
+    def _mark_processed(self, article: Dict):
+        """Mark an article and its syndicated copies as seen, durably, for future deduplication."""
+        self._mark_as_seen(article)
+        for source in article.get('duplicate_sources', []):
+            self._mark_as_seen(source)
+        self.seen_articles.flush()
+        if 'fingerprint' in article:
+            self.near_duplicates.add(
+                article['fingerprint'],
+                article_id=self._generate_article_id(article),
+                title=article['title'],
+                source_feed=article['source_feed']
+            )
+    
+    def _apply_prefilter(self, articles: List[Dict]) -> Tuple[List[Dict], Dict[int, bool]]:
+        """Drop articles with no plausible topic phrase, keeping an audit sample.
+        
+        Returns the articles to send to the LLM and, keyed by id(), whether the
+        prefilter matched each of them (for recall reporting).
+        """
+        if self.prefilter is None:
+            return articles, {}
+        
+        shadow = self.prefilter_stats.mode == 'shadow'
+        to_classify = []
+        matched = {}
+        for article in articles:
+            matches = self.prefilter.match(article)
+            # Shadow mode and a random audit sample still go to the LLM so recall can be measured
+            audited = not matches and not shadow and random.random() < self.prefilter_stats.audit_sample_rate
+            dropped = not matches and not shadow and not audited
+            self.prefilter_stats.record_check(dropped, audited)
+            if dropped:
+                logger.debug(f"✗ Prefilter found no topic phrases, discarding: {article['title'][:80]}")
+                self._journal('classified', seq=article['seq'], topics=[], confidence_scores={}, classified_by='prefilter')
+                with self._stats_lock:
+                    self.total_articles_discarded += 1
+                continue
+            matched[id(article)] = bool(matches)
+            to_classify.append(article)
+        return to_classify, matched
+    
+    def _classify_stage(self, articles: List[Dict]) -> List[Optional[Dict]]:
+        """Pipeline stage: classify a batch on title/description, dropping irrelevant articles."""
+        articles, prefilter_matched = self._apply_prefilter(articles)
+        
+        # Confident cases are decided by the local model; only the rest reach the LLM
+        local_decisions = {}
+        if self.cascade is not None:
+            for article in articles:
+                decision = self.cascade.decide(article)
+                if decision is not None:
+                    local_decisions[id(article)] = decision
+        llm_articles = [article for article in articles if id(article) not in local_decisions]
+        with self._stats_lock:
+            self.total_classified_locally += len(local_decisions)
+            self.total_classified_by_llm += len(llm_articles)
+        
+        llm_results = []
+        if len(llm_articles) > 1:
+            llm_results = self.classify_articles_batch(llm_articles)
+        elif llm_articles:
+            llm_results = [self.classify_article(llm_articles[0])]
+        
+        if self.prefilter_stats is not None:
+            for article, result in zip(llm_articles, llm_results):
+                if result is not None:
+                    self.prefilter_stats.record_llm_result(article, prefilter_matched[id(article)], result[0])
+        
+        llm_decisions = {id(article): result for article, result in zip(llm_articles, llm_results)}
+        classifications = [
+            local_decisions[id(article)] if id(article) in local_decisions else llm_decisions[id(article)]
+            for article in articles
+        ]
+        
+        items = []
+        for article, result in zip(articles, classifications):
+            if result is None:
+                # Not a discard: journaled apart so a resumed run retries it
+                self._journal('classification_error', seq=article['seq'])
+                self._record_classification_error(article)
+                items.append(None)
+                continue
+            topics, confidence_scores = result
+            classified_by = 'local' if id(article) in local_decisions else 'llm'
+            self._journal('classified', seq=article['seq'], topics=topics, confidence_scores=confidence_scores,
+                          classified_by=classified_by)
+            if not topics:
+                logger.debug(f"✗ No relevant topics found, discarding: {article['title'][:80]}")
+                with self._stats_lock:
+                    self.total_articles_discarded += 1
+                items.append(None)
+                continue
             
-            logger.info(f"\nProcessing {i+1}/{len(classified_articles)}: {article['title'][:80]}...")
-            logger.info(f"Topics: {', '.join(topics)}")
+            logger.info(f"✓ Classified with topics: {', '.join(topics)} - {article['title'][:80]}")
+            items.append({
+                'seq': article['seq'],
+                'classified_by': classified_by,
+                'article': article,
+                'topics': topics,
+                'confidence_scores': confidence_scores
+            })
+        return items
+    
+    def _record_classification_error(self, article: Dict):
+        """Count an article that could not be classified and hold back its feed's high-water mark."""
+        with self._stats_lock:
+            self.total_classification_errors += 1
+            self.classification_errors.setdefault(article['feed_url'], []).append(article.get('published_at'))
+    
+    def _stage_failed(self, name: str, items: List[Dict]):
+        """Treat the items a pipeline stage raised on like classification errors, so they are fetched again."""
+        for item in items:
+            try:
+                if name == 'classify':
+                    self._journal('classification_error', seq=item['seq'])
+                    self._record_classification_error(item)
+                else:
+                    self._record_classification_error(item['article'])
+            except Exception as e:
+                logger.error(f"Error recording {name} stage failure: {str(e)}")
+    
+    def _content_stage(self, item: Dict) -> Dict:
+        """Pipeline stage: get full content from the RSS payload, or download the page."""
+        article = item['article']
+        full_content = None
+        
+        # First check if RSS feed already has full content
+        if article.get('full_content_rss'):
+            # Clean HTML from RSS content
+            rss_content = self._parse(html_to_text, article['full_content_rss'])
             
-            # Try to get full content
-            full_content = None
+            if len(rss_content) > 500:  # Substantial content
+                full_content = rss_content
+                logger.info("✓ Using full content from RSS feed")
+        
+        # If no RSS content, download the page for the parse stage
+        if not full_content and article['link']:
+            logger.info(f"Scraping full content from: {article['link']}")
+            item['page'] = self.fetch_article_page(article['link'])
+        
+        item['full_content'] = full_content
+        return item
+    
+    def _parse_stage(self, item: Dict) -> Dict:
+        """Pipeline stage: extract article text from a downloaded page in a worker process."""
+        if 'page' not in item:
+            self._journal('content', seq=item['seq'], full_content=item['full_content'])
+            return item
+        page = item.pop('page')
+        link = item['article']['link']
+        if page is not None:
+            item['full_content'] = self._parse(extract_page, link, page)
+            if not item['full_content']:
+                logger.warning(f"No article content found in {link}")
+        if item['full_content']:
+            logger.info("✓ Successfully scraped full content")
+        else:
+            logger.warning("✗ Failed to scrape full content, will use RSS description")
+        self._journal('content', seq=item['seq'], full_content=item['full_content'])
+        return item
+    
+    def _summarize_stage(self, item: Dict) -> Dict:
+        """Pipeline stage: summarize and attach the record to persist."""
+        article = item['article']
+        full_content = item['full_content']
+        
+        # Generate summary (using full content if available, otherwise RSS description)
+        logger.info(f"Generating AI summary: {article['title'][:80]}")
+        summary = self.generate_summary(article, full_content)
+        
+        # Prepare data for storage
+        item['record'] = {
+            "id": self._generate_article_id(article),
+            "title": article['title'],
+            "original_description": article['description'],
+            "summary": summary,
+            "link": article['link'],
+            "topics": item['topics'],
+            "confidence_scores": item['confidence_scores'],
+            "classified_by": item['classified_by'],
+            "date_published": article['published'],
+            "date_processed": datetime.now().isoformat(),
+            "source_feed": article['source_feed'],
+            "also_reported_by": article.get('duplicate_sources', []),
+            "has_full_content": full_content is not None
+        }
+        # Full page text is no longer needed once summarized
+        del item['full_content']
+        return item
+    
+    def _start_stage(self, name: str, func, in_queue: queue.Queue, out_queue: Optional[queue.Queue],
+                     workers: int, batch_size: int = 0) -> List[threading.Thread]:
+        """Start worker threads that apply func to items from in_queue until a stop marker.
+        
+        With batch_size > 0, func receives a list of up to batch_size items and
+        returns a list of results; otherwise it is called with one item. Items
+        func raises on are dropped and recorded as errors.
+        """
+        def worker():
+            stopping = False
+            while not stopping:
+                item = in_queue.get()
+                if item is _STAGE_DONE:
+                    return
+                batch = [item]
+                while len(batch) < batch_size:
+                    try:
+                        item = in_queue.get(timeout=BATCH_FILL_TIMEOUT)
+                    except queue.Empty:
+                        break
+                    if item is _STAGE_DONE:
+                        # This worker's stop marker: finish the partial batch, then exit
+                        stopping = True
+                        break
+                    batch.append(item)
+                try:
+                    results = func(batch) if batch_size else [func(batch[0])]
+                except Exception as e:
+                    logger.error(f"Error in {name} stage: {str(e)}")
+                    self._stage_failed(name, batch)
+                    continue
+                for result in results:
+                    if result is not None and out_queue is not None:
+                        out_queue.put(result)
+        
+        threads = [
+            threading.Thread(target=worker, name=f"{name}-{i}", daemon=True)
+            for i in range(max(1, workers))
+        ]
+        for thread in threads:
+            thread.start()
+        return threads
+    
+    def process_articles(self, articles: List[Dict], resume_state: Optional[Dict] = None) -> int:
+        """Process articles through a streaming classify → content → summarize → persist pipeline.
+        
+        Stages are connected by bounded queues so they overlap: an article can be
+        summarized while later ones are still being classified, and at most
+        queue_size articles are waiting between any two stages. Processed
+        articles are appended to self.run_output; returns how many there are.
+        
+        With resume_state (a replayed journal), articles enter the pipeline after
+        the last stage they completed, and saved articles are skipped.
+        """
+        pipeline_config = CONFIG.get('pipeline', {})
+        processing_config = CONFIG.get('processing', {})
+        queue_size = pipeline_config.get('queue_size', 10)
+        if self.run_output is None:
+            self.run_output = self._new_run_output()
+        self.total_articles_discarded = 0
+        classified = resume_state['classified'] if resume_state else {}
+        content = resume_state['content'] if resume_state else {}
+        saved = self.run_output.stored_seqs()
+        for seq in saved:
+            # The crashed run only kept these marks in memory
+            self._mark_processed(articles[seq])
+        
+        # LLM stages only fan out when parallel_classification is enabled
+        if processing_config.get('parallel_classification', False):
+            classify_workers = processing_config.get('max_classification_workers', 5)
+            summarize_workers = pipeline_config.get('summarize_workers', classify_workers)
+        else:
+            classify_workers = summarize_workers = 1
+        
+        def persist(item: Dict):
+            self.run_output.append(item['seq'], item['record'])
+            article = item['article']
+            self._mark_processed(article)
+            logger.info(f"✓ Processed {len(self.run_output)}: {article['title'][:80]}")
+        
+        # HTML parsing is CPU-bound, so it runs in worker processes sized to the cores
+        parse_workers = pipeline_config.get('parse_workers') or os.cpu_count() or 1
+        # Forking with the scrape and stage threads running can copy a held lock into
+        # a worker and deadlock it, so workers start from a clean process instead
+        self._parse_pool = ProcessPoolExecutor(max_workers=parse_workers, mp_context=_parse_pool_context())
+        
+        # Classification always takes batches; a batch of one uses the single-article prompt
+        batch_size = max(1, processing_config.get('batch_classification_size', 1))
+        stages = [
+            ('classify', self._classify_stage, classify_workers, batch_size),
+            ('content', self._content_stage, pipeline_config.get('content_workers', 1), 0),
+            # Threads only wait on the process pool, so one per parse process
+            ('parse', self._parse_stage, parse_workers, 0),
+            ('summarize', self._summarize_stage, summarize_workers, 0),
+            # Single writer so persisting and dedup marking need no locking
+            ('persist', persist, 1, 0),
+        ]
+        logger.info(f"\n=== Processing {len(articles)} articles: "
+                    + " → ".join(f"{name} x{max(1, workers)}" for name, _, workers, _ in stages) + " ===")
+        
+        try:
+            queues = [queue.Queue(maxsize=queue_size) for _ in stages]
+            stage_threads = []
+            for i, (name, func, workers, stage_batch_size) in enumerate(stages):
+                out_queue = queues[i + 1] if i + 1 < len(queues) else None
+                stage_threads.append(self._start_stage(name, func, queues[i], out_queue, workers, stage_batch_size))
             
-            # First check if RSS feed already has full content
-            if article.get('full_content_rss'):
-                # Clean HTML from RSS content
-                soup = BeautifulSoup(article['full_content_rss'], 'html.parser')
-                rss_content = soup.get_text(separator=' ', strip=True)
-                rss_content = ' '.join(rss_content.split())
-                
-                if len(rss_content) > 500:  # Substantial content
-                    full_content = rss_content
-                    logger.info("✓ Using full content from RSS feed")
-            
-            # If no RSS content, try scraping
-            if not full_content and article['link']:
-                logger.info(f"Scraping full content from: {article['link']}")
-                full_content = self.scrape_article_content(article['link'])
-                if full_content:
-                    logger.info("✓ Successfully scraped full content")
-                else:
-                    logger.warning("✗ Failed to scrape full content, will use RSS description")
-            
-            # Generate summary (using full content if available, otherwise RSS description)
-            logger.info("Generating AI summary...")
-            summary = self.generate_summary(article, full_content)
-            
-            # Prepare data for storage
-            article_data = {
-                "id": self._generate_article_id(article),
-                "title": article['title'],
-                "original_description": article['description'],
-                "summary": summary,
-                "link": article['link'],
-                "topics": topics,
-                "confidence_scores": confidence_scores,
-                "date_published": article['published'],
-                "date_processed": datetime.now().isoformat(),
-                "source_feed": article['source_feed'],
-                "has_full_content": full_content is not None
-            }
+            stage_queues = {name: queues[i] for i, (name, _, _, _) in enumerate(stages)}
             
-            processed_articles.append(article_data)
-            # Mark article as seen for future deduplication
-            self._mark_as_seen(article)
+            def feed():
+                for seq, article in enumerate(articles):
+                    # Sequence number restores feed order after concurrent stages
+                    article['seq'] = seq
+                    if seq in saved:
+                        continue
+                    if seq not in classified:
+                        queues[0].put(article)
+                        continue
+                    result = classified[seq]
+                    if not result['topics']:
+                        with self._stats_lock:
+                            self.total_articles_discarded += 1
+                        continue
+                    item = {
+                        'seq': seq,
+                        'classified_by': result['classified_by'],
+                        'article': article,
+                        'topics': result['topics'],
+                        'confidence_scores': result['confidence_scores']
+                    }
+                    if seq in content:
+                        item['full_content'] = content[seq]['full_content']
+                        stage_queues['summarize'].put(item)
+                    else:
+                        stage_queues['content'].put(item)
+                # Only now may the first stage stop, so resumed items are queued ahead of every later stop marker
+                for _ in stage_threads[0]:
+                    queues[0].put(_STAGE_DONE)
             
-            # Rate limiting between web scraping
-            if i < len(classified_articles) - 1:  # Don't sleep after last article
-                time.sleep(CONFIG.get('scraping', {}).get('rate_limit_delay', 1))
+            feeder = threading.Thread(target=feed, name="feeder", daemon=True)
+            feeder.start()
+            
+            # Drain stage by stage: once every worker of a stage has exited, nothing
+            # more can reach the next queue, so it is safe to stop that stage too
+            for i, threads in enumerate(stage_threads):
+                for thread in threads:
+                    thread.join()
+                if i + 1 < len(stage_threads):
+                    for _ in stage_threads[i + 1]:
+                        queues[i + 1].put(_STAGE_DONE)
+            feeder.join()
+        finally:
+            # Also on errors, so no worker processes outlive the run
+            self._parse_pool.shutdown()
+            self._parse_pool = None
+        self.run_output.sync()
+        if self.journal is not None:
+            self.journal.sync()
+        
+        logger.info(f"\nProcessing complete: {len(self.run_output)} relevant, {self.total_articles_discarded} discarded")
+        if not len(self.run_output):
+            logger.info("No articles matched the classification criteria.")
             
-        return processed_articles
+        return len(self.run_output)
     
-    def run(self):
-        """Main execution method."""
+    def run(self, resume: bool = False):
+        """Main execution method; with resume, continue the last interrupted run instead of fetching."""
         logger.info("Starting Pharmaceutical News Monitor")
+        resume_state = self._start_run(resume)
         
-        # Fetch RSS feeds
-        logger.info("Fetching RSS feeds...")
-        articles = self.fetch_rss_feeds()
-        logger.info(f"Total articles fetched: {len(articles)}")
+        if resume_state is None:
+            # Fetch RSS feeds
+            logger.info("Fetching RSS feeds...")
+            articles = self.fetch_rss_feeds()
+            logger.info(f"Total articles fetched: {len(articles)}")
+            self._journal_fetched(articles)
+        else:
+            articles = [resume_state['fetched'][seq]['article'] for seq in sorted(resume_state['fetched'])]
         
         # Process articles
         logger.info("Processing articles...")
-        processed = self.process_articles(articles)
+        processed = self.process_articles(articles, resume_state)
         
         # Save all processed articles to a single file
         if processed:
-            filepath = self.save_processed_articles(processed)
+            filepath = self.save_processed_articles()
             logger.info(f"\nProcessing complete! Results saved to: {filepath}")
         else:
+            self.run_output.discard()
             logger.info("\nNo articles matched the classification criteria.")
         
         # Save the article index for future deduplication
         self._save_article_index()
+        # Only persist feed validators once the run's articles are handled,
+        # otherwise a crash would make the next run skip them as unchanged
+        self._advance_high_water()
+        self._save_feed_cache()
+        if self.llm_cache is not None:
+            self.llm_cache.prune()
+        if self.page_cache is not None:
+            self.page_cache.prune()
+        for store in (self.scraper_stats, self.circuit_breaker, self.failed_urls):
+            try:
+                store.save()
+            except Exception as e:
+                logger.error(f"Error saving {store.path.name}: {e}")
+        # Everything the run produced is saved; nothing left to resume
+        self.journal.discard()
         
         # Summary report
         logger.info("\n=== FINAL SUMMARY ===")
         logger.info(f"Total articles fetched: {self.total_articles_fetched}")
         logger.info(f"Total duplicates skipped: {self.total_duplicates_skipped}")
-        logger.info(f"Total unique articles processed: {self.total_articles_fetched - self.total_duplicates_skipped}")
-        logger.info(f"Total articles classified: {len(processed)}")
+        logger.info(f"Total near-duplicate stories grouped: {self.total_near_duplicates}")
+        unique_articles = self.total_articles_fetched - self.total_duplicates_skipped - self.total_near_duplicates
+        logger.info(f"Total unique articles processed: {unique_articles}")
+        logger.info(f"Total articles classified: {processed}")
         logger.info(f"Total articles discarded: {self.total_articles_discarded}")
-        logger.info(f"Classification rate: {len(processed)/(self.total_articles_fetched - self.total_duplicates_skipped)*100:.1f}%" if (self.total_articles_fetched - self.total_duplicates_skipped) > 0 else "N/A")
+        if self.total_classification_errors:
+            logger.warning(f"Classification errors (retried next run): {self.total_classification_errors}")
+        logger.info(f"Classification rate: {processed/unique_articles*100:.1f}%" if unique_articles > 0 else "N/A")
+        
+        if self.prefilter_stats is not None:
+            stats = self.prefilter_stats.to_dict()
+            logger.info(f"Prefilter ({stats['mode']}): {stats['articles_dropped']}/{stats['articles_checked']} dropped, "
+                        f"estimated recall {stats['estimated_recall'] if stats['estimated_recall'] is not None else 'N/A'}")
+            for miss in stats['missed_articles']:
+                logger.warning(f"Prefilter missed LLM-positive article [{', '.join(miss['topics'])}]: {miss['title'][:80]}")
+        
+        if self.llm_cache is not None:
+            stats = self.llm_cache.stats()
+            logger.info(f"LLM cache: {stats['hits']} hits, {stats['misses']} misses, {stats['evictions']} evicted"
+                        + (" (bypassed)" if self.llm_cache_bypass else ""))
+        if self.page_cache is not None:
+            stats = self.page_cache.stats()
+            logger.info(f"Page cache: {stats['hits']} pages found on disk ({stats['revalidated']} revalidated), {stats['misses']} misses")
+        guards = self._scrape_guard_stats()
+        if guards['scrapes_skipped_open_circuit'] or guards['scrapes_skipped_failed_url'] or guards['open_circuits']:
+            logger.info(f"Circuit breakers: {guards['scrapes_skipped_open_circuit']} scrapes skipped "
+                        f"(open: {', '.join(guards['open_circuits']) or 'none'}), "
+                        f"{guards['scrapes_skipped_failed_url']} known-dead URLs skipped, "
+                        f"~{guards['estimated_seconds_saved']}s saved")
+        if guards['hedged_downloads'] or guards['article_deadlines_exceeded']:
+            logger.info(f"Scraping: {guards['hedged_downloads']} slow downloads hedged, "
+                        f"{guards['article_deadlines_exceeded']} articles hit the content deadline")
+        if self.cascade is not None:
+            logger.info(f"Cascade classifier: {self.total_classified_locally} decided locally, {self.total_classified_by_llm} sent to LLM")
+        
+        pool_stats = self.http.stats()
+        for client, pool in pool_stats['connection_pools'].items():
+            logger.info(f"HTTP pool ({client}): {pool['requests']} requests over {pool['connections_opened']} connections")
+        if pool_stats['rate_limiter']:
+            limiter = pool_stats['rate_limiter']
+            logger.info(f"Rate limiter: {limiter['hosts']} hosts, {limiter['waits']} waits totalling {limiter['total_wait_seconds']}s")
+        if pool_stats['httpx_http_versions']:
+            versions = ', '.join(f"{v}: {n}" for v, n in pool_stats['httpx_http_versions'].items())
+            logger.info(f"HTTP pool (httpx): {versions}")
+        self._scrape_pool.shutdown(wait=False)
+        self.http.close()
         
         # Print topic distribution
-        topic_counts = {}
-        for article in processed:
-            for topic in article['topics']:
-                topic_counts[topic] = topic_counts.get(topic, 0) + 1
+        topic_counts = self.run_output.topic_counts
         
         if topic_counts:
             logger.info("\nTopic distribution:")
@@ -669,6 +1720,13 @@ class PharmaNewsMonitor:
 
 def main():
     """Main entry point."""
+    parser = argparse.ArgumentParser(description="Pharmaceutical news monitor")
+    parser.add_argument("--no-llm-cache", action="store_true",
+                        help="ignore cached LLM responses for this run (fresh responses are still cached)")
+    parser.add_argument("--resume", action="store_true",
+                        help="continue the last interrupted run where it stopped instead of fetching feeds")
+    args = parser.parse_args()
+    
     # Check for API key
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
@@ -677,8 +1735,8 @@ def main():
         return
     
     # Create and run monitor
-    monitor = PharmaNewsMonitor(api_key)
-    monitor.run()
+    monitor = PharmaNewsMonitor(api_key, bypass_llm_cache=args.no_llm_cache)
+    monitor.run(resume=args.resume)
 
 
 if __name__ == "__main__":
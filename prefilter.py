@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Local keyword prefilter that runs ahead of the LLM classifier.
+
+Every configured topic has a list of trigger phrases and synonyms. All of them
+are compiled into one Aho-Corasick automaton, so an article's title and
+description are scanned once regardless of how many phrases are configured.
+Articles with no plausible phrase for any topic can be dropped before they
+cost an LLM call.
+
+Run directly to measure recall against past LLM decisions:
+
+    python prefilter.py                      # all run files in data/
+    python prefilter.py data/pharma_news_20250714_012155.json
+"""
+
+import json
+import sys
+import threading
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from near_duplicates import normalize_text
+from run_files import iter_articles, run_file_paths
+
+
+class AhoCorasick:
+    def __init__(self, patterns: List[str]):
+        """Build the automaton over the given (already normalized) patterns."""
+        self.patterns = patterns
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+        for index, pattern in enumerate(patterns):
+            self._insert(pattern, index)
+        self._build_failure_links()
+
+    def _insert(self, pattern: str, index: int):
+        state = 0
+        for char in pattern:
+            if char not in self._goto[state]:
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][char] = len(self._goto) - 1
+            state = self._goto[state][char]
+        self._output[state].append(index)
+
+    def _build_failure_links(self):
+        pending = deque(self._goto[0].values())
+        while pending:
+            state = pending.popleft()
+            for char, child in self._goto[state].items():
+                pending.append(child)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                # Children of the root always fail back to the root
+                self._fail[child] = self._goto[fallback].get(char, 0) if state else 0
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def search(self, text: str) -> set:
+        """Return indices of all patterns occurring in text."""
+        found = set()
+        state = 0
+        for char in text:
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            found.update(self._output[state])
+        return found
+
+
+def _normalize_phrase(text: str) -> str:
+    # Pad with spaces so patterns only match on whole-word boundaries
+    return f" {' '.join(normalize_text(text))} "
+
+
+class TopicPrefilter:
+    def __init__(self, topic_phrases: Dict[str, List[str]]):
+        """Compile per-topic phrase lists into a single matcher."""
+        patterns = []
+        self._pattern_topics: List[str] = []
+        for topic, phrases in topic_phrases.items():
+            # The topic name itself always counts as a trigger phrase
+            for phrase in [topic] + list(phrases):
+                normalized = _normalize_phrase(phrase)
+                if normalized.strip():
+                    patterns.append(normalized)
+                    self._pattern_topics.append(topic)
+        self._automaton = AhoCorasick(patterns)
+
+    def match(self, article: Dict) -> Dict[str, List[str]]:
+        """Map each plausibly matching topic to the phrases found for it."""
+        text = _normalize_phrase(f"{article.get('title', '')} {article.get('description', '')}")
+        matches = defaultdict(list)
+        for index in self._automaton.search(text):
+            matches[self._pattern_topics[index]].append(self._automaton.patterns[index].strip())
+        return dict(matches)
+
+
+class PrefilterStats:
+    def __init__(self, mode: str, audit_sample_rate: float):
+        """Thread-safe counters comparing prefilter decisions with the LLM's."""
+        self.mode = mode
+        self.audit_sample_rate = audit_sample_rate
+        self._lock = threading.Lock()
+        self.checked = 0
+        self.dropped = 0
+        self.audited = 0
+        self.llm_positives = 0
+        self.llm_positives_matched = 0
+        self.misses: List[Dict] = []
+
+    def record_check(self, dropped: bool, audited: bool):
+        with self._lock:
+            self.checked += 1
+            self.dropped += dropped
+            self.audited += audited
+
+    def record_llm_result(self, article: Dict, matched: bool, topics: List[str]):
+        """Record an LLM decision for an article the prefilter also saw."""
+        if not topics:
+            return
+        with self._lock:
+            self.llm_positives += 1
+            if matched:
+                self.llm_positives_matched += 1
+            else:
+                self.misses.append({"title": article.get("title", ""), "topics": topics})
+
+    def estimated_recall(self) -> Optional[float]:
+        """Share of LLM-positive articles the prefilter would let through.
+
+        In filter mode only a sample of dropped articles reaches the LLM, so
+        each audit miss stands for 1 / audit_sample_rate real misses.
+        """
+        missed = len(self.misses)
+        if self.mode != "shadow":
+            if not self.audit_sample_rate:
+                return None
+            missed = missed / self.audit_sample_rate
+        total = self.llm_positives_matched + missed
+        return self.llm_positives_matched / total if total else None
+
+    def to_dict(self) -> Dict:
+        with self._lock:
+            recall = self.estimated_recall()
+            return {
+                "mode": self.mode,
+                "articles_checked": self.checked,
+                "articles_dropped": self.dropped,
+                "dropped_articles_audited": self.audited,
+                "llm_positives": self.llm_positives,
+                "llm_positives_matched": self.llm_positives_matched,
+                "estimated_recall": round(recall, 3) if recall is not None else None,
+                "missed_articles": self.misses,
+            }
+
+
+def evaluate_history(prefilter: TopicPrefilter, files: List[Path]):
+    """Print per-topic recall of the prefilter on stored LLM-classified articles."""
+    totals = defaultdict(lambda: [0, 0])
+    misses = []
+    for path in files:
+        for article in iter_articles(path):
+            matches = prefilter.match({
+                "title": article.get("title", ""),
+                "description": article.get("original_description", ""),
+            })
+            for topic in article.get("topics", []):
+                totals[topic][0] += 1
+                if matches:
+                    totals[topic][1] += 1
+                else:
+                    misses.append((topic, article.get("title", "")))
+
+    print(f"Prefilter recall on {len(files)} run files (article passes if any topic phrase matches):")
+    for topic, (positives, passed) in sorted(totals.items()):
+        print(f"  {topic}: {passed}/{positives} ({passed / positives * 100:.1f}%)")
+    all_positives = sum(p for p, _ in totals.values())
+    all_passed = sum(p for _, p in totals.values())
+    if all_positives:
+        print(f"Overall: {all_passed}/{all_positives} ({all_passed / all_positives * 100:.1f}%)")
+    for topic, title in misses:
+        print(f"  MISSED [{topic}] {title[:100]}")
+
+
+if __name__ == "__main__":
+    with open("config.json", "r") as f:
+        config = json.load(f)
+    topic_phrases = config.get("prefilter", {}).get("topic_phrases", {})
+    prefilter = TopicPrefilter({topic: topic_phrases.get(topic, []) for topic in config["topics"]})
+    files = [Path(arg) for arg in sys.argv[1:]] or run_file_paths()
+    evaluate_history(prefilter, files)
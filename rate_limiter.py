@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Per-host token-bucket rate limiting.
+
+Each host gets its own bucket, so requests to different hosts never wait on
+each other while requests to the same host stay spaced out. A token is
+reserved under the lock and the caller sleeps outside it, which keeps waiting
+threads from blocking unrelated hosts.
+
+A Retry-After from a 429/503 response pauses the whole host until it expires.
+Callers with a deadline fail fast with RateLimitTimeout instead of sleeping
+past it, so an abandoned request does not hold its thread for minutes.
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+from scraper_stats import url_domain
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class RateLimitTimeout(Exception):
+    """Waiting for a host's rate limit would run past the caller's deadline."""
+
+
+class HostRateLimiter:
+    def __init__(self, requests_per_second: float = 0.5, burst: int = 1,
+                 domains: Optional[Dict[str, Dict]] = None, max_retry_after: float = 300):
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.domains = domains or {}
+        self.max_retry_after = max_retry_after
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, Dict] = {}
+        self.waits = 0
+        self.total_wait = 0.0
+
+    def _limits(self, domain: str):
+        # Most specific configured suffix wins, so "fiercepharma.com" covers its subdomains
+        parts = domain.split(".")
+        for i in range(len(parts)):
+            settings = self.domains.get(".".join(parts[i:]))
+            if settings is not None:
+                return (settings.get("requests_per_second", self.requests_per_second),
+                        settings.get("burst", self.burst))
+        return self.requests_per_second, self.burst
+
+    def _bucket(self, domain: str, now: float) -> Dict:
+        if domain not in self._buckets:
+            rate, burst = self._limits(domain)
+            self._buckets[domain] = {"rate": rate, "burst": burst, "tokens": float(burst),
+                                     "updated_at": now, "blocked_until": 0.0}
+        return self._buckets[domain]
+
+    def acquire(self, url: str, deadline: Optional[float] = None):
+        """Block until a request to the URL's host is allowed.
+        
+        deadline is a time.monotonic() value; if the wait would end after it,
+        RateLimitTimeout is raised at once and no token is taken.
+        """
+        domain = url_domain(url)
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._bucket(domain, now)
+            if bucket["rate"] <= 0:
+                return
+            bucket["tokens"] = min(bucket["burst"],
+                                   bucket["tokens"] + (now - bucket["updated_at"]) * bucket["rate"])
+            bucket["updated_at"] = now
+            wait = max((1 - bucket["tokens"]) / bucket["rate"], bucket["blocked_until"] - now, 0.0)
+            if deadline is not None and now + wait > deadline:
+                raise RateLimitTimeout(f"{domain} is rate limited for {wait:.1f}s, past the deadline")
+            # Reserve a token now; a negative balance is the queue of waiting callers
+            bucket["tokens"] -= 1
+            if wait > 0:
+                self.waits += 1
+                self.total_wait += wait
+        if wait > 0:
+            time.sleep(wait)
+
+    def defer(self, url: str, seconds: float):
+        """Pause all requests to the URL's host, e.g. for a Retry-After."""
+        domain = url_domain(url)
+        seconds = min(seconds, self.max_retry_after)
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._bucket(domain, now)
+            bucket["blocked_until"] = max(bucket["blocked_until"], now + seconds)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {"hosts": len(self._buckets), "waits": self.waits, "total_wait_seconds": round(self.total_wait, 1)}
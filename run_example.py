@@ -5,10 +5,9 @@ and analyze the stored data.
 """
 
 import os
-import json
-from pathlib import Path
-from datetime import datetime
-from collections import defaultdict
+
+from article_store import ArticleStore, DEFAULT_PATH, import_history
+from run_files import run_file_paths
 
 def run_monitor():
     """Run the news monitor if API key is set."""
@@ -21,97 +20,69 @@ def run_monitor():
     os.system("python pharma_news_monitor.py")
     return True
 
+def open_store():
+    """Open the article store, importing any run files it does not have yet."""
+    run_files = run_file_paths()
+    if not run_files and not DEFAULT_PATH.exists():
+        print("No stored data found. Run the monitor first.")
+        return None
+    store = ArticleStore(DEFAULT_PATH)
+    if run_files:
+        # Articles are streamed from each file, so history of any size imports in flat memory
+        import_history(store, run_files)
+    return store
+
 def analyze_stored_data():
-    """Analyze JSON files in the data directory."""
-    data_dir = Path("data")
-    if not data_dir.exists():
-        print("No data directory found. Run the monitor first.")
-        return
-    
-    json_files = list(data_dir.glob("pharma_news_*.json"))
-    if not json_files:
-        print("No data files found. Run the monitor first.")
+    """Analyze the runs and articles in the article store."""
+    store = open_store()
+    if store is None:
         return
     
-    print(f"\nAnalyzing {len(json_files)} monitoring runs...")
-    
-    # Aggregate statistics across all runs
-    topic_counts = defaultdict(int)
-    source_counts = defaultdict(int)
-    all_articles = []
-    total_fetched = 0
-    total_classified = 0
-    
-    for json_file in json_files:
-        with open(json_file, 'r') as f:
-            data = json.loads(f.read())
-            
-            # Update totals
-            total_fetched += data.get('total_articles_fetched', 0)
-            total_classified += data.get('total_articles_classified', 0)
-            
-            # Process articles from this run
-            for article in data.get('articles', []):
-                all_articles.append(article)
-                
-                # Count topics
-                for topic in article.get('topics', []):
-                    topic_counts[topic] += 1
-                
-                # Count sources
-                source_counts[article.get('source_feed', 'Unknown')] += 1
-    
-    # Display analysis
-    print(f"\nTotal articles fetched across all runs: {total_fetched}")
-    print(f"Total articles classified: {total_classified}")
-    print(f"Classification rate: {total_classified/total_fetched*100:.1f}%" if total_fetched > 0 else "N/A")
-    
-    print("\n=== TOPIC ANALYSIS ===")
-    for topic, count in sorted(topic_counts.items(), key=lambda x: x[1], reverse=True):
-        print(f"{topic}: {count} articles")
-    
-    print("\n=== SOURCE ANALYSIS ===")
-    for source, count in sorted(source_counts.items(), key=lambda x: x[1], reverse=True):
-        print(f"{source}: {count} articles")
-    
-    # Show recent high-confidence articles
-    print("\n=== RECENT HIGH-CONFIDENCE ARTICLES ===")
-    sorted_articles = sorted(all_articles, 
-                           key=lambda x: x.get('date_processed', ''), 
-                           reverse=True)[:5]
-    
-    for article in sorted_articles:
-        print(f"\nTitle: {article['title']}")
-        print(f"Topics: {', '.join(article.get('topics', []))}")
-        print(f"Link: {article['link']}")
-        if article.get('confidence_scores'):
-            max_topic = max(article['confidence_scores'].items(), 
-                          key=lambda x: x[1])
-            print(f"Highest confidence: {max_topic[0]} ({max_topic[1]:.2f})")
+    try:
+        totals = store.run_totals()
+        print(f"\nAnalyzing {totals['runs']} monitoring runs...")
+        total_fetched = totals['fetched']
+        total_classified = totals['classified']
+        
+        # Display analysis
+        print(f"\nTotal articles fetched across all runs: {total_fetched}")
+        print(f"Total articles classified: {total_classified}")
+        print(f"Classification rate: {total_classified/total_fetched*100:.1f}%" if total_fetched > 0 else "N/A")
+        
+        print("\n=== TOPIC ANALYSIS ===")
+        for topic, count in store.topic_counts():
+            print(f"{topic}: {count} articles")
+        
+        print("\n=== SOURCE ANALYSIS ===")
+        for source, count in store.source_counts():
+            print(f"{source}: {count} articles")
+        
+        # Show recent high-confidence articles
+        print("\n=== RECENT HIGH-CONFIDENCE ARTICLES ===")
+        for article in store.recent_articles(5):
+            print(f"\nTitle: {article['title']}")
+            print(f"Topics: {', '.join(article.get('topics', []))}")
+            print(f"Link: {article['link']}")
+            if article.get('confidence_scores'):
+                max_topic = max(article['confidence_scores'].items(), 
+                              key=lambda x: x[1])
+                print(f"Highest confidence: {max_topic[0]} ({max_topic[1]:.2f})")
+    finally:
+        store.close()
 
 def search_by_topic(topic_keyword):
     """Search stored articles by topic keyword."""
-    data_dir = Path("data")
-    if not data_dir.exists():
-        print("No data directory found.")
+    store = open_store()
+    if store is None:
         return
     
-    matching_articles = []
-    
-    for json_file in data_dir.glob("pharma_news_*.json"):
-        with open(json_file, 'r') as f:
-            data = json.loads(f.read())
-            
-            # Search through articles in this run
-            for article in data.get('articles', []):
-                # Check if any topic contains the keyword
-                for topic in article.get('topics', []):
-                    if topic_keyword.lower() in topic.lower():
-                        matching_articles.append(article)
-                        break
+    try:
+        total, matching_articles = store.search_by_topic(topic_keyword, limit=10)
+    finally:
+        store.close()
     
-    print(f"\nFound {len(matching_articles)} articles matching '{topic_keyword}':")
-    for article in matching_articles[:10]:  # Show first 10
+    print(f"\nFound {total} articles matching '{topic_keyword}':")
+    for article in matching_articles:  # Show first 10
         print(f"\n- {article['title']}")
         print(f"  Topics: {', '.join(article['topics'])}")
         print(f"  Date: {article.get('date_published', 'Unknown')}")
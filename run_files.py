@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""
+Reading and writing monitor run files in any of their formats.
+
+Run files are data/pharma_news_<timestamp>.json. New runs are written as
+compact JSON (no indentation), optionally compressed:
+
+- pharma_news_<timestamp>.json      plain, as older runs were written
+- pharma_news_<timestamp>.json.gz   gzip (standard library)
+- pharma_news_<timestamp>.json.zst  zstd (needs: pip install zstandard)
+
+Readers open any of them through open_run_file(), which detects compression
+from the file contents, and list history with run_file_paths().
+iter_articles() and read_header() parse a run file incrementally, one
+article at a time, so memory stays flat however large the file is;
+load_run() reads a whole file at once.
+
+    python run_files.py convert                      # rewrite history compact + gzip
+    python run_files.py convert --compression zstd data/pharma_news_20250714_012155.json
+    python run_files.py parquet data/articles.parquet   # one row per article (needs pyarrow)
+"""
+
+import argparse
+import gzip
+import io
+import json
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, IO, Iterable, Iterator, List, Optional
+
+DATA_DIR = Path("data")
+
+# File name suffix for each output.compression setting
+COMPRESSION_SUFFIXES = {None: ".json", "gzip": ".json.gz", "zstd": ".json.zst"}
+
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# Compact separators: no whitespace after , and :
+COMPACT = (",", ":")
+
+# Text read per refill by the incremental reader
+CHUNK_SIZE = 64 * 1024
+
+# Articles per Parquet row group
+PARQUET_ROW_GROUP = 10000
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+
+
+def run_file_suffix(compression: Optional[str]) -> str:
+    if compression not in COMPRESSION_SUFFIXES:
+        raise ValueError(f"Unknown run file compression: {compression}")
+    return COMPRESSION_SUFFIXES[compression]
+
+
+def _base_name(path: Path) -> str:
+    """File name without its run file suffix, e.g. pharma_news_20250714_012155."""
+    for suffix in sorted(COMPRESSION_SUFFIXES.values(), key=len, reverse=True):
+        if path.name.endswith(suffix):
+            return path.name[:-len(suffix)]
+    return path.name
+
+
+def run_file_timestamp(path: Path) -> Optional[str]:
+    """Start time in a run file's name as an ISO timestamp, or None if the name has none."""
+    try:
+        started = datetime.strptime(_base_name(path)[len("pharma_news_"):], "%Y%m%d_%H%M%S")
+    except ValueError:
+        return None
+    return started.isoformat()
+
+
+def run_file_paths(data_dir: Path = DATA_DIR) -> List[Path]:
+    """Finished run files in any format, oldest first."""
+    suffixes = tuple(COMPRESSION_SUFFIXES.values())
+    return sorted((p for p in data_dir.glob("pharma_news_*") if p.name.endswith(suffixes)), key=_base_name)
+
+
+def _zstandard():
+    try:
+        import zstandard
+    except ImportError:
+        raise RuntimeError("zstd run files need the zstandard package: pip install zstandard")
+    return zstandard
+
+
+def open_run_file(path: Path, mode: str = "r") -> IO[str]:
+    """Open a run file as text; reading detects compression, writing follows the suffix."""
+    if mode == "r":
+        with open(path, "rb") as f:
+            magic = f.read(4)
+        if magic.startswith(GZIP_MAGIC):
+            return gzip.open(path, "rt", encoding="utf-8")
+        if magic == ZSTD_MAGIC:
+            reader = _zstandard().ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True)
+            return io.TextIOWrapper(reader, encoding="utf-8")
+        return open(path, "r", encoding="utf-8")
+    if mode != "w":
+        raise ValueError(f"Unsupported mode: {mode}")
+    if path.name.endswith(".gz"):
+        return gzip.open(path, "wt", encoding="utf-8", compresslevel=6)
+    if path.name.endswith(".zst"):
+        writer = _zstandard().ZstdCompressor(level=10).stream_writer(open(path, "wb"), closefd=True)
+        return io.TextIOWrapper(writer, encoding="utf-8")
+    return open(path, "w", encoding="utf-8")
+
+
+def load_run(path: Path) -> Dict:
+    """A whole run file: header fields plus "articles"."""
+    with open_run_file(path) as f:
+        return json.load(f)
+
+
+class _JsonStream:
+    """Buffered text of a JSON document, decoded one value at a time."""
+
+    def __init__(self, f: IO[str]):
+        self.f = f
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        """Append more text, keeping only what is not consumed yet; False at end of file."""
+        if self.eof:
+            return False
+        # Read at least as much as is buffered, so re-decoding a long value stays linear
+        chunk = self.f.read(max(CHUNK_SIZE, len(self.buffer) - self.pos))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character without consuming it, or "" at end of file."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        found = self.peek()
+        if not found or found not in chars:
+            raise ValueError(f"Malformed run file: expected one of {chars!r}, found {found!r}")
+        self.pos += 1
+        return found
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number that ends with the buffer may continue in the next chunk
+            if end == len(self.buffer) and self._fill():
+                continue
+            self.pos = end
+            return value
+
+    def array(self) -> Iterator:
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.expect(",]") == "]":
+                return
+
+
+def iter_articles(path: Path, header: Optional[Dict] = None) -> Iterator[Dict]:
+    """Articles of a run file, parsed one at a time.
+    
+    If header is given, the run's other top-level fields are stored in it as
+    they are read (all of them once the iterator is exhausted).
+    """
+    with open_run_file(path) as f:
+        stream = _JsonStream(f)
+        if stream.peek() == "[":
+            # Oldest format: a bare list of articles
+            yield from stream.array()
+            return
+        stream.expect("{")
+        if stream.peek() == "}":
+            return
+        while True:
+            key = stream.value()
+            stream.expect(":")
+            if key == "articles":
+                yield from stream.array()
+            else:
+                value = stream.value()
+                if header is not None:
+                    header[key] = value
+            if stream.expect(",}") == "}":
+                return
+
+
+def read_header(path: Path) -> Dict:
+    """Top-level fields of a run file other than "articles", without keeping the articles."""
+    header = {}
+    for _ in iter_articles(path, header):
+        pass
+    return header
+
+
+def temp_path(path: Path) -> Path:
+    """Hidden sibling to write a run file to before renaming it into place."""
+    return path.with_name(f".tmp.{path.name}")
+
+
+def write_run(path: Path, header: Dict, articles: Iterable[Dict]) -> int:
+    """Stream a run file compactly to path (compressed per its suffix), replacing it atomically.
+    
+    Returns the number of articles written.
+    """
+    # Render the header as an object and reopen it to append the article list
+    head = json.dumps(header, ensure_ascii=False, separators=COMPACT)
+    tmp_path = temp_path(path)
+    count = 0
+    with open_run_file(tmp_path, "w") as f:
+        f.write(head[:-1] + ("," if header else "") + '"articles":[')
+        for article in articles:
+            f.write(("," if count else "") + json.dumps(article, ensure_ascii=False, separators=COMPACT))
+            count += 1
+        f.write("]}\n")
+    # Compressed writers do not expose the file descriptor, so sync by path
+    fd = os.open(tmp_path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+    return count
+
+
+def _timed_read(path: Path) -> float:
+    start = time.perf_counter()
+    read_header(path)
+    return time.perf_counter() - start
+
+
+def convert(paths: List[Path], compression: Optional[str]):
+    """Rewrite run files in the compact format, printing space and load time saved."""
+    suffix = run_file_suffix(compression)
+    sizes = [0, 0]
+    load_times = [0.0, 0.0]
+    for path in paths:
+        target = path.with_name(_base_name(path) + suffix)
+        size = path.stat().st_size
+        load_times[0] += _timed_read(path)
+        write_run(target, read_header(path), iter_articles(path))
+        if target != path:
+            os.remove(path)
+        sizes[0] += size
+        sizes[1] += target.stat().st_size
+        load_times[1] += _timed_read(target)
+        print(f"  ✓ {path.name} → {target.name}: {size / 1024:.0f}KB → {target.stat().st_size / 1024:.0f}KB")
+    if sizes[0]:
+        print(f"Converted {len(paths)} run files: {sizes[0] / 1024:.0f}KB → {sizes[1] / 1024:.0f}KB "
+              f"({(1 - sizes[1] / sizes[0]) * 100:.0f}% smaller), "
+              f"load time {load_times[0] * 1000:.1f}ms → {load_times[1] * 1000:.1f}ms")
+
+
+def export_parquet(paths: List[Path], out_path: Path):
+    """Write every article of the given runs to a Parquet file, one row per article."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise RuntimeError("Parquet export needs pyarrow: pip install pyarrow")
+
+    schema = pa.schema([
+        ("run_timestamp", pa.string()),
+        ("id", pa.string()),
+        ("title", pa.string()),
+        ("summary", pa.string()),
+        ("link", pa.string()),
+        ("source_feed", pa.string()),
+        ("date_published", pa.string()),
+        ("date_processed", pa.string()),
+        ("classified_by", pa.string()),
+        ("has_full_content", pa.bool_()),
+        ("topics", pa.list_(pa.string())),
+        ("confidence_scores", pa.map_(pa.string(), pa.float64())),
+        ("also_reported_by", pa.list_(pa.string())),
+    ])
+    rows = 0
+    columns = {name: [] for name in schema.names}
+
+    def flush():
+        writer.write_table(pa.table(columns, schema=schema))
+        for values in columns.values():
+            values.clear()
+
+    with pq.ParquetWriter(str(out_path), schema, compression="zstd") as writer:
+        for path in paths:
+            header = {}
+            for article in iter_articles(path, header):
+                # run_timestamp precedes the articles in every run file the monitor writes
+                columns["run_timestamp"].append(header.get("run_timestamp"))
+                for name in ("id", "title", "summary", "link", "source_feed", "date_published",
+                             "date_processed", "classified_by", "has_full_content"):
+                    columns[name].append(article.get(name))
+                columns["topics"].append(article.get("topics", []))
+                columns["confidence_scores"].append(list(article.get("confidence_scores", {}).items()))
+                columns["also_reported_by"].append([s.get("source_feed") for s in article.get("also_reported_by", [])])
+                rows += 1
+                # Bounded row groups, so memory does not grow with the history
+                if len(columns["id"]) >= PARQUET_ROW_GROUP:
+                    flush()
+        if columns["id"]:
+            flush()
+    print(f"Exported {rows} articles from {len(paths)} run files to {out_path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert and export monitor run files")
+    commands = parser.add_subparsers(dest="command", required=True)
+    convert_parser = commands.add_parser("convert", help="rewrite run files compactly, optionally compressed")
+    convert_parser.add_argument("--compression", choices=["gzip", "zstd", "none"], default="gzip")
+    convert_parser.add_argument("files", nargs="*", type=Path)
+    parquet_parser = commands.add_parser("parquet", help="export articles to a Parquet file")
+    parquet_parser.add_argument("output", type=Path)
+    parquet_parser.add_argument("files", nargs="*", type=Path)
+    args = parser.parse_args()
+
+    files = args.files or run_file_paths()
+    if args.command == "convert":
+        convert(files, None if args.compression == "none" else args.compression)
+    else:
+        export_parquet(files, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Journal of a monitor run, so an interrupted run can be resumed.
+
+data/pharma_news_<timestamp>.journal.jsonl sits next to the run's partial
+output file (see run_output.py) and records, one JSON line per step:
+
+- feeds       feed cache state and fetch counters once the feeds are read
+- fetched     each article to process, with its sequence number
+- classified  the topics (empty when discarded) for an article
+- classification_error  an article whose classification failed (retried on resume)
+- content     the full text acquired for an article (None: use the RSS description)
+
+Summarized articles are the ones in the partial output file. Lines are
+flushed when written and fsynced in batches like the output; a line torn
+by a crash is ignored, so only the article in flight is redone.
+
+The journal is deleted once the run has finished and saved its state.
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List
+
+JOURNAL_SUFFIX = ".journal.jsonl"
+
+
+class RunJournal:
+    def __init__(self, data_dir: Path, timestamp: str, fsync_every: int = 5, fsync_interval: float = 10.0):
+        self.timestamp = timestamp
+        self.path = data_dir / f"pharma_news_{timestamp}{JOURNAL_SUFFIX}"
+        self.fsync_every = max(1, fsync_every)
+        self.fsync_interval = fsync_interval
+        self._lock = threading.Lock()
+        self._file = None
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def record(self, stage: str, **data):
+        entry = json.dumps(dict(data, stage=stage), ensure_ascii=False) + "\n"
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write(entry)
+            self._file.flush()
+            self._unsynced += 1
+            if self._unsynced >= self.fsync_every or time.monotonic() - self._last_sync >= self.fsync_interval:
+                self._sync()
+
+    def _sync(self):
+        if self._file is not None and self._unsynced:
+            os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def sync(self):
+        with self._lock:
+            self._sync()
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._sync()
+                self._file.close()
+                self._file = None
+
+    def discard(self):
+        """Remove the journal once the run no longer needs resuming."""
+        self.close()
+        if self.path.exists():
+            os.remove(self.path)
+
+    def replay(self) -> Dict:
+        """Everything recorded so far: feeds state plus fetched, classified, content and errors by seq.
+        
+        A line torn by a crash is cut off so appending can resume after it;
+        that step is simply done again.
+        """
+        state = {"feeds": None, "fetched": {}, "classified": {}, "content": {}, "classification_error": {}}
+        if not self.path.exists():
+            return state
+        good_size = 0
+        with open(self.path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break
+                good_size += len(line)
+                stage = entry.pop("stage")
+                if stage == "feeds":
+                    state["feeds"] = entry
+                else:
+                    state[stage][entry.pop("seq")] = entry
+        if good_size < self.path.stat().st_size:
+            with open(self.path, "r+b") as f:
+                f.truncate(good_size)
+        return state
+
+
+def find_unfinished(data_dir: Path) -> List[Path]:
+    """Journals of runs that did not finish, oldest first."""
+    return sorted(data_dir.glob(f"pharma_news_*{JOURNAL_SUFFIX}"))
+
+
+def journal_timestamp(path: Path) -> str:
+    return path.name[len("pharma_news_"):-len(JOURNAL_SUFFIX)]
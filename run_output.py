@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Crash-safe, streaming output of a monitor run.
+
+Each article is appended to data/pharma_news_<timestamp>.partial.jsonl as
+soon as it is summarized, one JSON object per line, so articles do not pile
+up in memory and a crash only loses the article in flight:
+
+- every line is flushed to the OS when written (survives a process crash)
+- the file is fsynced every fsync_every articles or fsync_interval seconds
+  (bounds what a power loss can take)
+
+At the end of the run, finalize() streams the header, statistics and the
+articles (back in feed order) into the run file, pharma_news_<timestamp>.json
+(compact, with .gz/.zst appended when compressed; see run_files.py),
+written to a temporary file and renamed into place; discard() then removes
+the partial file. A partial file left behind by an interrupted run is picked
+up again when that run is resumed (see run_journal.py); otherwise the next
+run finalizes it with "interrupted": true in its header.
+"""
+
+import json
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from run_files import run_file_suffix, write_run
+
+PARTIAL_SUFFIX = ".partial.jsonl"
+
+
+class RunOutput:
+    def __init__(self, data_dir: Path, timestamp: Optional[str] = None, fsync_every: int = 5,
+                 fsync_interval: float = 10.0, compression: Optional[str] = None):
+        self.timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.partial_path = data_dir / f"pharma_news_{self.timestamp}{PARTIAL_SUFFIX}"
+        self.final_path = data_dir / f"pharma_news_{self.timestamp}{run_file_suffix(compression)}"
+        self.fsync_every = max(1, fsync_every)
+        self.fsync_interval = fsync_interval
+        # Position of each article line by sequence number; the records stay on disk
+        self._index: List[Tuple[int, int, int]] = []
+        self.topic_counts: Dict[str, int] = {}
+        self._file = None
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        if self.partial_path.exists():
+            self._reload()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def _reload(self):
+        """Index the articles already in the partial file, dropping a line cut short by a crash."""
+        good_size = 0
+        with open(self.partial_path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break
+                self._track(entry["seq"], good_size, len(line), entry["article"])
+                good_size += len(line)
+        if good_size < self.partial_path.stat().st_size:
+            with open(self.partial_path, "r+b") as f:
+                f.truncate(good_size)
+
+    def stored_seqs(self) -> Set[int]:
+        """Sequence numbers of the articles already written."""
+        return {seq for seq, _, _ in self._index}
+
+    def _track(self, seq: int, offset: int, length: int, record: Dict):
+        self._index.append((seq, offset, length))
+        for topic in record.get("topics", []):
+            self.topic_counts[topic] = self.topic_counts.get(topic, 0) + 1
+
+    def append(self, seq: int, record: Dict):
+        """Write one processed article; seq is its position in the feed order."""
+        line = (json.dumps({"seq": seq, "article": record}, ensure_ascii=False) + "\n").encode("utf-8")
+        if self._file is None:
+            self._file = open(self.partial_path, "ab")
+        offset = self._file.tell()
+        self._file.write(line)
+        self._file.flush()
+        self._track(seq, offset, len(line), record)
+        self._unsynced += 1
+        if self._unsynced >= self.fsync_every or time.monotonic() - self._last_sync >= self.fsync_interval:
+            self.sync()
+
+    def sync(self):
+        """Make every appended article durable."""
+        if self._file is not None and self._unsynced:
+            os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def close(self):
+        if self._file is not None:
+            self.sync()
+            self._file.close()
+            self._file = None
+
+    def iter_records(self) -> Iterator[Dict]:
+        """Stored articles in feed order, read back one at a time."""
+        if not self._index:
+            return
+        if self._file is not None:
+            self._file.flush()
+        with open(self.partial_path, "rb") as f:
+            for _, offset, length in sorted(self._index):
+                f.seek(offset)
+                yield json.loads(f.read(length))["article"]
+
+    def finalize(self, header: Dict) -> Path:
+        """Write the run file: header, then the articles in feed order."""
+        self.close()
+        write_run(self.final_path, dict(header, total_articles_classified=len(self)), self.iter_records())
+        return self.final_path
+
+    def discard(self):
+        """Remove the partial file once the run file and any other copies are written."""
+        self.close()
+        if self.partial_path.exists():
+            os.remove(self.partial_path)
+
+
+def partial_timestamp(partial_path: Path) -> str:
+    return partial_path.name[len("pharma_news_"):-len(PARTIAL_SUFFIX)]
+
+
+def find_interrupted(data_dir: Path) -> List[Path]:
+    """Partial files of runs that never reached finalize()."""
+    return sorted(data_dir.glob(f"pharma_news_*{PARTIAL_SUFFIX}"))
+
+
+def interrupted_header(output: RunOutput) -> Dict:
+    """Header for a run that stopped early: only what its partial file can tell."""
+    started = datetime.strptime(output.timestamp, "%Y%m%d_%H%M%S")
+    return {
+        "run_timestamp": started.isoformat(),
+        "interrupted": True,
+        "total_articles_classified": len(output),
+    }
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Per-domain record of which scraping method works, how fast, and how often it fails.
+
+Success and failure counts decay exponentially with a configurable half-life,
+so a method that failed a lot last month gradually earns another attempt
+instead of being skipped forever.
+"""
+
+import json
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+from json_state import moving_average, save_json_atomic
+
+
+def url_domain(url: str) -> str:
+    """Host name of a URL without a leading www."""
+    host = (urlparse(url).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+class ScraperStats:
+    def __init__(self, path: Path, half_life_days: float = 7, skip_after_failures: float = 3,
+                 max_skip_success_rate: float = 0.1):
+        self.path = path
+        self.half_life = half_life_days * 86400
+        self.skip_after_failures = skip_after_failures
+        self.max_skip_success_rate = max_skip_success_rate
+        self._lock = threading.Lock()
+        self.domains: Dict[str, Dict[str, Dict]] = {}
+
+    def load(self):
+        """Read persisted stats, if any."""
+        if self.path.exists():
+            with open(self.path, "r") as f:
+                self.domains = json.load(f).get("domains", {})
+
+    def _decay(self, entry: Dict, now: float):
+        """Age the counts in place to the current time."""
+        elapsed = now - entry.get("updated_at", now)
+        if elapsed > 0 and self.half_life:
+            factor = 0.5 ** (elapsed / self.half_life)
+            entry["successes"] *= factor
+            entry["failures"] *= factor
+        entry["updated_at"] = now
+
+    def _entry(self, domain: str, method: str) -> Dict:
+        return self.domains.setdefault(domain, {}).setdefault(method, {
+            "successes": 0.0,
+            "failures": 0.0,
+            "success_latency": None,
+            "failure_latency": None,
+            "updated_at": time.time(),
+        })
+
+    def record(self, domain: str, method: str, success: bool, latency: float):
+        """Record the outcome and duration of one scraping attempt."""
+        now = time.time()
+        with self._lock:
+            entry = self._entry(domain, method)
+            self._decay(entry, now)
+            field = "success_latency" if success else "failure_latency"
+            entry["successes" if success else "failures"] += 1
+            entry[field] = moving_average(entry[field], latency)
+
+    def _success_rate(self, entry: Dict) -> float:
+        # Laplace smoothing so an untried method starts at 0.5
+        return (entry["successes"] + 1) / (entry["successes"] + entry["failures"] + 2)
+
+    def order(self, domain: str, methods: List[str]) -> List[str]:
+        """Methods to try for a domain, historically best first, persistent failures skipped.
+
+        Untried methods keep their default position relative to each other. If
+        every method would be skipped, all are returned so content is still attempted.
+        """
+        now = time.time()
+        with self._lock:
+            known = self.domains.get(domain, {})
+            scored = []
+            for position, method in enumerate(methods):
+                entry = known.get(method)
+                if entry is None:
+                    scored.append((0.5, 0.0, position, method, False))
+                    continue
+                self._decay(entry, now)
+                rate = self._success_rate(entry)
+                attempts = entry["successes"] + entry["failures"]
+                # Rounded because decay between back-to-back attempts shaves off a hair
+                skip = round(entry["failures"], 3) >= self.skip_after_failures \
+                    and entry["successes"] / attempts < self.max_skip_success_rate
+                latency = entry["success_latency"] if entry["success_latency"] is not None else 0.0
+                scored.append((rate, latency, position, method, skip))
+        # Rates within the same tenth count as equal so the faster method wins
+        scored.sort(key=lambda s: (-round(s[0], 1), s[1], s[2]))
+        ordered = [s[3] for s in scored if not s[4]]
+        return ordered or [s[3] for s in scored]
+
+    def typical_latency(self, domain: str, method: str) -> Optional[float]:
+        """Moving average of successful attempt durations, if any."""
+        with self._lock:
+            entry = self.domains.get(domain, {}).get(method)
+            return entry["success_latency"] if entry else None
+
+    def save(self):
+        with self._lock:
+            data = {"last_updated": datetime.now().isoformat(), "domains": self.domains}
+            save_json_atomic(self.path, data)
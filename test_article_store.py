@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Tests for importing run files into the article store."""
+
+import json
+
+from article_store import ArticleStore, import_history
+from run_example import open_store
+from run_files import write_run
+
+
+def article(article_id: str, topic: str = "Drug Approvals") -> dict:
+    return {"id": article_id, "title": f"Title {article_id}", "topics": [topic], "confidence_scores": {topic: 1.0}}
+
+
+def test_import_adds_runs_missing_from_existing_store(tmp_path):
+    store = ArticleStore(tmp_path / "articles.db")
+    # A run the monitor stored itself, so the database already exists
+    first = tmp_path / "pharma_news_20250101_000000.json.gz"
+    write_run(first, {"run_timestamp": "2025-01-01T00:00:05", "total_articles_fetched": 3}, [article("a")])
+    store.save_run({"run_timestamp": "2025-01-01T00:00:05", "total_articles_fetched": 3}, str(first), articles=[article("a")])
+
+    second = tmp_path / "pharma_news_20250102_000000.json"
+    write_run(second, {"run_timestamp": "2025-01-02T00:00:05", "total_articles_fetched": 4}, [article("b")])
+    import_history(store, [first, second])
+    assert store.run_totals()["runs"] == 2
+    assert store.run_totals()["fetched"] == 7
+
+    # Importing again changes nothing
+    import_history(store, [first, second])
+    assert store.run_totals()["runs"] == 2
+    store.close()
+
+
+def test_import_bare_list_run_file(tmp_path):
+    path = tmp_path / "pharma_news_20240301_101500.json"
+    path.write_text(json.dumps([article("c", "Clinical Trials")]))
+    store = ArticleStore(tmp_path / "articles.db")
+    import_history(store, [path])
+    assert store.has_run("2024-03-01T10:15:00")
+    assert store.topic_counts() == [("Clinical Trials", 1)]
+    store.close()
+
+
+def test_open_store_imports_history_when_database_exists(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data").mkdir()
+    ArticleStore(tmp_path / "data" / "articles.db").close()
+    write_run(tmp_path / "data" / "pharma_news_20250101_000000.json.gz",
+              {"run_timestamp": "2025-01-01T00:00:05"}, [article("a")])
+    store = open_store()
+    assert store.run_totals()["runs"] == 1
+    store.close()
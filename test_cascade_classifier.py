@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""Tests for the cascade classifier's training data."""
+
+import json
+
+from cascade_classifier import ClassificationLog, load_training_examples
+from run_files import write_run
+
+TOPICS = ["Drug Approvals", "Clinical Trials"]
+
+
+def test_training_skips_locally_classified_articles(tmp_path):
+    articles = [
+        {"title": "FDA approves new drug", "original_description": "Approval news",
+         "topics": ["Drug Approvals"], "classified_by": "llm"},
+        {"title": "Phase 3 trial starts", "original_description": "Trial news",
+         "topics": ["Clinical Trials"], "classified_by": "local"},
+        # Runs from before the cascade existed were all labelled by the LLM
+        {"title": "Older approval", "original_description": "From an early run", "topics": ["Drug Approvals"]},
+    ]
+    write_run(tmp_path / "pharma_news_20250101_000000.json.gz", {"run_timestamp": "2025-01-01T00:00:00"}, articles)
+    ClassificationLog(tmp_path / "classification_log.jsonl").append(
+        {"title": "Unrelated merger", "description": "Business news"}, [], {}
+    )
+
+    examples = {example["title"]: example["topics"] for example in load_training_examples(tmp_path, TOPICS)}
+    assert examples == {
+        "FDA approves new drug": ["Drug Approvals"],
+        "Older approval": ["Drug Approvals"],
+        "Unrelated merger": [],
+    }
+
+
+def test_log_label_overrides_run_file(tmp_path):
+    write_run(tmp_path / "pharma_news_20250101_000000.json", {}, [
+        {"title": "Trial halted", "original_description": "Safety", "topics": ["Clinical Trials"], "classified_by": "llm"},
+    ])
+    with open(tmp_path / "classification_log.jsonl", "w", encoding="utf-8") as f:
+        f.write(json.dumps({"title": "Trial halted", "description": "Safety", "topics": []}) + "\n")
+        f.write('{"title": "torn')
+
+    assert load_training_examples(tmp_path, TOPICS) == [{"title": "Trial halted", "description": "Safety", "topics": []}]
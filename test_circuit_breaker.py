@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Tests for the per-domain circuit breaker."""
+
+from circuit_breaker import CLOSED, HALF_OPEN, OPEN, DomainCircuitBreaker
+
+DOMAIN = "example.com"
+
+
+def opened(tmp_path):
+    breaker = DomainCircuitBreaker(tmp_path / "circuit_breakers.json", failure_threshold=3, cooldown_seconds=60)
+    for _ in range(3):
+        breaker.record(DOMAIN, False, 2.0)
+    return breaker
+
+
+def end_cooldown(breaker):
+    breaker.domains[DOMAIN]["opened_at"] -= 61
+
+
+def test_opens_at_failure_threshold(tmp_path):
+    breaker = DomainCircuitBreaker(tmp_path / "circuit_breakers.json", failure_threshold=3)
+    breaker.record(DOMAIN, False, 1.0)
+    breaker.record(DOMAIN, False, 1.0)
+    assert breaker.allow(DOMAIN)
+    breaker.record(DOMAIN, True, 1.0)
+    # A success resets the count
+    breaker.record(DOMAIN, False, 1.0)
+    breaker.record(DOMAIN, False, 1.0)
+    assert breaker.allow(DOMAIN)
+    breaker.record(DOMAIN, False, 1.0)
+    assert breaker.domains[DOMAIN]["state"] == OPEN
+    assert breaker.open_domains() == [DOMAIN]
+
+
+def test_open_until_cooldown_counts_skips(tmp_path):
+    breaker = opened(tmp_path)
+    assert not breaker.allow(DOMAIN)
+    assert not breaker.allow(DOMAIN)
+    assert breaker.skipped == 2
+    assert breaker.seconds_saved == 4.0
+    end_cooldown(breaker)
+    assert breaker.allow(DOMAIN)
+
+
+def test_single_probe_when_half_open(tmp_path):
+    breaker = opened(tmp_path)
+    end_cooldown(breaker)
+    assert breaker.allow(DOMAIN)
+    assert breaker.domains[DOMAIN]["state"] == HALF_OPEN
+    # Further scrapes wait for the probe's result
+    assert not breaker.allow(DOMAIN)
+
+
+def test_probe_success_closes(tmp_path):
+    breaker = opened(tmp_path)
+    end_cooldown(breaker)
+    breaker.allow(DOMAIN)
+    breaker.record(DOMAIN, True, 0.5)
+    assert breaker.domains[DOMAIN]["state"] == CLOSED
+    assert breaker.domains[DOMAIN]["consecutive_failures"] == 0
+    assert breaker.allow(DOMAIN)
+
+
+def test_probe_failure_reopens_for_another_cooldown(tmp_path):
+    breaker = opened(tmp_path)
+    end_cooldown(breaker)
+    breaker.allow(DOMAIN)
+    breaker.record(DOMAIN, False, 2.0)
+    assert breaker.domains[DOMAIN]["state"] == OPEN
+    assert not breaker.allow(DOMAIN)
+
+
+def test_persisted_half_open_reloads_as_open(tmp_path):
+    breaker = opened(tmp_path)
+    end_cooldown(breaker)
+    breaker.allow(DOMAIN)
+    breaker.save()
+
+    reloaded = DomainCircuitBreaker(tmp_path / "circuit_breakers.json", failure_threshold=3, cooldown_seconds=60)
+    reloaded.load()
+    assert reloaded.domains[DOMAIN]["state"] == OPEN
+    # Its cooldown already ran out, so a fresh probe goes through
+    assert reloaded.allow(DOMAIN)
+    assert reloaded.domains[DOMAIN]["state"] == HALF_OPEN
+    assert not reloaded.allow(DOMAIN)
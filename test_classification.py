@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Tests for batch classification and its fallback to single-article requests."""
+
+import json
+
+import pytest
+
+ARTICLES = [{"title": f"Article {i}", "description": f"Description {i}"} for i in range(1, 5)]
+
+
+def batch_llm(fake_llm, results):
+    """Answer batch prompts with the given entries and single-article prompts with topic "Single"."""
+    def respond(prompt):
+        if '"results"' in prompt:
+            if isinstance(results, Exception):
+                raise results
+            return json.dumps({"results": results})
+        return json.dumps({"topics": ["Single"], "confidence": {"Single": 1.0}})
+    return fake_llm(respond)
+
+
+def entry(n, topic):
+    return {"article": n, "topics": [topic], "confidence": {topic: 1.0}}
+
+
+def single_prompts(prompts):
+    return [prompt for prompt in prompts if '"results"' not in prompt]
+
+
+def test_results_mapped_back_by_article_number(monitor, fake_llm):
+    prompts = batch_llm(fake_llm, [entry(3, "C"), entry("1", "A"), entry(4, "D"), entry(2, "B")])
+    results = monitor.classify_articles_batch(ARTICLES)
+    assert [topics for topics, _ in results] == [["A"], ["B"], ["C"], ["D"]]
+    assert len(prompts) == 1
+    assert all(f"[Article {n}]" in prompts[0] for n in range(1, 5))
+
+
+@pytest.mark.parametrize("results", [
+    # Number out of range, not a number, missing, topics not a list
+    [entry(1, "A"), entry(5, "X"), entry("two", "X"), {"topics": ["X"]}, {"article": 4, "topics": "D"}],
+    # Article 2 and 3 left out
+    [entry(1, "A"), entry(4, "D")],
+])
+def test_malformed_and_missing_entries_classified_individually(monitor, fake_llm, results):
+    prompts = batch_llm(fake_llm, results)
+    topics = [result[0] for result in monitor.classify_articles_batch(ARTICLES)]
+    assert topics[0] == ["A"]
+    assert topics[1:3] == [["Single"], ["Single"]]
+    retried = single_prompts(prompts)
+    assert len(retried) == topics.count(["Single"])
+    assert "Article 2" in retried[0] and "Article 3" in retried[1]
+
+
+def test_duplicate_article_number_keeps_first_entry(monitor, fake_llm):
+    prompts = batch_llm(fake_llm, [entry(1, "A"), entry(1, "X"), entry(2, "B")])
+    results = monitor.classify_articles_batch(ARTICLES[:2])
+    assert [topics for topics, _ in results] == [["A"], ["B"]]
+    assert single_prompts(prompts) == []
+
+
+def test_failed_batch_falls_back_to_single_requests(monitor, fake_llm):
+    prompts = batch_llm(fake_llm, ConnectionError("LLM unavailable"))
+    results = monitor.classify_articles_batch(ARTICLES[:2])
+    assert results == [(["Single"], {"Single": 1.0})] * 2
+    assert len(single_prompts(prompts)) == 2
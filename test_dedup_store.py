@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Tests for the on-disk dedup store: lookups, expiry and compaction."""
+
+import time
+
+from dedup_store import DedupStore
+
+ARTICLE_ID = "0123456789abcdef0123456789abcdef"
+OTHER_ID = "fedcba9876543210fedcba9876543210"
+
+
+def test_add_survives_reopen_and_compaction(tmp_path):
+    store = DedupStore(tmp_path / "article_index")
+    store.add(ARTICLE_ID)
+    store.flush()
+    store.close()
+
+    store = DedupStore(tmp_path / "article_index")
+    assert ARTICLE_ID in store
+    assert OTHER_ID not in store
+    store.compact()
+    assert store.stats() == {"sorted_records": 1, "log_records": 0}
+    assert ARTICLE_ID in store
+    store.close()
+
+
+def test_expired_entries_dropped_at_compaction(tmp_path):
+    store = DedupStore(tmp_path / "article_index", max_age_days=1)
+    store.add(ARTICLE_ID, seen_at=time.time() - 2 * 86400)
+    store.add(OTHER_ID)
+    assert ARTICLE_ID not in store
+    store.compact()
+    assert store.stats()["sorted_records"] == 1
+    assert OTHER_ID in store
+    store.close()
+
+
+def test_readded_after_expiry_kept_by_compaction(tmp_path):
+    # Compacted while still fresh under a longer limit, so the old time is in the sorted file
+    store = DedupStore(tmp_path / "article_index", max_age_days=3)
+    store.add(ARTICLE_ID, seen_at=time.time() - 2 * 86400)
+    store.compact()
+    assert ARTICLE_ID in store
+    store.close()
+
+    store = DedupStore(tmp_path / "article_index", max_age_days=1)
+    assert ARTICLE_ID not in store
+    store.add(ARTICLE_ID)
+    assert ARTICLE_ID in store
+    store.compact()
+    assert ARTICLE_ID in store
+    store.close()
+
+
+def test_repeated_log_keys_keep_latest_time(tmp_path):
+    store = DedupStore(tmp_path / "article_index", max_age_days=1)
+    store.add(ARTICLE_ID, seen_at=time.time() - 2 * 86400)
+    store.add(ARTICLE_ID)
+    store.flush()
+    store.close()
+
+    store = DedupStore(tmp_path / "article_index", max_age_days=1)
+    assert ARTICLE_ID in store
+    store.compact()
+    assert ARTICLE_ID in store
+    store.close()
@@ -1,35 +1,47 @@
 #!/usr/bin/env python3
 """Test script to verify deduplication is working properly."""
 
-import json
 from pathlib import Path
 
+from article_store import ArticleStore
+from dedup_store import DedupStore
+from run_files import read_header, run_file_paths
+
 def test_deduplication():
     """Test the deduplication functionality."""
-    # Check if index file exists
-    index_path = Path("data/article_index.json")
+    # Check if index files exist
+    index_base = Path("data/article_index")
     
-    if index_path.exists():
-        with open(index_path, 'r') as f:
-            index_data = json.load(f)
+    if index_base.with_suffix(".bin").exists() or index_base.with_suffix(".log").exists():
+        store = DedupStore(index_base)
+        total_tracked = len(store)
+        stats = store.stats()
+        store.close()
             
         print(f"Article Index Summary:")
-        print(f"- Last updated: {index_data.get('last_updated', 'N/A')}")
-        print(f"- Total unique articles tracked: {index_data.get('total_articles', 0)}")
-        print(f"- Sample article IDs: {index_data.get('article_ids', [])[:5]}")
+        print(f"- Total unique articles tracked: {total_tracked}")
+        print(f"- Compacted records: {stats['sorted_records']}")
+        print(f"- Records pending compaction: {stats['log_records']}")
+    elif index_base.with_suffix(".json").exists():
+        print("Legacy article_index.json found; it will be migrated on the next monitor run.")
     else:
         print("No article index found yet. Run the monitor first.")
         
     # Check latest run for duplicate statistics
-    data_dir = Path("data")
-    json_files = sorted(data_dir.glob("pharma_news_*.json"), reverse=True)
+    store_path = Path("data/articles.db")
+    run_files = run_file_paths()
+    if store_path.exists():
+        store = ArticleStore(store_path)
+        run_data = store.latest_run()
+        store.close()
+    elif run_files:
+        # No store yet: read the run fields without loading the articles
+        run_data = read_header(run_files[-1])
+    else:
+        run_data = None
     
-    if json_files:
-        latest_file = json_files[0]
-        print(f"\nLatest run: {latest_file.name}")
-        
-        with open(latest_file, 'r') as f:
-            run_data = json.load(f)
+    if run_data:
+        print(f"\nLatest run: {run_data['run_timestamp']}")
             
         print(f"Run Statistics:")
         print(f"- Total articles fetched: {run_data.get('total_articles_fetched', 0)}")
@@ -37,7 +49,7 @@ def test_deduplication():
         print(f"- Unique articles: {run_data.get('total_unique_articles', 0)}")
         print(f"- Articles classified: {run_data.get('total_articles_classified', 0)}")
         print(f"- Articles discarded: {run_data.get('total_articles_discarded', 0)}")
-        print(f"- Classification rate: {run_data.get('classification_rate', 'N/A')}")
+        print(f"- Classification rate: {run_data.get('classification_rate') or 'N/A'}")
 
 if __name__ == "__main__":
-    test_deduplication()
\ No newline at end of file
+    test_deduplication()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Tests for the on-disk cache: round trips, TTL expiry and size-based pruning."""
+
+import os
+import time
+
+import pytest
+
+from disk_cache import DiskCache, make_key
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_round_trip(tmp_path, compress):
+    cache = DiskCache(tmp_path, compress=compress)
+    key = make_key("prompt", 1)
+    assert cache.get(key) is None
+    cache.set(key, {"topics": ["µg"]})
+    assert cache.get(key) == {"topics": ["µg"]}
+    assert cache.stats() == {"hits": 1, "misses": 1, "writes": 1, "evictions": 0}
+    assert make_key("prompt", 1) == key != make_key("prompt", 2)
+
+
+def test_expired_entry_is_a_miss_and_removed(tmp_path):
+    cache = DiskCache(tmp_path, ttl_seconds=0.05)
+    key = make_key("a")
+    cache.set(key, 1)
+    assert cache.get(key) == 1
+    time.sleep(0.1)
+    assert cache.get(key) is None
+    assert not cache._path(key).exists()
+    assert cache.stats()["evictions"] == 1
+
+
+def age(cache, key, seconds):
+    """Make an entry look last used this many seconds ago."""
+    then = time.time() - seconds
+    os.utime(cache._path(key), (then, then))
+
+
+def test_prune_drops_expired_entries(tmp_path):
+    cache = DiskCache(tmp_path, ttl_seconds=3600)
+    cache.set("old", 1)
+    cache.set("new", 2)
+    age(cache, "old", 7200)
+    cache.prune()
+    assert not cache._path("old").exists()
+    assert cache.get("new") == 2
+
+
+def test_prune_evicts_least_recently_used_over_max_size(tmp_path):
+    cache = DiskCache(tmp_path)
+    for i, key in enumerate(["a", "b", "c"]):
+        cache.set(key, "x" * 100)
+        age(cache, key, 100 - i)
+    # A hit makes the oldest entry the most recently used
+    assert cache.get("a") is not None
+    size = cache._path("a").stat().st_size
+    cache.max_size_bytes = 2 * size
+    cache.prune()
+    assert [key for key in ["a", "b", "c"] if cache._path(key).exists()] == ["a", "c"]
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Tests for feed high-water marks: skipping handled entries and holding back on classification errors."""
+
+import types
+
+import pharma_news_monitor
+
+FEED = {"url": "https://example.com/rss", "name": "Example"}
+
+# Titles and descriptions differ enough not to be grouped as near-duplicates
+ENTRIES = {
+    "older": ("Mon, 01 Jan 2024 09:00:00 GMT", "Regulator approves oncology drug for lung cancer patients",
+              "The agency cleared the therapy after a phase three trial."),
+    "newest": ("Wed, 03 Jan 2024 09:00:00 GMT", "Biotech raises funding round to expand vaccine manufacturing",
+               "Investors committed capital for new plants in Europe."),
+    "middle": ("Tue, 02 Jan 2024 09:00:00 GMT", "Patent dispute over insulin pricing heads to appeals court",
+               "Judges will hear arguments about generic competition."),
+    "latest": ("Thu, 04 Jan 2024 09:00:00 GMT", "Hospital network adopts software for clinical trial recruitment",
+               "Administrators expect faster enrolment across sites."),
+}
+
+
+def rss(*names) -> bytes:
+    items = "".join(
+        f"<item><guid>https://example.com/{name}</guid><link>https://example.com/{name}</link>"
+        f"<title>{ENTRIES[name][1]}</title><description>{ENTRIES[name][2]}</description>"
+        f"<pubDate>{ENTRIES[name][0]}</pubDate></item>"
+        for name in names
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>Example</title>{items}</channel></rss>'.encode()
+
+
+def fetch_articles(monitor, *names):
+    monitor.pending_high_water = {}
+    monitor.classification_errors = {}
+    monitor._download_feeds = lambda: [(FEED, rss(*names))]
+    return monitor.fetch_rss_feeds()
+
+
+def fetch(monitor, *names):
+    return [article['link'].rsplit('/', 1)[1] for article in fetch_articles(monitor, *names)]
+
+
+def serve_unchanged(monitor, monkeypatch, body: bytes):
+    """Serve the feed from a fake server answering 304 to any conditional request."""
+    monkeypatch.setitem(pharma_news_monitor.CONFIG, "rss_feeds", [FEED])
+
+    def get(client, url, deadline=None, headers=None, **kwargs):
+        if headers.get("If-None-Match") == '"v1"':
+            return types.SimpleNamespace(status_code=304, headers={}, close=lambda: None)
+        return types.SimpleNamespace(status_code=200, headers={"ETag": '"v1"'}, close=lambda: None,
+                                     raise_for_status=lambda: None, iter_content=lambda chunk_size: [body])
+    monkeypatch.setattr(monitor.http, "get", get)
+
+
+def classify_failing(monitor, fake_llm, failing):
+    """Classify the fetched articles, failing for the one named."""
+    def respond(prompt):
+        if ENTRIES[failing][1] in prompt:
+            raise ConnectionError("LLM unavailable")
+        return '{"topics": [], "confidence": {}}'
+    fake_llm(respond)
+
+    def classify(articles):
+        for seq, article in enumerate(articles):
+            article['seq'] = seq
+            assert monitor._classify_stage([article]) == [None]
+    return classify
+
+
+def test_unsorted_feed_marked_at_newest_entry(monitor):
+    assert fetch(monitor, "older", "newest", "middle") == ["older", "newest", "middle"]
+    monitor._advance_high_water()
+    assert monitor.feed_cache[FEED["url"]]["high_water"]["id"] == "https://example.com/newest"
+    # Older entries after the newest one are skipped too, not only those listed after it
+    assert fetch(monitor, "middle", "latest", "newest", "older") == ["latest"]
+
+
+def test_classification_error_holds_back_high_water(monitor, fake_llm):
+    classify = classify_failing(monitor, fake_llm, "middle")
+    classify(fetch_articles(monitor, "newest", "middle", "older"))
+    assert monitor.total_articles_discarded == 2
+    assert monitor.total_classification_errors == 1
+    monitor._advance_high_water()
+
+    # The errored article and anything published with or after it are fetched again
+    assert fetch(monitor, "newest", "middle", "older") == ["newest", "middle"]
+
+
+def test_classification_error_refetches_unchanged_feed(monitor, fake_llm, monkeypatch):
+    serve_unchanged(monitor, monkeypatch, rss("newest", "middle", "older"))
+    classify = classify_failing(monitor, fake_llm, "middle")
+    classify(monitor.fetch_rss_feeds())
+    monitor._advance_high_water()
+    assert "etag" not in monitor.feed_cache[FEED["url"]]
+
+    monitor.pending_high_water = {}
+    monitor.classification_errors = {}
+    assert [article['link'].rsplit('/', 1)[1] for article in monitor.fetch_rss_feeds()] == ["newest", "middle"]
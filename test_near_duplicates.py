@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""Tests for SimHash near-duplicate detection."""
+
+from near_duplicates import NearDuplicateIndex, article_fingerprint, simhash
+
+
+def test_lightly_edited_copy_is_found():
+    index = NearDuplicateIndex(max_distance=7)
+    original = {"title": "Pfizer wins FDA approval for new RSV vaccine in older adults",
+                "description": "The agency approved the shot after a large phase 3 trial showed strong protection."}
+    copy = {"title": "Pfizer Wins FDA Approval for New RSV Vaccine in Older Adults!",
+            "description": "<p>The agency approved the shot after a large phase 3 trial showed strong protection.</p>"}
+    other = {"title": "Merck cuts jobs in restructuring of its animal health unit",
+             "description": "The company will close two sites as part of a cost program."}
+    index.add(article_fingerprint(original), title=original["title"])
+    assert index.find(article_fingerprint(copy))["title"] == original["title"]
+    assert index.find(article_fingerprint(other)) is None
+
+
+def test_text_without_words_has_no_fingerprint():
+    assert simhash("") is None
+    assert simhash("<p> — … </p>") is None
+    assert article_fingerprint({"title": "", "description": ""}) is None
+    assert simhash("Drug approved") is not None
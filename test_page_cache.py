@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Tests for URL canonicalization and the compressed page cache."""
+
+import gzip
+import time
+
+import pytest
+
+from page_cache import PageCache, canonical_url
+
+URL = "https://www.example.com/news/1"
+HTML = "<html><body>Ünïcode article " + "text " * 200 + "</body></html>"
+
+
+@pytest.mark.parametrize("variant", [
+    "https://www.example.com/news/1#comments",
+    "HTTPS://WWW.Example.COM:443/news/1",
+    "https://www.example.com/news/1?utm_source=rss&utm_medium=feed&fbclid=x",
+    "  https://www.example.com/news/1?gclid=abc  ",
+])
+def test_canonical_url_drops_tracking_and_fragment(variant):
+    assert canonical_url(variant) == URL
+
+
+def test_canonical_url_keeps_and_sorts_real_query():
+    assert canonical_url("http://example.com:8080?page=2&id=7&utm_campaign=x") == "http://example.com:8080/?id=7&page=2"
+    assert canonical_url("https://example.com/a?id=7") != canonical_url("https://example.com/a?id=8")
+
+
+def test_store_round_trips_compressed(tmp_path):
+    cache = PageCache(tmp_path, fresh_seconds=3600)
+    cache.store(URL + "?utm_source=rss", HTML, {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"})
+    entry = cache.get(URL + "#top")
+    assert entry["html"] == HTML
+    assert entry["url"] == URL
+    assert cache.is_fresh(entry)
+    assert PageCache.validators(entry) == {"If-None-Match": '"v1"', "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"}
+    [path] = tmp_path.glob("*/*.json.gz")
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        assert HTML in f.read()
+    assert path.stat().st_size < len(HTML.encode())
+
+
+def test_stale_entry_refreshed_after_revalidation(tmp_path):
+    cache = PageCache(tmp_path, fresh_seconds=0.05)
+    entry = cache.store(URL, HTML, {})
+    time.sleep(0.1)
+    assert not cache.is_fresh(cache.get(URL))
+    assert PageCache.validators(entry) == {}
+    cache.refresh(URL, entry)
+    assert cache.is_fresh(cache.get(URL))
+    assert cache.stats()["revalidated"] == 1
+
+
+def test_entry_expires_after_max_age(tmp_path):
+    cache = PageCache(tmp_path, fresh_seconds=0.01, max_age_seconds=0.05)
+    cache.store(URL, HTML, {})
+    time.sleep(0.1)
+    assert cache.get(URL) is None
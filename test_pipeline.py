@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Tests for the processing pipeline: near-duplicate grouping, resuming, stage failures and the parse process pool."""
+
+import pytest
+
+pytest.importorskip("feedparser")
+pytest.importorskip("openai")
+
+import pharma_news_monitor
+
+
+def test_parse_pool_does_not_fork():
+    assert pharma_news_monitor._parse_pool_context().get_start_method() in ("forkserver", "spawn")
+
+
+def test_parse_pool_shut_down_when_pipeline_fails(monitor, monkeypatch):
+    pools = []
+    real_pool = pharma_news_monitor.ProcessPoolExecutor
+
+    def track_pool(*args, **kwargs):
+        pools.append(real_pool(*args, **kwargs))
+        return pools[-1]
+
+    def fail_stage(*args, **kwargs):
+        raise RuntimeError("stage failed to start")
+
+    monkeypatch.setattr(pharma_news_monitor, "ProcessPoolExecutor", track_pool)
+    monkeypatch.setattr(monitor, "_start_stage", fail_stage)
+    with pytest.raises(RuntimeError):
+        monitor.process_articles([])
+    assert monitor._parse_pool is None
+    with pytest.raises(RuntimeError):
+        pools[0].submit(len, "")
+    monitor.run_output.discard()
+
+
+def test_articles_without_text_are_not_grouped(monitor):
+    articles = [
+        {"title": "", "description": "", "link": f"https://example.com/{i}", "source_feed": "Example"}
+        for i in range(3)
+    ]
+    articles.append({"title": "FDA approves gene therapy", "description": "First approval of its kind.",
+                     "link": "https://example.com/3", "source_feed": "Example"})
+    representatives = monitor._group_near_duplicates(articles)
+    assert [article["link"] for article in representatives] == [article["link"] for article in articles]
+    assert monitor.total_near_duplicates == 0
+    assert "fingerprint" not in representatives[0]
+
+
+def test_resume_skips_completed_steps(monitor, fake_llm):
+    prompts = fake_llm(lambda prompt: '{"topics": [], "confidence": {}}' if "JSON object" in prompt else "Summary.")
+    articles = [
+        {"title": f"Article {i}", "description": f"Description {i}", "link": f"https://example.com/{i}",
+         "published": "", "source_feed": "Example", "feed_url": "https://example.com/rss", "duplicate_sources": []}
+        for i in range(4)
+    ]
+    monitor.run_output = monitor._new_run_output("20250101_120000")
+    monitor.run_output.append(0, {"id": "saved", "topics": ["T"]})
+    resume_state = {
+        "classified": {
+            1: {"topics": [], "confidence_scores": {}, "classified_by": "llm"},
+            2: {"topics": ["T"], "confidence_scores": {"T": 1.0}, "classified_by": "llm"},
+        },
+        "content": {2: {"full_content": "Full text of article 2."}},
+    }
+
+    assert monitor.process_articles(articles, resume_state) == 2
+    # Only article 3 is classified, only article 2 summarized
+    classify_prompts = [prompt for prompt in prompts if "JSON object" in prompt]
+    summary_prompts = [prompt for prompt in prompts if "JSON object" not in prompt]
+    assert len(classify_prompts) == 1 and "Article 3" in classify_prompts[0]
+    assert len(summary_prompts) == 1 and "Full text of article 2." in summary_prompts[0]
+    assert monitor.total_articles_discarded == 2
+    monitor.run_output.discard()
+
+
+@pytest.mark.parametrize("stage", ["_classify_stage", "_summarize_stage"])
+def test_stage_failure_recorded_as_classification_error(monitor, fake_llm, monkeypatch, stage):
+    fake_llm(lambda prompt: '{"topics": ["T"], "confidence": {"T": 1.0}}' if "JSON object" in prompt else "Summary.")
+
+    def fail(*args):
+        raise RuntimeError("stage failed")
+    monkeypatch.setattr(monitor, stage, fail)
+    monkeypatch.setattr(monitor, "fetch_article_page", lambda url: None)
+    articles = [
+        {"title": f"Article {i}", "description": f"Description {i}", "link": f"https://example.com/{i}",
+         "published": "", "published_at": 1700000000 + i, "source_feed": "Example",
+         "feed_url": "https://example.com/rss", "duplicate_sources": []}
+        for i in range(2)
+    ]
+
+    assert monitor.process_articles(articles) == 0
+    assert monitor.total_classification_errors == 2
+    assert sorted(monitor.classification_errors["https://example.com/rss"]) == [1700000000, 1700000001]
+    monitor.run_output.discard()
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""Tests for the Aho-Corasick keyword prefilter."""
+
+import random
+
+from prefilter import AhoCorasick, PrefilterStats, TopicPrefilter
+
+
+def test_automaton_finds_overlapping_patterns():
+    automaton = AhoCorasick(["he", "she", "his", "hers"])
+    assert automaton.search("ushers") == {0, 1, 3}
+    assert automaton.search("xyz") == set()
+
+
+def test_automaton_matches_naive_search():
+    rng = random.Random(7)
+    for _ in range(200):
+        patterns = ["".join(rng.choice("ab") for _ in range(rng.randint(1, 4))) for _ in range(5)]
+        text = "".join(rng.choice("ab") for _ in range(20))
+        expected = {i for i, pattern in enumerate(patterns) if pattern in text}
+        assert AhoCorasick(patterns).search(text) == expected
+
+
+def test_topic_phrases_match_whole_words_only():
+    prefilter = TopicPrefilter({
+        "Drug Approvals": ["FDA approval", "approves"],
+        "Mergers & Acquisitions": ["acquire", "merger"],
+    })
+    matches = prefilter.match({"title": "FDA <b>approves</b> new drug", "description": "A first-of-its-kind approval."})
+    assert matches == {"Drug Approvals": ["approves"]}
+    # "acquired" and "mergers" are other words than the phrases
+    assert prefilter.match({"title": "Company acquired rivals", "description": "Mergers slow down"}) == {}
+    assert "Mergers & Acquisitions" in prefilter.match({"title": "Mergers & Acquisitions roundup", "description": ""})
+
+
+def test_recall_scales_audit_misses():
+    stats = PrefilterStats("filter", audit_sample_rate=0.1)
+    for _ in range(9):
+        stats.record_llm_result({"title": "hit"}, matched=True, topics=["Drug Approvals"])
+    stats.record_llm_result({"title": "miss"}, matched=False, topics=["Drug Approvals"])
+    stats.record_llm_result({"title": "negative"}, matched=False, topics=[])
+    # One audited miss stands for ten real ones
+    assert stats.to_dict()["estimated_recall"] == round(9 / 19, 3)
+    assert stats.to_dict()["missed_articles"] == [{"title": "miss", "topics": ["Drug Approvals"]}]
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""Tests for per-host rate limiting and its deadlines."""
+
+import time
+
+import pytest
+
+from rate_limiter import HostRateLimiter, RateLimitTimeout, parse_retry_after
+
+URL = "https://www.example.com/news/1"
+
+
+def test_wait_past_deadline_fails_fast_without_taking_a_token():
+    limiter = HostRateLimiter(requests_per_second=1, burst=1)
+    limiter.acquire(URL)
+    start = time.monotonic()
+    with pytest.raises(RateLimitTimeout):
+        limiter.acquire(URL, deadline=time.monotonic() + 0.2)
+    assert time.monotonic() - start < 0.1
+    assert limiter.stats()["waits"] == 0
+    # The refused caller did not queue behind the first one
+    limiter.acquire(URL, deadline=time.monotonic() + 1.5)
+    assert limiter.stats()["waits"] == 1
+
+
+def test_retry_after_past_deadline_fails_fast():
+    limiter = HostRateLimiter(requests_per_second=100, burst=5, max_retry_after=300)
+    limiter.defer(URL, parse_retry_after("120"))
+    start = time.monotonic()
+    with pytest.raises(RateLimitTimeout):
+        limiter.acquire(URL, deadline=time.monotonic() + 45)
+    assert time.monotonic() - start < 0.1
+    # Other hosts are not paused
+    limiter.acquire("https://other.example.org/", deadline=time.monotonic() + 0.1)
+
+
+def test_domain_override_and_unlimited_hosts():
+    limiter = HostRateLimiter(requests_per_second=0.5, burst=1, domains={"example.com": {"requests_per_second": 0}})
+    for _ in range(3):
+        limiter.acquire(URL, deadline=time.monotonic())
+    assert limiter.stats()["waits"] == 0
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Tests for reading and writing run files in every format."""
+
+import gzip
+import json
+
+import pytest
+
+import run_files
+from run_files import iter_articles, load_run, read_header, run_file_paths, write_run
+
+HEADER = {"run_timestamp": "2025-01-01T00:00:00", "total_articles_fetched": 3, "configuration": {"topics": [1, 2]}}
+ARTICLES = [
+    {"id": "a", "title": "Quote \" and unicode µg", "topics": ["Drug Approvals"], "confidence_scores": {"x": 1.0}},
+    {"id": "b", "title": "Numbers", "score": 12345678901234567890, "ratio": 1.5e-7, "nested": [[], {}]},
+    {"id": "c", "title": "", "topics": []},
+]
+
+
+@pytest.mark.parametrize("name", ["pharma_news_1.json", "pharma_news_1.json.gz"])
+def test_write_then_stream_back(tmp_path, name):
+    path = tmp_path / name
+    assert write_run(path, HEADER, iter(ARTICLES)) == 3
+    header = {}
+    assert list(iter_articles(path, header)) == ARTICLES
+    assert header == HEADER
+    assert load_run(path) == dict(HEADER, articles=ARTICLES)
+    assert not list(tmp_path.glob(".tmp.*"))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 64 * 1024])
+def test_stream_reader_across_chunk_boundaries(tmp_path, monkeypatch, chunk_size):
+    monkeypatch.setattr(run_files, "CHUNK_SIZE", chunk_size)
+    path = tmp_path / "pharma_news_1.json"
+    # Indented, with articles between header fields, as older runs were written
+    path.write_text(json.dumps({"run_timestamp": "t", "articles": ARTICLES, "total": 7}, indent=2))
+    header = {}
+    assert list(iter_articles(path, header)) == ARTICLES
+    assert header == {"run_timestamp": "t", "total": 7}
+
+
+def test_bare_list_and_empty_files(tmp_path):
+    bare = tmp_path / "pharma_news_1.json"
+    bare.write_text(json.dumps(ARTICLES))
+    assert list(iter_articles(bare)) == ARTICLES
+    assert read_header(bare) == {}
+
+    empty = tmp_path / "pharma_news_2.json.gz"
+    with gzip.open(empty, "wt") as f:
+        f.write('{"run_timestamp": "t", "articles": []}')
+    assert list(iter_articles(empty)) == []
+    assert read_header(empty) == {"run_timestamp": "t"}
+
+
+def test_malformed_file_raises(tmp_path):
+    path = tmp_path / "pharma_news_1.json"
+    path.write_text('{"run_timestamp": "t", "articles": [{"id": "a"}')
+    with pytest.raises(ValueError):
+        list(iter_articles(path))
+
+
+def test_run_file_paths_sorted_across_formats(tmp_path):
+    for name in ("pharma_news_20250102_000000.json.gz", "pharma_news_20250101_000000.json",
+                 "pharma_news_20250103_000000.partial.jsonl", "feed_cache.json"):
+        (tmp_path / name).write_text("{}")
+    assert [p.name for p in run_file_paths(tmp_path)] == [
+        "pharma_news_20250101_000000.json", "pharma_news_20250102_000000.json.gz"
+    ]
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""Tests for the run journal that --resume replays."""
+
+from run_journal import RunJournal, find_unfinished, journal_timestamp
+
+TIMESTAMP = "20250101_120000"
+
+
+def test_replay_groups_steps_by_seq(tmp_path):
+    journal = RunJournal(tmp_path, TIMESTAMP, fsync_every=2)
+    journal.record("fetched", seq=0, article={"title": "A"})
+    journal.record("fetched", seq=1, article={"title": "B"})
+    journal.record("feeds", feed_cache={"u": {}}, total_articles_fetched=2)
+    journal.record("classified", seq=0, topics=["T"], confidence_scores={}, classified_by="llm")
+    journal.record("classification_error", seq=1)
+    journal.record("content", seq=0, full_content=None)
+    journal.close()
+
+    state = RunJournal(tmp_path, TIMESTAMP).replay()
+    assert state["feeds"] == {"feed_cache": {"u": {}}, "total_articles_fetched": 2}
+    assert state["fetched"] == {0: {"article": {"title": "A"}}, 1: {"article": {"title": "B"}}}
+    assert state["classified"] == {0: {"topics": ["T"], "confidence_scores": {}, "classified_by": "llm"}}
+    assert state["classification_error"] == {1: {}}
+    assert state["content"] == {0: {"full_content": None}}
+
+
+def test_torn_line_is_dropped_and_appending_resumes(tmp_path):
+    journal = RunJournal(tmp_path, TIMESTAMP)
+    journal.record("fetched", seq=0, article={"title": "A"})
+    journal.close()
+    with open(journal.path, "a", encoding="utf-8") as f:
+        f.write('{"stage": "fetched", "seq": 1, "arti')
+
+    resumed = RunJournal(tmp_path, TIMESTAMP)
+    assert list(resumed.replay()["fetched"]) == [0]
+    resumed.record("fetched", seq=1, article={"title": "B"})
+    resumed.close()
+    assert list(RunJournal(tmp_path, TIMESTAMP).replay()["fetched"]) == [0, 1]
+
+
+def test_unfinished_journals_until_discarded(tmp_path):
+    assert RunJournal(tmp_path, TIMESTAMP).replay()["feeds"] is None
+    older = RunJournal(tmp_path, "20241231_235959")
+    older.record("feeds", feed_cache={})
+    newer = RunJournal(tmp_path, TIMESTAMP)
+    newer.record("feeds", feed_cache={})
+    assert [journal_timestamp(path) for path in find_unfinished(tmp_path)] == ["20241231_235959", TIMESTAMP]
+    older.discard()
+    newer.discard()
+    assert find_unfinished(tmp_path) == []
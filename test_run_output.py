@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""Tests for streaming run output and recovery of interrupted runs."""
+
+from run_files import load_run
+from run_output import RunOutput, find_interrupted, interrupted_header
+
+TIMESTAMP = "20250101_120000"
+
+
+def test_finalize_writes_articles_in_feed_order(tmp_path):
+    output = RunOutput(tmp_path, TIMESTAMP, fsync_every=2, compression="gzip")
+    output.append(2, {"id": "c", "topics": ["T"]})
+    output.append(0, {"id": "a", "topics": ["T", "U"]})
+    output.append(1, {"id": "b", "topics": []})
+    assert output.topic_counts == {"T": 2, "U": 1}
+
+    path = output.finalize({"run_timestamp": "t"})
+    output.discard()
+    assert path.name == f"pharma_news_{TIMESTAMP}.json.gz"
+    run = load_run(path)
+    assert [article["id"] for article in run["articles"]] == ["a", "b", "c"]
+    assert run["total_articles_classified"] == 3
+    assert find_interrupted(tmp_path) == []
+
+
+def test_reload_after_crash_drops_torn_line(tmp_path):
+    output = RunOutput(tmp_path, TIMESTAMP)
+    output.append(0, {"id": "a", "topics": ["T"]})
+    output.append(3, {"id": "d", "topics": ["T"]})
+    output.close()
+    with open(output.partial_path, "ab") as f:
+        f.write(b'{"seq": 4, "article": {"id"')
+
+    assert find_interrupted(tmp_path) == [output.partial_path]
+    recovered = RunOutput(tmp_path, TIMESTAMP)
+    assert recovered.stored_seqs() == {0, 3}
+    recovered.append(1, {"id": "b", "topics": []})
+    assert [record["id"] for record in recovered.iter_records()] == ["a", "b", "d"]
+
+    header = interrupted_header(recovered)
+    assert header == {"run_timestamp": "2025-01-01T12:00:00", "interrupted": True, "total_articles_classified": 3}
+    run = load_run(recovered.finalize(header))
+    assert run["interrupted"] is True
+    assert [article["id"] for article in run["articles"]] == ["a", "b", "d"]
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Tests for the per-domain scraping method record."""
+
+import pytest
+
+from scraper_stats import ScraperStats, url_domain
+
+DOMAIN = "example.com"
+METHODS = ["requests", "cloudscraper", "httpx"]
+
+
+def stats(tmp_path, **kwargs):
+    return ScraperStats(tmp_path / "scraper_stats.json", **kwargs)
+
+
+def test_url_domain_drops_www():
+    assert url_domain("https://WWW.Example.com/news/1") == DOMAIN
+
+
+def test_untried_methods_keep_default_order(tmp_path):
+    assert stats(tmp_path).order(DOMAIN, METHODS) == METHODS
+
+
+def test_successful_method_first_and_faster_wins_ties(tmp_path):
+    scraper_stats = stats(tmp_path)
+    scraper_stats.record(DOMAIN, "requests", False, 1.0)
+    scraper_stats.record(DOMAIN, "httpx", True, 1.0)
+    assert scraper_stats.order(DOMAIN, METHODS) == ["httpx", "cloudscraper", "requests"]
+
+    scraper_stats.record(DOMAIN, "cloudscraper", True, 0.2)
+    assert scraper_stats.order(DOMAIN, METHODS) == ["cloudscraper", "httpx", "requests"]
+    assert scraper_stats.typical_latency(DOMAIN, "cloudscraper") == 0.2
+
+
+def test_latency_is_moving_average(tmp_path):
+    scraper_stats = stats(tmp_path)
+    scraper_stats.record(DOMAIN, "requests", True, 1.0)
+    scraper_stats.record(DOMAIN, "requests", True, 2.0)
+    assert scraper_stats.typical_latency(DOMAIN, "requests") == pytest.approx(1.3)
+
+
+def test_persistent_failure_skipped_until_it_decays(tmp_path):
+    scraper_stats = stats(tmp_path, half_life_days=7, skip_after_failures=3)
+    for _ in range(4):
+        scraper_stats.record(DOMAIN, "requests", False, 1.0)
+    assert scraper_stats.order(DOMAIN, METHODS) == ["cloudscraper", "httpx"]
+
+    # One half-life later the failures count half, under the skip threshold
+    scraper_stats.domains[DOMAIN]["requests"]["updated_at"] -= 7 * 86400
+    assert scraper_stats.order(DOMAIN, METHODS) == ["cloudscraper", "httpx", "requests"]
+    assert scraper_stats.domains[DOMAIN]["requests"]["failures"] == pytest.approx(2.0)
+
+
+def test_all_skipped_returns_every_method(tmp_path):
+    scraper_stats = stats(tmp_path)
+    for method in METHODS:
+        for _ in range(3):
+            scraper_stats.record(DOMAIN, method, False, 1.0)
+    assert sorted(scraper_stats.order(DOMAIN, METHODS)) == sorted(METHODS)
+
+
+def test_save_and_load(tmp_path):
+    scraper_stats = stats(tmp_path)
+    scraper_stats.record(DOMAIN, "httpx", True, 0.5)
+    scraper_stats.save()
+    reloaded = stats(tmp_path)
+    reloaded.load()
+    assert reloaded.typical_latency(DOMAIN, "httpx") == 0.5
+    assert not list(tmp_path.glob("*.tmp"))
@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+"""Tests for article scraping and the guards around it."""
+
+URL = "https://www.example.com/news/1"
+
+
+def test_rate_limited_scrapes_do_not_open_circuit(monitor):
+    monitor.http.rate_limiter.defer(URL, 120)
+    for _ in range(3):
+        assert monitor.fetch_article_page(URL) is None
+    assert monitor.circuit_breaker.allow("example.com")
+    assert monitor.circuit_breaker.domains["example.com"]["failure_latency"] is None
+    assert monitor.scraper_stats.domains == {}